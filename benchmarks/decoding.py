@@ -0,0 +1,45 @@
+"""
+Compares parsing the largest recorded responses with the previous decode to str then json.loads against parsing
+the bytes directly with each JSONDecoder. Decoders that aren't installed are skipped.
+
+    python -m benchmarks.decoding
+"""
+import json
+import os
+import timeit
+from betconnect.enums import JSONDecoder
+from betconnect.mockserver import RESPONSES_DIR
+from betconnect.utils import get_json_loads
+
+FIXTURES = os.path.join(RESPONSES_DIR, "betting")
+
+RESPONSES = ["selections_for_market_response.json", "my_bets_response.json"]
+
+
+def main(number: int = 1000, repeat: int = 5) -> None:
+    decoders = {"str + json.loads": lambda b: json.loads(b.decode("utf-8"))}
+    for json_decoder in JSONDecoder:
+        json_loads = get_json_loads(json_decoder)
+        if json_decoder is JSONDecoder.STDLIB or json_loads is not json.loads:
+            decoders[json_decoder.value] = json_loads
+    for filename in RESPONSES:
+        with open(os.path.join(FIXTURES, filename), "rb") as f:
+            content = f.read()
+        print(f"{filename} ({len(content)} bytes)")
+        baseline = None
+        for name, json_loads in decoders.items():
+            elapsed = (
+                min(
+                    timeit.repeat(
+                        lambda: json_loads(content), number=number, repeat=repeat
+                    )
+                )
+                / number
+                * 1e6
+            )
+            baseline = baseline or elapsed
+            print(f"    {name:<20}{elapsed:>10.1f} us{baseline / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
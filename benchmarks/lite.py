@@ -0,0 +1,53 @@
+"""
+Compares construction time and memory of the pydantic resources against the lite resources
+(resource_mode="lite") for the recorded selections_for_market response.
+
+    python -m benchmarks.lite
+"""
+import json
+import os
+import timeit
+import tracemalloc
+from betconnect import resources
+from betconnect.mockserver import RESPONSES_DIR
+
+FIXTURE = os.path.join(RESPONSES_DIR, "betting", "selections_for_market_response.json")
+
+
+def memory(func, copies: int) -> float:
+    """
+    :return: the memory held per copy of the funcs result in KiB
+    """
+    tracemalloc.start()
+    held = [func() for _ in range(copies)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size / copies / 1024
+
+
+def main(number: int = 100, repeat: int = 5, copies: int = 1000) -> None:
+    with open(FIXTURE) as f:
+        data = json.load(f)["data"]
+    print(f"selections_for_market_response.json ({len(data)} selections)")
+    for name, resource in [
+        ("pydantic", resources.SelectionsForMarket),
+        ("lite", resources.LiteSelectionsForMarket),
+    ]:
+        elapsed = (
+            min(
+                timeit.repeat(
+                    lambda: resource.create_list_from_dicts(data),
+                    number=number,
+                    repeat=repeat,
+                )
+            )
+            / number
+            * 1e6
+        )
+        size = memory(lambda: resource.create_list_from_dicts(data), copies)
+        print(f"    {name:<10}{elapsed:>10.1f} us{size:>10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
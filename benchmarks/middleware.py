@@ -0,0 +1,59 @@
+"""
+Measures the per request overhead of the middleware pipeline, timing _send_request with the network send stubbed
+out and 0, 1, 5 and 10 pass through Middleware (the base class hooks) added to the client.
+
+    python -m benchmarks.middleware
+"""
+import timeit
+from requests import Response
+from betconnect.apiclient import APIClient
+from betconnect.endpoints import Betting
+from betconnect.enums import Environment
+from betconnect.middleware import Middleware
+
+
+def build_response() -> Response:
+    response = Response()
+    response.status_code = 200
+    response.url = "https://stgapi.betconnect.com/api/v2/active_sports"
+    response.headers["content-type"] = "application/json"
+    response._content = b'{"data": []}'
+    return response
+
+
+def best(func, number: int, repeat: int) -> float:
+    """
+    :return: the fastest time of a single call in microseconds
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main(number: int = 20000, repeat: int = 5) -> None:
+    client = APIClient(
+        username="user",
+        password="password",
+        api_key="key",
+        environment=Environment.STAGING,
+        personalised_production_url="",
+    )
+    endpoint = Betting(client)
+    response = build_response()
+    endpoint._send = lambda *args, **kwargs: response
+    method_uri = f"{client.api_version}/active_sports"
+
+    baseline = None
+    print(f"{'middleware':<12}{'request us':>12}{'overhead us':>13}")
+    for count in (0, 1, 5, 10):
+        client.middleware = [Middleware() for _ in range(count)]
+        elapsed = best(
+            lambda: endpoint._send_request("GET", method_uri, authenticated=False),
+            number,
+            repeat,
+        )
+        if baseline is None:
+            baseline = elapsed
+        print(f"{count:<12}{elapsed:>12.2f}{elapsed - baseline:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
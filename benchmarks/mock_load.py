@@ -0,0 +1,107 @@
+"""
+Offline load test of the APIClient (threads) and AsyncAPIClient (tasks) against the local mock server, with
+lognormal latency (median 20ms) and 2% injected 503s retried by a RetryPolicy, reporting throughput and the client
+latency percentiles recorded by a MetricsRegistry at increasing concurrency.
+
+    python -m benchmarks.mock_load
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from betconnect.apiclient import APIClient
+from betconnect.asyncapiclient import AsyncAPIClient
+from betconnect.enums import Environment
+from betconnect.metrics import MetricsRegistry
+from betconnect.retry import RetryPolicy
+from betconnect.mockserver import MockServer, lognormal
+
+CLIENT = dict(
+    username="user",
+    password="password",
+    api_key="key",
+    environment=Environment.STAGING,
+    personalised_production_url="",
+)
+
+
+def report(
+    name: str,
+    concurrency: int,
+    requests: int,
+    elapsed: float,
+    metrics: MetricsRegistry,
+) -> None:
+    prices = metrics.snapshot()["prices"]
+    print(
+        f"{name:<8}{concurrency:>6}{requests / elapsed:>10.0f}"
+        f"{prices['latency']['p50'] * 1e3:>9.1f}{prices['latency']['p99'] * 1e3:>9.1f}"
+        f"{prices['retries']:>9}"
+    )
+
+
+def run_sync(server: MockServer, concurrency: int, requests: int) -> None:
+    metrics = MetricsRegistry()
+    client = APIClient(
+        **CLIENT,
+        pool_maxsize=concurrency,
+        retry_policy=RetryPolicy(backoff=0.01),
+        metrics=metrics,
+    )
+    client.uri = server.uri
+    client.warm_up(concurrency)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(
+            executor.map(
+                lambda _: client.betting.prices(
+                    fixture_id=1, market_type_id=6, competitor="1"
+                ),
+                range(requests),
+            )
+        )
+    report("sync", concurrency, requests, time.perf_counter() - start, metrics)
+
+
+async def run_async(server: MockServer, concurrency: int, requests: int) -> None:
+    metrics = MetricsRegistry()
+    client = AsyncAPIClient(
+        **CLIENT,
+        connection_limit_per_host=concurrency,
+        retry_policy=RetryPolicy(backoff=0.01),
+        metrics=metrics,
+    )
+    client.uri = server.uri
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request() -> None:
+        async with semaphore:
+            await client.betting.prices(fixture_id=1, market_type_id=6, competitor="1")
+
+    async with client:
+        await client.warm_up(concurrency)
+        start = time.perf_counter()
+        await asyncio.gather(*(request() for _ in range(requests)))
+        report("async", concurrency, requests, time.perf_counter() - start, metrics)
+
+
+def main(requests: int = 500) -> None:
+    # retries are logged as warnings
+    logging.getLogger("betconnect").setLevel(logging.ERROR)
+    server = MockServer(latency={"*": lognormal(0.02, 0.5)}, seed=1)
+    server.inject("prices", status=503, rate=0.02)
+    server.start()
+    try:
+        print(
+            f"{'client':<8}{'conc':>6}{'req/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'retries':>9}"
+        )
+        for concurrency in (1, 10, 50):
+            run_sync(server, concurrency, requests)
+        for concurrency in (1, 10, 50):
+            asyncio.run(run_async(server, concurrency, requests))
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares the original row by row resource construction (parse_obj per row, and per nested price for Price) against
+the current path, validating list responses in one call (create_list_from_dicts), using the recorded endpoint
+responses packaged with the mock server (betconnect/mockserver/responses).
+
+    python -m benchmarks.parsing
+"""
+import json
+import os
+import timeit
+import warnings
+from betconnect import resources
+from betconnect.mockserver import RESPONSES_DIR
+
+warnings.simplefilter("ignore")
+
+FIXTURES = os.path.join(RESPONSES_DIR, "betting")
+
+CASES = [
+    ("active_fixtures_response.json", resources.ActiveFixture),
+    ("active_selections_response.json", resources.ActiveSelection),
+    ("selections_for_market_response.json", resources.SelectionsForMarket),
+    (
+        "selections_for_market_line_market.json",
+        resources.LineMarketsSelectionsForMarket,
+    ),
+    ("my_bets_response.json", resources.MyBetsBetRequests),
+    ("get_active_bet_requests_response.json", resources.ActiveBetRequests),
+    ("prices_response.json", resources.Price),
+]
+
+
+def original(resource, d: dict):
+    """
+    create_from_dict as released, before the list validators
+    """
+    if resource is resources.Price:
+        return [resource.parse_obj(price) for price in d["prices"]]
+    return resource.parse_obj(d["line"] if "line" in d else d)
+
+
+def best(func, number: int, repeat: int) -> float:
+    """
+    :return: the fastest time of a single call in microseconds
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main(number: int = 100, repeat: int = 5) -> None:
+    print(f"{'response':<42}{'per row us':>12}{'current us':>12}{'x':>7}")
+    for filename, resource in CASES:
+        with open(os.path.join(FIXTURES, filename)) as f:
+            data = json.load(f)["data"]
+        rows = data if isinstance(data, list) else [data]
+        per_row = best(lambda: [original(resource, r) for r in rows], number, repeat)
+        if isinstance(data, list):
+            batched = best(
+                lambda: resource.create_list_from_dicts(data), number, repeat
+            )
+        else:
+            batched = best(lambda: resource.create_from_dict(data), number, repeat)
+        print(
+            f"{filename:<42}{per_row:>12.1f}{batched:>12.1f}{per_row / batched:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Compares the per request logging overhead of the previous eager f-string logging (logger.exception with a traceback
+on every non-200) against the lazy, level checked structured records, with the endpoint logger at WARNING
+(production) and DEBUG, for a 200 and a routine 404 response.
+
+    python -m benchmarks.request_logging
+"""
+import logging
+import os
+import timeit
+from requests import Response
+from betconnect.apiclient import APIClient
+from betconnect.endpoints import Betting
+from betconnect.endpoints.baseendpoint import logger
+from betconnect.enums import Environment
+
+URI = "https://stgapi.betconnect.com/api/v2/prices"
+
+
+def build_response(status_code: int, content: bytes) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.url = URI
+    response.headers["content-type"] = "application/json"
+    response._content = content
+    return response
+
+
+def before(response: Response, response_json: dict, elapsed_time: float) -> None:
+    logger.debug(f"GET request for {URI}")
+    if response.status_code == 200:
+        logger.debug(
+            f"It took {elapsed_time} s to request the data for url {response.url}"
+        )
+    else:
+        logger.exception(
+            f"Issue with request for: {response.url}, message: {response_json.get('message')}"
+        )
+
+
+def after(
+    endpoint: Betting, response: Response, response_json: dict, elapsed_time: float
+) -> None:
+    logger.debug("%s request for %s", "GET", URI)
+    # replaces the "It took" debug record
+    endpoint._log_response("prices", "GET", response, elapsed_time)
+    if response.status_code != 200:
+        endpoint.process_request_exception(
+            response, response_json, endpoint._log_level(response)
+        )
+
+
+def best(func, number: int, repeat: int) -> float:
+    """
+    :return: the fastest time of a single call in microseconds
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main(number: int = 10000, repeat: int = 5) -> None:
+    client = APIClient(
+        username="user",
+        password="password",
+        api_key="key",
+        environment=Environment.STAGING,
+        personalised_production_url="",
+    )
+    endpoint = Betting(client)
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+        )
+        logger.addHandler(handler)
+        logger.propagate = False
+        cases = [
+            ("200", build_response(200, b'{"data": []}'), {"data": []}),
+            (
+                "404",
+                build_response(404, b'{"message": "no bet found"}'),
+                {"message": "no bet found"},
+            ),
+        ]
+        print(f"{'level':<10}{'status':<8}{'before us':>11}{'after us':>10}{'x':>7}")
+        try:
+            for level in (logging.WARNING, logging.DEBUG):
+                logger.setLevel(level)
+                for status, response, response_json in cases:
+                    eager = best(
+                        lambda: before(response, response_json, 0.0123),
+                        number,
+                        repeat,
+                    )
+                    lazy = best(
+                        lambda: after(endpoint, response, response_json, 0.0123),
+                        number,
+                        repeat,
+                    )
+                    print(
+                        f"{logging.getLevelName(level):<10}{status:<8}{eager:>11.2f}"
+                        f"{lazy:>10.2f}{eager / lazy:>6.1f}x"
+                    )
+        finally:
+            logger.removeHandler(handler)
+            logger.propagate = True
+            logger.setLevel(logging.NOTSET)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,9 @@ from .exceptions import (
     BetRequestIDStakeSizeException,
     BetRequestInvalidCustomerOrderRefFormatException,
     BetRequestInvalidCustomerStrategyRefFormatException,
+    PageRequestException,
+    RequestTimeout,
+    CircuitBreakerOpen,
 )
 
 from .enums import (
@@ -22,6 +25,21 @@ from .enums import (
     BetRequestStatus,
     MarketStatus,
     TradingStatus,
+    JSONDecoder,
+    ResourceMode,
+    CircuitState,
 )
 
 from .apiclient import APIClient
+from .asyncapiclient import AsyncAPIClient
+from .crawler import CatalogueCrawler, AsyncCatalogueCrawler
+from .ratelimiter import RateLimiter, TokenBucket
+from .refresher import TokenRefresher, AsyncTokenRefresher
+from .tokenstore import BaseTokenStore, FileTokenStore
+from .timeouts import Timeout, TimeoutProfiles
+from .retry import RetryPolicy
+from .circuitbreaker import CircuitBreaker
+from .hedging import HedgePolicy
+from .metrics import MetricsRegistry
+from .timing import CallTiming, record_timings
+from .middleware import Middleware, RequestContext
@@ -1,8 +1,19 @@
 from .baseclient import BaseClient
+from .ratelimiter import RateLimiter
+from .refresher import TokenRefresher
+from .tokenstore import BaseTokenStore
+from .timeouts import TimeoutProfiles
+from .retry import RetryPolicy
+from .circuitbreaker import CircuitBreaker
+from .hedging import HedgePolicy
+from .metrics import MetricsRegistry
+from .timing import CallTiming
+from .middleware import Middleware
+from .singleflight import SingleFlight
 from requests.sessions import Session
-from betconnect import endpoints
-from betconnect.enums import Environment
-from typing import Optional
+from betconnect import config, endpoints
+from betconnect.enums import Environment, JSONDecoder, ResourceMode
+from typing import Any, Callable, Dict, Iterable, Optional, Union
 
 
 class APIClient(BaseClient):
@@ -14,6 +25,23 @@ class APIClient(BaseClient):
         personalised_production_url: str,
         environment: Environment = Environment.PRODUCTION,
         session: Optional[Session] = None,
+        json_decoder: Union[
+            JSONDecoder, str, Callable[[bytes], Any]
+        ] = JSONDecoder.STDLIB,
+        resource_mode: Union[ResourceMode, str] = ResourceMode.PYDANTIC,
+        rate_limiter: Optional[RateLimiter] = None,
+        token_store: Optional[BaseTokenStore] = None,
+        pool_connections: int = config.POOL_CONNECTIONS,
+        pool_maxsize: int = config.POOL_MAXSIZE,
+        timeouts: Optional[TimeoutProfiles] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        log_levels: Optional[Dict[int, int]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        timing_hook: Optional[Callable[[CallTiming], None]] = None,
+        middleware: Optional[Iterable[Middleware]] = None,
+        tracer: Optional[Any] = None,
     ):
         """
         APIClient is used to make request to the betconnect API
@@ -23,9 +51,36 @@ class APIClient(BaseClient):
         :param personalised_production_url: A production user supplied url. (account manager will supply this)
         :param environment: the environment endpoint you want to send requests to (enum Environment)
         :param session: Session object used in request default None. Session created if None with auth and headers handled.
+        :param json_decoder: JSONDecoder used to parse responses (stdlib, orjson or msgspec) or a function parsing bytes.
+        Falls back to stdlib if not installed.
+        :param resource_mode: ResourceMode (or its value), lite returns slotted LiteResources in place of Price,
+        PricesBookmaker, SelectionsForMarket, LineMarketsSelectionsForMarket and BetRequest.
+        :param rate_limiter: RateLimiter pacing requests per endpoint family, can be shared between clients.
+        :param token_store: BaseTokenStore the session is saved to on login, a valid saved session is reused on init.
+        :param pool_connections: number of host connection pools kept by the created Session
+        :param pool_maxsize: max keep-alive connections per host in the created Session, set to the number of threads
+        making requests
+        :param timeouts: TimeoutProfiles of connect / read timeouts per endpoint, default config.TIMEOUTS profiles
+        :param retry_policy: RetryPolicy retrying requests safe to repeat on connection errors, 429 and 5xx responses.
+        None (default) for no retries.
+        :param circuit_breaker: CircuitBreaker failing requests fast while an endpoint is failing, None (default) for none.
+        :param hedge_policy: HedgePolicy sending a duplicate of slow latency critical reads, first response wins,
+        None (default) for no hedging.
+        :param log_levels: dict of response status class (2 for 2xx etc.) to the level each response is logged at.
+        Defaults to config.LOG_LEVELS
+        :param metrics: MetricsRegistry recording latency histograms, status codes, bytes, decode / parse time,
+        retries and timeouts per endpoint, None (default) for no metrics.
+        :param timing_hook: called with the CallTiming (connect, ttfb, download, decode and parse secs) of each call
+        once its response is processed, see also timing.record_timings
+        :param middleware: Middleware with before_send, after_receive and on_error hooks called around each request
+        attempt, in order. Held in the client middleware list.
+        :param tracer: OpenTelemetry Tracer, e.g. trace.get_tracer("betconnect"), recording a span per call (login and
+        refresh as child spans) and a parse span per processed response, None (default) for no tracing.
         """
         self.betting = endpoints.Betting(self)
         self.account = endpoints.Account(self)
+        self.token_refresher: Optional[TokenRefresher] = None
+        self.auth_flight = SingleFlight()
         super(APIClient, self).__init__(
             username=username,
             password=password,
@@ -33,4 +88,48 @@ class APIClient(BaseClient):
             environment=environment,
             api_key=api_key,
             personalised_production_url=personalised_production_url,
+            json_decoder=json_decoder,
+            resource_mode=resource_mode,
+            rate_limiter=rate_limiter,
+            token_store=token_store,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            timeouts=timeouts,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hedge_policy=hedge_policy,
+            log_levels=log_levels,
+            metrics=metrics,
+            timing_hook=timing_hook,
+            middleware=middleware,
+            tracer=tracer,
         )
+
+    def start_token_refresher(
+        self,
+        lead_time: float = config.TOKEN_REFRESH_LEAD_SECS,
+        retry_interval: float = config.TOKEN_REFRESH_RETRY_SECS,
+    ) -> TokenRefresher:
+        """
+        Starts a daemon thread refreshing the token ahead of next_refresh_time, logging in first if required, so
+        requests never block on a login.
+        :param lead_time: seconds before next_refresh_time the token is refreshed
+        :param retry_interval: seconds to wait before trying again after a failed refresh
+        :return: The running TokenRefresher
+        """
+        if self.token_refresher is None:
+            self.token_refresher = TokenRefresher(
+                self, lead_time=lead_time, retry_interval=retry_interval
+            )
+        self.token_refresher.start()
+        return self.token_refresher
+
+    def stop_token_refresher(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the background token refresher if running
+        :param timeout: seconds to wait for the refresher thread to finish
+        :return: None
+        """
+        if self.token_refresher is not None:
+            self.token_refresher.stop(timeout)
+            self.token_refresher = None
@@ -0,0 +1,256 @@
+import asyncio
+import base64
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+from .baseclient import BaseClient
+from .ratelimiter import RateLimiter
+from .refresher import AsyncTokenRefresher
+from .tokenstore import BaseTokenStore
+from .timeouts import TimeoutProfiles
+from .retry import RetryPolicy
+from .circuitbreaker import CircuitBreaker
+from .hedging import HedgePolicy
+from .metrics import MetricsRegistry
+from .timing import CallTiming
+from .middleware import Middleware
+from .timing import trace_config
+from .compression import async_accept_encoding
+from .singleflight import AsyncSingleFlight
+from betconnect import config, endpoints
+from betconnect.compat import aiohttp
+from betconnect.enums import Environment, JSONDecoder, ResourceMode
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAPIClient(BaseClient):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        api_key: str,
+        personalised_production_url: str,
+        environment: Environment = Environment.PRODUCTION,
+        session: Optional["aiohttp.ClientSession"] = None,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        json_decoder: Union[
+            JSONDecoder, str, Callable[[bytes], Any]
+        ] = JSONDecoder.STDLIB,
+        resource_mode: Union[ResourceMode, str] = ResourceMode.PYDANTIC,
+        rate_limiter: Optional[RateLimiter] = None,
+        token_store: Optional[BaseTokenStore] = None,
+        timeouts: Optional[TimeoutProfiles] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        log_levels: Optional[Dict[int, int]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        timing_hook: Optional[Callable[[CallTiming], None]] = None,
+        middleware: Optional[Iterable[Middleware]] = None,
+        tracer: Optional[Any] = None,
+    ):
+        """
+        AsyncAPIClient is used to make asyncio requests to the betconnect API. Every endpoint function is a coroutine
+        and all requests share a single pooled aiohttp ClientSession.
+        :param username: your betconnect username (string)
+        :param password: your betconnect password (string)
+        :param api_key: your betconnect api key (string)
+        :param personalised_production_url: A production user supplied url. (account manager will supply this)
+        :param environment: the environment endpoint you want to send requests to (enum Environment)
+        :param session: aiohttp ClientSession used in request default None. Session created on first request if None.
+        :param connection_limit: max number of simultaneous connections in the pool when the session is created
+        :param connection_limit_per_host: max number of simultaneous connections to the api host, 0 for no limit
+        :param json_decoder: JSONDecoder used to parse responses (stdlib, orjson or msgspec) or a function parsing bytes.
+        Falls back to stdlib if not installed.
+        :param resource_mode: ResourceMode (or its value), lite returns slotted LiteResources in place of Price,
+        PricesBookmaker, SelectionsForMarket, LineMarketsSelectionsForMarket and BetRequest.
+        :param rate_limiter: RateLimiter pacing requests per endpoint family, can be shared between clients.
+        :param token_store: BaseTokenStore the session is saved to on login, a valid saved session is reused on init.
+        :param timeouts: TimeoutProfiles of connect / read timeouts per endpoint, default config.TIMEOUTS profiles
+        :param retry_policy: RetryPolicy retrying requests safe to repeat on connection errors, 429 and 5xx responses.
+        None (default) for no retries.
+        :param circuit_breaker: CircuitBreaker failing requests fast while an endpoint is failing, None (default) for none.
+        :param hedge_policy: HedgePolicy sending a duplicate of slow latency critical reads, first response wins,
+        None (default) for no hedging.
+        :param log_levels: dict of response status class (2 for 2xx etc.) to the level each response is logged at.
+        Defaults to config.LOG_LEVELS
+        :param metrics: MetricsRegistry recording latency histograms, status codes, bytes, decode / parse time,
+        retries and timeouts per endpoint, None (default) for no metrics.
+        :param timing_hook: called with the CallTiming (connect, ttfb, download, decode and parse secs) of each call
+        once its response is processed, see also timing.record_timings
+        :param middleware: Middleware with before_send, after_receive and on_error hooks called around each request
+        attempt, in order. Held in the client middleware list.
+        :param tracer: OpenTelemetry Tracer, e.g. trace.get_tracer("betconnect"), recording a span per call (login and
+        refresh as child spans) and a parse span per processed response, None (default) for no tracing.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for the AsyncAPIClient, install with 'pip install betconnect[async]'"
+            )
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.token_refresher: Optional[AsyncTokenRefresher] = None
+        self.auth_flight = AsyncSingleFlight()
+        self.betting = endpoints.AsyncBetting(self)
+        self.account = endpoints.AsyncAccount(self)
+        super(AsyncAPIClient, self).__init__(
+            username=username,
+            password=password,
+            session=session,
+            environment=environment,
+            api_key=api_key,
+            personalised_production_url=personalised_production_url,
+            json_decoder=json_decoder,
+            resource_mode=resource_mode,
+            rate_limiter=rate_limiter,
+            token_store=token_store,
+            timeouts=timeouts,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hedge_policy=hedge_policy,
+            log_levels=log_levels,
+            metrics=metrics,
+            timing_hook=timing_hook,
+            middleware=middleware,
+            tracer=tracer,
+        )
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """
+        The pooled aiohttp session, created on first access. Must be accessed from within a running event loop.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.connection_limit,
+                    limit_per_host=self.connection_limit_per_host,
+                ),
+                trace_configs=[trace_config()],
+            )
+        return self._session
+
+    def _update_client_session(
+        self, session: Optional["aiohttp.ClientSession"] = None
+    ) -> None:
+        """
+        Updates the client session with auth details. As an aiohttp ClientSession needs a running event loop the
+        session is created lazily, so auth and headers are held on the client and sent with each request.
+        :param session: an aiohttp ClientSession
+        :return: None
+        """
+        self._session = session
+        # aiohttp.BasicAuth is deprecated from aiohttp 3.14 in favour of aiohttp.encode_basic_auth, which earlier
+        # releases do not have, so the header is encoded here as BasicAuth did (latin1)
+        credentials = base64.b64encode(
+            f"{self._username}:{self._password}".encode("latin1")
+        ).decode("ascii")
+        self.headers: Dict[str, str] = {
+            "Authorization": f"Basic {credentials}",
+            "X-API-KEY": self._api_key,
+            "Accept-Encoding": async_accept_encoding(),
+        }
+        self.login_expiry_check = datetime.utcnow()
+
+        logger.debug(f"Account session updated")
+
+    def _set_auth_header(self, token: str) -> None:
+        self.headers = {**self.headers, "X-AUTH-TOKEN": token}
+
+    def _remove_auth_header(self) -> None:
+        self.headers = {
+            key: value for key, value in self.headers.items() if key != "X-AUTH-TOKEN"
+        }
+
+    async def warm_up(
+        self, n: int = 1, timeout: float = config.WARM_UP_TIMEOUT_SECS
+    ) -> int:
+        """
+        Opens n keep-alive connections to the api, so the first requests after startup (or an idle period where the
+        server closed them) do not pay for the TCP and TLS handshakes.
+        :param n: number of connections to open
+        :param timeout: seconds to wait for each connection
+        :return: number of connections opened
+        """
+        if self.connection_limit:
+            n = min(n, self.connection_limit)
+        if n < 1:
+            return 0
+
+        # each connection is held until all are open, so none is reused by another request
+        waiting = n
+        opening = asyncio.Event()
+
+        async def connect() -> bool:
+            nonlocal waiting
+            response = None
+            try:
+                response = await self.session.head(
+                    self.uri,
+                    headers=self.headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                )
+                return True
+            except Exception as e:
+                logger.warning(f"Unable to open connection to {self.uri}: {e}")
+                return False
+            finally:
+                waiting -= 1
+                if waiting == 0:
+                    opening.set()
+                try:
+                    await asyncio.wait_for(opening.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                if response is not None:
+                    # returns the connection to the pool
+                    response.release()
+
+        opened = sum(await asyncio.gather(*(connect() for _ in range(n))))
+        logger.info(f"Opened {opened}/{n} connections to {self.uri}")
+        return opened
+
+    def start_token_refresher(
+        self,
+        lead_time: float = config.TOKEN_REFRESH_LEAD_SECS,
+        retry_interval: float = config.TOKEN_REFRESH_RETRY_SECS,
+    ) -> AsyncTokenRefresher:
+        """
+        Starts an asyncio task refreshing the token ahead of next_refresh_time, logging in first if required, so
+        requests never block on a login. Must be called from within a running event loop, stopped on close.
+        :param lead_time: seconds before next_refresh_time the token is refreshed
+        :param retry_interval: seconds to wait before trying again after a failed refresh
+        :return: The running AsyncTokenRefresher
+        """
+        if self.token_refresher is None:
+            self.token_refresher = AsyncTokenRefresher(
+                self, lead_time=lead_time, retry_interval=retry_interval
+            )
+        self.token_refresher.start()
+        return self.token_refresher
+
+    async def stop_token_refresher(self) -> None:
+        """
+        Stops the background token refresher if running
+        :return: None
+        """
+        if self.token_refresher is not None:
+            await self.token_refresher.stop()
+            self.token_refresher = None
+
+    async def close(self) -> None:
+        """
+        Stops the token refresher and closes the underlying aiohttp session and its connection pool
+        :return: None
+        """
+        await self.stop_token_refresher()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
@@ -1,10 +1,23 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from requests.sessions import Session
 from datetime import datetime, timedelta
-from .enums import Environment
-from typing import Union, Optional
+from .enums import Environment, JSONDecoder, ResourceMode
+from typing import Any, Callable, Dict, Iterable, List, Union, Optional
 from betconnect import resources
 from betconnect import config
 from betconnect import exceptions
+from betconnect.utils import get_json_loads
+from betconnect.ratelimiter import RateLimiter
+from betconnect.tokenstore import BaseTokenStore
+from betconnect.timeouts import TimeoutProfiles
+from betconnect.retry import RetryPolicy
+from betconnect.circuitbreaker import CircuitBreaker
+from betconnect.hedging import HedgePolicy
+from betconnect.compression import PayloadStats, accept_encoding
+from betconnect.metrics import MetricsRegistry
+from betconnect.timing import CallTiming, TimedHTTPAdapter
+from betconnect.middleware import Middleware
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,6 +32,23 @@ class BaseClient:
         personalised_production_url: str,
         environment: Environment = Environment.PRODUCTION,
         session: Session = None,
+        json_decoder: Union[
+            JSONDecoder, str, Callable[[bytes], Any]
+        ] = JSONDecoder.STDLIB,
+        resource_mode: Union[ResourceMode, str] = ResourceMode.PYDANTIC,
+        rate_limiter: Optional[RateLimiter] = None,
+        token_store: Optional[BaseTokenStore] = None,
+        pool_connections: int = config.POOL_CONNECTIONS,
+        pool_maxsize: int = config.POOL_MAXSIZE,
+        timeouts: Optional[TimeoutProfiles] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        log_levels: Optional[Dict[int, int]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        timing_hook: Optional[Callable[[CallTiming], None]] = None,
+        middleware: Optional[Iterable[Middleware]] = None,
+        tracer: Optional[Any] = None,
     ):
         """
         :param username: your betconnect username (string)
@@ -27,11 +57,51 @@ class BaseClient:
         :param personalised_production_url: A production user supplied url. (account manager will supply this)
         :param environment: the environment endpoint you want to send requests to (enum Environment)
         :param session: Session object used in request default None.Session created if None with auth and headers handled.
+        :param json_decoder: JSONDecoder used to parse responses (stdlib, orjson or msgspec) or a function parsing bytes.
+        Falls back to stdlib if not installed.
+        :param resource_mode: ResourceMode (or its value), lite returns slotted LiteResources in place of Price,
+        PricesBookmaker, SelectionsForMarket, LineMarketsSelectionsForMarket and BetRequest.
+        :param rate_limiter: RateLimiter pacing requests per endpoint family, can be shared between clients.
+        :param token_store: BaseTokenStore the session is saved to on login, a valid saved session is reused on init.
+        :param pool_connections: number of host connection pools kept by the created Session
+        :param pool_maxsize: max keep-alive connections per host in the created Session, set to the number of threads
+        making requests
+        :param timeouts: TimeoutProfiles of connect / read timeouts per endpoint, default config.TIMEOUTS profiles
+        :param retry_policy: RetryPolicy retrying requests safe to repeat on connection errors, 429 and 5xx responses.
+        None (default) for no retries.
+        :param circuit_breaker: CircuitBreaker failing requests fast while an endpoint is failing, None (default) for none.
+        :param hedge_policy: HedgePolicy sending a duplicate of slow latency critical reads, first response wins,
+        None (default) for no hedging.
+        :param log_levels: dict of response status class (2 for 2xx etc.) to the level each response is logged at.
+        Defaults to config.LOG_LEVELS
+        :param metrics: MetricsRegistry recording latency histograms, status codes, bytes, decode / parse time,
+        retries and timeouts per endpoint, None (default) for no metrics.
+        :param timing_hook: called with the CallTiming (connect, ttfb, download, decode and parse secs) of each call
+        once its response is processed, see also timing.record_timings
+        :param middleware: Middleware with before_send, after_receive and on_error hooks called around each request
+        attempt, in order. Held in the client middleware list.
+        :param tracer: OpenTelemetry Tracer, e.g. trace.get_tracer("betconnect"), recording a span per call (login and
+        refresh as child spans) and a parse span per processed response, None (default) for no tracing.
         """
         self._username = username
         self._password = password
         self._api_key = api_key
         self._environment = environment
+        self.json_loads = get_json_loads(json_decoder)
+        self.resource_mode = ResourceMode(resource_mode)
+        self.rate_limiter = rate_limiter
+        self.timeouts = timeouts if timeouts is not None else TimeoutProfiles()
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.hedge_policy = hedge_policy
+        self.payload_stats = PayloadStats()
+        self.log_levels = dict(config.LOG_LEVELS if log_levels is None else log_levels)
+        self.metrics = metrics
+        self.timing_hook = timing_hook
+        self.middleware: List[Middleware] = list(middleware) if middleware else []
+        self.tracer = tracer
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
         self._update_client_session(session)
         self._personalised_production_url = personalised_production_url
         self._set_endpoint_uris(environment)
@@ -46,6 +116,9 @@ class BaseClient:
         self._api_version = config.API_VERSION
         self._page_start_value = config.PAGE_START_VALUE
         self._minimum_limit_value = config.MINIMUM_LIMIT_VALUE
+        self.token_store = token_store
+        if token_store is not None:
+            self.load_session()
 
     @property
     def username(self) -> str:
@@ -112,10 +185,105 @@ class BaseClient:
         if self.account_preferences.gamstop_result == "Y":
             raise exceptions.GamStopException()
         logger.info(f"Account preferences updated")
+        self.save_session()
+
+    @property
+    def session_key(self) -> str:
+        return f"{self._username}@{self.uri}"
+
+    def save_session(self) -> None:
+        """
+        Saves the token, login datetimes and account preferences to the token store, if any
+        :return: None
+        """
+        if self.token_store is None or self._token is None:
+            return
+        session = {
+            "token": self._token,
+            "login_date": _isoformat(self.login_date),
+            "login_expiry_check": _isoformat(self.login_expiry_check),
+            "next_refresh_time": _isoformat(self.next_refresh_time),
+            "account_preferences": self._account_preferences.model_dump(
+                mode="json", by_alias=True
+            )
+            if self._account_preferences
+            else None,
+        }
+        try:
+            self.token_store.save(self.session_key, session)
+        except Exception as e:
+            logger.warning(f"Unable to save session to token store: {e}")
+
+    def load_session(self) -> bool:
+        """
+        Restores the session saved in the token store if it has not expired, skipping the login
+        :return: True if a session was restored
+        """
+        if self.token_store is None:
+            return False
+        try:
+            session = self.token_store.load(self.session_key)
+        except Exception as e:
+            logger.warning(f"Unable to load session from token store: {e}")
+            self._discard_session()
+            return False
+        if not session:
+            return False
+        try:
+            login_expiry_check = datetime.fromisoformat(session["login_expiry_check"])
+            if datetime.utcnow() >= login_expiry_check:
+                logger.debug("Saved session expired")
+                return False
+            if session.get("account_preferences"):
+                self.set_account_preferences(
+                    resources.AccountPreferences.create_from_dict(
+                        session["account_preferences"]
+                    )
+                )
+            token = session["token"]
+            self._token = token
+            self._set_auth_header(token)
+            self.login_date = datetime.fromisoformat(session["login_date"])
+            self.next_refresh_time = datetime.fromisoformat(
+                session["next_refresh_time"]
+            )
+            self.login_expiry_check = login_expiry_check
+        except (KeyError, TypeError, ValueError, exceptions.GamStopException) as e:
+            logger.warning(f"Unable to restore session from token store: {e}")
+            self._discard_session()
+            return False
+        logger.info(f"Account session restored from token store")
+        return True
+
+    def _discard_session(self) -> None:
+        """
+        Resets a partly restored session so the client is logged out, clearing it from the token store
+        :return: None
+        """
+        self._account_preferences = None
+        self.login_date = None
+        self.login_expiry_check = None
+        self.next_refresh_time = None
+        self._token = None
+        self._remove_auth_header()
+        self._clear_stored_session()
+
+    def _clear_stored_session(self) -> None:
+        """
+        Clears the session from the token store, if any, logging rather than raising a store error
+        :return: None
+        """
+        if self.token_store is None:
+            return
+        try:
+            self.token_store.clear(self.session_key)
+        except Exception as e:
+            logger.warning(f"Unable to clear session from token store: {e}")
 
     def _update_client_session(self, session: Union[None, Session] = None) -> None:
         """
-        Updates the client session with auth details
+        Updates the client session with auth details, a created Session is mounted with an adapter sized by
+        pool_connections / pool_maxsize, timing new connections
         :param session: a request Session
         :return: None
         """
@@ -126,11 +294,56 @@ class BaseClient:
         else:
             self.session = Session()
             self.session.auth = (self._username, self._password)
-        self.session.headers.update({"X-API-KEY": self._api_key})
+            adapter = TimedHTTPAdapter(
+                pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {"X-API-KEY": self._api_key, "Accept-Encoding": accept_encoding()}
+        )
         self.login_expiry_check = datetime.utcnow()
 
         logger.debug(f"Account session updated")
 
+    def warm_up(self, n: int = 1, timeout: float = config.WARM_UP_TIMEOUT_SECS) -> int:
+        """
+        Opens n keep-alive connections to the api, so the first requests after startup (or an idle period where the
+        server closed them) do not pay for the TCP and TLS handshakes. Limited to pool_maxsize as the pool discards
+        any extra connections.
+        :param n: number of connections to open
+        :param timeout: seconds to wait for each connection
+        :return: number of connections opened
+        """
+        n = min(n, self.pool_maxsize)
+        if n < 1:
+            return 0
+
+        # each connection is held until all are open, so none is reused by another request
+        opening = threading.Barrier(n)
+
+        def connect(_) -> bool:
+            response = None
+            try:
+                response = self.session.head(self.uri, timeout=timeout, stream=True)
+                return True
+            except Exception as e:
+                logger.warning(f"Unable to open connection to {self.uri}: {e}")
+                return False
+            finally:
+                try:
+                    opening.wait(timeout)
+                except threading.BrokenBarrierError:
+                    pass
+                if response is not None:
+                    # reading the (empty) body returns the connection to the pool
+                    response.content
+
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            opened = sum(executor.map(connect, range(n)))
+        logger.info(f"Opened {opened}/{n} connections to {self.uri}")
+        return opened
+
     def _set_endpoint_uris(self, environment: Environment):
         """
         Sets the uri for which requests are sent to
@@ -150,22 +363,45 @@ class BaseClient:
         else:
             raise exceptions.UnknownBetConnectEnvironment(environment=environment)
 
+    def _set_auth_header(self, token: str) -> None:
+        """
+        Adds the auth token to the headers sent with every request. The headers are replaced rather than updated in
+        place so requests being prepared in other threads see either the old or the new token.
+        :param token: string token value supplied by BetConnect on login / token refresh
+        :return: None
+        """
+        headers = self.session.headers.copy()
+        headers["X-AUTH-TOKEN"] = token
+        self.session.headers = headers
+
+    def _remove_auth_header(self) -> None:
+        """
+        Removes the auth token from the headers sent with every request
+        :return: None
+        """
+        headers = self.session.headers.copy()
+        headers.pop("X-AUTH-TOKEN", None)
+        self.session.headers = headers
+
     def process_login(self, token: str):
         """
         Processes the login, adding the token to the session header and setting login datetimes
         :param token: string token value supplied by BetConnect on login / token refresh
         :return: None
         """
-        self.login_date = datetime.utcnow()
-        self.login_expiry_check = datetime.utcnow() + timedelta(
-            hours=config.LOGIN_FREQUENCY_CHECK_SECS
+        # header swapped before the expiry is extended, requests in flight keep the still valid previous token
+        self._token = token
+        self._set_auth_header(token)
+        now = datetime.utcnow()
+        self.login_date = now
+        self.login_expiry_check = now + timedelta(
+            seconds=config.LOGIN_FREQUENCY_CHECK_SECS
         )
-        self.next_refresh_time = datetime.utcnow() + timedelta(
-            minutes=config.CLIENT_TOKEN_REFRESH_FREQUENCY
+        self.next_refresh_time = now + timedelta(
+            seconds=config.CLIENT_TOKEN_REFRESH_FREQUENCY
         )
-        self._token = token
-        self.session.headers.update({"X-AUTH-TOKEN": token})
         logger.info(f"Account login successful")
+        self.save_session()
 
     def process_logout(self):
         """
@@ -176,9 +412,11 @@ class BaseClient:
         self.login_expiry_check = None
         self.next_refresh_time = None
         self._token = None
-        try:
-            self.session.headers.pop("X-AUTH-TOKEN")
-        except KeyError:
-            pass
+        self._remove_auth_header()
+        self._clear_stored_session()
 
         logger.info(f"Account logout successful")
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
@@ -0,0 +1,154 @@
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from betconnect import config
+from betconnect import resources
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        maxsize: int = config.CACHE_MAX_SIZE,
+    ):
+        """
+        Thread safe, size bounded LRU cache of endpoint responses with a TTL per endpoint.
+        :param ttls: dict of endpoint function name to TTL in seconds, only these endpoints are cached.
+        Defaults to config.CACHE_DEFAULT_TTLS
+        :param maxsize: The maximum number of responses held, the least recently used is evicted first
+        """
+        self.ttls = dict(config.CACHE_DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        return self.ttls.get(endpoint)
+
+    def get(self, key: Tuple[str, Hashable]) -> Tuple[bool, Any]:
+        """
+        Gets the response for the key, counting a hit or miss for the endpoint
+        :param key: tuple of endpoint name and call arguments
+        :return: tuple of bool (hit) and the cached value
+        """
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                self.misses[key[0]] += 1
+                return False, None
+            if time.monotonic() >= expires:
+                del self._data[key]
+                self.misses[key[0]] += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits[key[0]] += 1
+            return True, value
+
+    def set(self, key: Tuple[str, Hashable], value: Any) -> None:
+        """
+        Caches the response for the key for the endpoints TTL
+        :param key: tuple of endpoint name and call arguments
+        :param value: response to be cached
+        :return: None
+        """
+        ttl = self.ttl(key[0])
+        if ttl is None:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, endpoint: str = None) -> None:
+        """
+        Removes cached responses
+        :param endpoint: endpoint function name to invalidate, default None invalidates everything
+        :return: None
+        """
+        with self._lock:
+            if endpoint is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if k[0] == endpoint]:
+                    del self._data[key]
+        logger.debug(f"Response cache invalidated for {endpoint or 'all endpoints'}")
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Hit and miss counts per endpoint
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "hits": self.hits[endpoint],
+                    "misses": self.misses[endpoint],
+                }
+                for endpoint in set(self.hits) | set(self.misses)
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _copy(value: Any) -> Any:
+    # lists are copied so callers can't modify the cached list, the resources are the same objects
+    return list(value) if isinstance(value, list) else value
+
+
+def cached(func: Callable) -> Callable:
+    """
+    Caches the endpoint function response in the endpoints ResponseCache (if enabled) keyed on its arguments.
+    BaseRequestException responses are never cached.
+    """
+    signature = inspect.signature(func)
+    name = func.__name__
+
+    def make_key(args: tuple, kwargs: dict) -> Tuple[str, Hashable]:
+        bound = signature.bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        return name, tuple(bound.arguments.values())[1:]
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = self.cache
+            if cache is None or cache.ttl(name) is None:
+                return await func(self, *args, **kwargs)
+            key = make_key(args, kwargs)
+            hit, value = cache.get(key)
+            if hit:
+                return _copy(value)
+            value = await func(self, *args, **kwargs)
+            if not isinstance(value, resources.BaseRequestException):
+                cache.set(key, _copy(value))
+            return value
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = self.cache
+            if cache is None or cache.ttl(name) is None:
+                return func(self, *args, **kwargs)
+            key = make_key(args, kwargs)
+            hit, value = cache.get(key)
+            if hit:
+                return _copy(value)
+            value = func(self, *args, **kwargs)
+            if not isinstance(value, resources.BaseRequestException):
+                cache.set(key, _copy(value))
+            return value
+
+    return wrapper
@@ -0,0 +1,174 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+from betconnect import config
+from betconnect.enums import CircuitState
+from betconnect.exceptions import CircuitBreakerOpen
+
+logger = logging.getLogger(__name__)
+
+
+class _Circuit:
+    __slots__ = (
+        "state",
+        "failures",
+        "opened_at",
+        "probe_at",
+        "opened",
+        "calls",
+        "failed_calls",
+        "slow_calls",
+        "rejected_calls",
+        "latency",
+    )
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_at: Optional[float] = None
+        self.opened = 0
+        self.calls = 0
+        self.failed_calls = 0
+        self.slow_calls = 0
+        self.rejected_calls = 0
+        self.latency: Optional[float] = None
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = config.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_time: float = config.CIRCUIT_BREAKER_RECOVERY_SECS,
+        slow_call_time: Optional[float] = config.CIRCUIT_BREAKER_SLOW_CALL_SECS,
+        status_codes: Iterable[int] = config.CIRCUIT_BREAKER_STATUS_CODES,
+    ):
+        """
+        Circuit breaker per endpoint. Opens after failure_threshold consecutive failures (connection errors,
+        timeouts, 429 / 5xx responses or calls slower than slow_call_time), failing requests fast with
+        CircuitBreakerOpen. After recovery_time a single probe request is let through (half open), closing the
+        circuit on success or opening it again on failure. Thread and asyncio safe.
+        :param failure_threshold: consecutive failures opening the circuit
+        :param recovery_time: secs the circuit stays open before a probe request is let through
+        :param slow_call_time: secs after which a successful call counts as a failure, None to ignore latency
+        :param status_codes: response status codes counted as failures
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.slow_call_time = slow_call_time
+        self.status_codes = frozenset(status_codes)
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def check(self, endpoint: str) -> None:
+        """
+        Raises CircuitBreakerOpen if the endpoint circuit is open, moving it to half open once recovery_time has
+        passed and letting this call through as the probe
+        :param endpoint: endpoint name, e.g. selections_for_market
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state is CircuitState.CLOSED:
+                return
+            now = time.monotonic()
+            if circuit.state is CircuitState.OPEN:
+                if now - circuit.opened_at >= self.recovery_time:
+                    self._set_state(endpoint, circuit, CircuitState.HALF_OPEN)
+                    circuit.probe_at = now
+                    return
+                retry_in = self.recovery_time - (now - circuit.opened_at)
+            elif now - circuit.probe_at >= self.recovery_time:
+                # the probe never recorded a result (cancelled), let another through
+                circuit.probe_at = now
+                return
+            else:
+                retry_in = self.recovery_time - (now - circuit.probe_at)
+            circuit.rejected_calls += 1
+        raise CircuitBreakerOpen(endpoint, retry_in)
+
+    def record(self, endpoint: str, elapsed_time: float, failed: bool) -> None:
+        """
+        Records the result of a call
+        :param endpoint: endpoint name
+        :param elapsed_time: call duration secs
+        :param failed: True if the call failed
+        """
+        slow = self.slow_call_time is not None and elapsed_time > self.slow_call_time
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            circuit.calls += 1
+            circuit.latency = (
+                elapsed_time
+                if circuit.latency is None
+                else circuit.latency * 0.8 + elapsed_time * 0.2
+            )
+            if slow:
+                circuit.slow_calls += 1
+            if failed:
+                circuit.failed_calls += 1
+            if failed or slow:
+                circuit.failures += 1
+                if (
+                    circuit.state is CircuitState.HALF_OPEN
+                    or circuit.failures >= self.failure_threshold
+                ) and circuit.state is not CircuitState.OPEN:
+                    circuit.opened_at = time.monotonic()
+                    circuit.opened += 1
+                    self._set_state(endpoint, circuit, CircuitState.OPEN)
+            else:
+                circuit.failures = 0
+                if circuit.state is not CircuitState.CLOSED:
+                    self._set_state(endpoint, circuit, CircuitState.CLOSED)
+
+    def state(self, endpoint: str) -> CircuitState:
+        with self._lock:
+            return self._circuit(endpoint).state
+
+    def reset(self, endpoint: str = None) -> None:
+        """
+        Closes the endpoint circuit, or all circuits if None
+        """
+        with self._lock:
+            if endpoint is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(endpoint, None)
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        State, consecutive failures, times opened, call counts and average latency (secs) per endpoint
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "state": circuit.state.value,
+                    "failures": circuit.failures,
+                    "opened": circuit.opened,
+                    "calls": circuit.calls,
+                    "failed_calls": circuit.failed_calls,
+                    "slow_calls": circuit.slow_calls,
+                    "rejected_calls": circuit.rejected_calls,
+                    "latency": circuit.latency,
+                }
+                for endpoint, circuit in self._circuits.items()
+            }
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = self._circuits[endpoint] = _Circuit()
+        return circuit
+
+    @staticmethod
+    def _set_state(endpoint: str, circuit: _Circuit, state: CircuitState) -> None:
+        if state is CircuitState.OPEN:
+            logger.warning(
+                f"Circuit for {endpoint} opened after {circuit.failures} consecutive failures"
+            )
+        else:
+            logger.info(
+                f"Circuit for {endpoint} {circuit.state.value} -> {state.value}"
+            )
+        circuit.state = state
@@ -0,0 +1,79 @@
+import threading
+from collections import defaultdict
+from typing import Any, Dict
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING
+
+
+def accept_encoding() -> str:
+    """
+    The Accept-Encoding header for the APIClient, the encodings urllib3 can decode. br and zstd are included when
+    brotli / zstandard are installed (pip install betconnect[compression])
+    """
+    return ", ".join(URLLIB3_ACCEPT_ENCODING.split(","))
+
+
+def async_accept_encoding() -> str:
+    """
+    The Accept-Encoding header for the AsyncAPIClient, the encodings aiohttp can decode
+    """
+    from aiohttp import compression_utils
+
+    encodings = ["gzip", "deflate"]
+    if getattr(compression_utils, "HAS_BROTLI", False):
+        encodings.append("br")
+    if getattr(compression_utils, "HAS_ZSTD", False):
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+class PayloadStats:
+    """
+    Response payload sizes per endpoint, bytes received (compressed) and bytes decoded, with a count of the
+    Content-Encoding used so negotiation can be verified.
+    """
+
+    def __init__(self):
+        self.responses: Dict[str, int] = defaultdict(int)
+        self.compressed_bytes: Dict[str, int] = defaultdict(int)
+        self.uncompressed_bytes: Dict[str, int] = defaultdict(int)
+        self.encodings: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self._lock = threading.Lock()
+
+    def record(
+        self, endpoint: str, encoding: str, compressed: int, uncompressed: int
+    ) -> None:
+        """
+        :param endpoint: endpoint name
+        :param encoding: response Content-Encoding, identity if not encoded
+        :param compressed: bytes received
+        :param uncompressed: bytes after decoding
+        """
+        with self._lock:
+            self.responses[endpoint] += 1
+            self.compressed_bytes[endpoint] += compressed
+            self.uncompressed_bytes[endpoint] += uncompressed
+            self.encodings[endpoint][encoding] += 1
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Responses, compressed / uncompressed bytes, ratio (compressed / uncompressed) and encodings per endpoint
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "responses": self.responses[endpoint],
+                    "compressed_bytes": self.compressed_bytes[endpoint],
+                    "uncompressed_bytes": self.uncompressed_bytes[endpoint],
+                    "ratio": (
+                        self.compressed_bytes[endpoint]
+                        / self.uncompressed_bytes[endpoint]
+                        if self.uncompressed_bytes[endpoint]
+                        else 1.0
+                    ),
+                    "encodings": dict(self.encodings[endpoint]),
+                }
+                for endpoint in self.responses
+            }
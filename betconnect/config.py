@@ -1,8 +1,12 @@
+import logging
+
 DEFAULT_STAGING_URL = "https://stgapi.betconnect.com/"
 API_VERSION = "api/v2"
 DEVELOPER_DOCS = "https://developer.betconnect.com/"
 PAGE_START_VALUE = 1
 MINIMUM_LIMIT_VALUE = 10
+ITER_PAGE_LIMIT_VALUE = 100
+EXPORT_MAX_WORKERS = 4
 
 # TODO move these
 MIN_CUSTOMER_STRATEGY_REF_LENGTH = 1
@@ -10,7 +14,116 @@ MAX_CUSTOMER_STRATEGY_REF_LENGTH = 15
 MIN_CUSTOMER_ORDER_REF_LENGTH = 1
 MAX_CUSTOMER_ORDER_REF_LENGTH = 36
 CLIENT_READOUT_TIME_SECS = 120
+CLIENT_CONNECT_TIME_SECS = 5
 LOGIN_FREQUENCY_CHECK_SECS = 60 * 120
 CLIENT_TOKEN_REFRESH_FREQUENCY = 60 * 15
+TOKEN_REFRESH_LEAD_SECS = 60
+TOKEN_REFRESH_RETRY_SECS = 5
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+WARM_UP_TIMEOUT_SECS = 10
 BET_REQUEST_MIN_ODDS = 1.01
 SITE_MINIMUM_STAKE_SIZE = 1
+
+# Response cache, TTL (secs) of the slow changing reference data endpoints
+CACHE_DEFAULT_TTLS = {
+    "active_bookmakers": 60 * 5,
+    "active_sports": 60 * 5,
+    "active_regions": 60 * 5,
+    "active_market_types": 60 * 5,
+    "active_competitions": 60 * 5,
+}
+CACHE_MAX_SIZE = 1024
+
+# Rate limiter, tuple of (requests per second, burst) per endpoint family and over all families
+RATE_LIMITS = {
+    "reference": (5, 10),
+    "pricing": (10, 20),
+    "bet_request_get": (5, 5),
+    "bets": (2, 5),
+    "orders": (10, 10),
+}
+RATE_LIMIT_GLOBAL = (20, 20)
+RATE_LIMIT_FAMILIES = {
+    "active_bookmakers": "reference",
+    "active_sports": "reference",
+    "active_regions": "reference",
+    "active_competitions": "reference",
+    "active_fixtures": "reference",
+    "active_market_types": "reference",
+    "active_markets": "reference",
+    "active_selections": "reference",
+    "selections_for_market": "pricing",
+    "prices": "pricing",
+    "bet_request_get": "bet_request_get",
+    "get_viewed_next_prev": "bet_request_get",
+    "get_active_bet_requests": "bets",
+    "bet_history": "bets",
+    "my_bets": "bets",
+    "bet_request_create": "orders",
+    "bet_request_match": "orders",
+    "bet_request_match_more": "orders",
+    "bet_request_stop": "orders",
+    "lock_bet": "orders",
+}
+RATE_LIMIT_PRIORITY_ENDPOINTS = (
+    "bet_request_create",
+    "bet_request_match",
+    "bet_request_match_more",
+    "bet_request_stop",
+)
+
+# Timeouts, tuple of (connect, read) secs per profile, endpoints without a profile use TIMEOUT_DEFAULT
+TIMEOUT_DEFAULT = (CLIENT_CONNECT_TIME_SECS, CLIENT_READOUT_TIME_SECS)
+TIMEOUTS = {
+    "pricing": (3, 5),
+    "orders": (2, 5),
+    "history": (5, 300),
+}
+TIMEOUT_PROFILES = {
+    "selections_for_market": "pricing",
+    "prices": "pricing",
+    "bet_request_create": "orders",
+    "bet_request_match": "orders",
+    "bet_request_match_more": "orders",
+    "bet_request_stop": "orders",
+    "lock_bet": "orders",
+    "bet_history": "history",
+    "my_bets": "history",
+}
+
+# Retries, see RetryPolicy
+RETRY_MAX_RETRIES = 3
+RETRY_BACKOFF_SECS = 0.1
+RETRY_MAX_BACKOFF_SECS = 2
+RETRY_MAX_RETRY_AFTER_SECS = 10
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_READ_ENDPOINTS = ("bet_request_get",)
+
+# Circuit breaker, see CircuitBreaker
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_RECOVERY_SECS = 30
+CIRCUIT_BREAKER_SLOW_CALL_SECS = 10
+CIRCUIT_BREAKER_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Hedged reads, see HedgePolicy
+HEDGE_ENDPOINTS = ("bet_request_get", "selections_for_market")
+HEDGE_PERCENTILE = 95
+HEDGE_INITIAL_DELAY_SECS = 1
+HEDGE_MIN_DELAY_SECS = 0.05
+HEDGE_BUDGET = 0.05
+HEDGE_LATENCY_WINDOW = 200
+HEDGE_MIN_SAMPLES = 20
+# a request, its hedge and a straggler from the callers previous hedged request
+HEDGE_WORKERS_PER_CALLER = 3
+
+# Request log level per response status class (2 for 2xx etc.), see BaseEndpoint._log_response
+LOG_LEVELS = {
+    2: logging.DEBUG,
+    3: logging.DEBUG,
+    4: logging.INFO,
+    5: logging.WARNING,
+}
+
+# Metrics, see MetricsRegistry
+METRICS_PERCENTILES = (50, 90, 99, 99.9)
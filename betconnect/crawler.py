@@ -0,0 +1,322 @@
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Tuple, Union
+from betconnect import resources
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from betconnect.apiclient import APIClient
+    from betconnect.asyncapiclient import AsyncAPIClient
+
+
+class BaseCatalogueCrawler:
+    def __init__(
+        self,
+        client: Union[APIClient, AsyncAPIClient],
+        max_workers: int = 10,
+        sport_ids: Optional[Iterable[int]] = None,
+        include_selections: bool = True,
+        top_price_only: bool = False,
+    ):
+        """
+        Walks the sport -> region -> competition -> fixture -> market -> selection tree with bounded concurrency,
+        returning a single immutable CatalogueSnapshot.
+        :param client: The client used to make the requests
+        :param max_workers: The maximum number of requests in flight at once
+        :param sport_ids: Only crawl these sport ids, default None crawls all active sports
+        :param include_selections: Whether to request selections_for_market for every market found
+        :param top_price_only: Passed to selections_for_market, only return the top price for each selection
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.sport_ids = set(sport_ids) if sport_ids is not None else None
+        self.include_selections = include_selections
+        self.top_price_only = top_price_only
+        self._request_count = 0
+
+    def _include_sport(self, sport: resources.ActiveSport) -> bool:
+        return self.sport_ids is None or sport.sport_id in self.sport_ids
+
+    @staticmethod
+    def _as_list(result, func: Callable) -> list:
+        """
+        Endpoints return a BaseRequestException when BetConnect detects an issue, these branches are skipped
+        """
+        if isinstance(result, list):
+            return result
+        logger.warning(
+            f"Skipping {getattr(func, '__name__', func)} in catalogue crawl, request returned {result}"
+        )
+        return []
+
+    def _create_snapshot(
+        self,
+        created: datetime,
+        time_started: float,
+        sports: List[resources.CatalogueSport],
+    ) -> resources.CatalogueSnapshot:
+        snapshot = resources.CatalogueSnapshot(
+            created=created,
+            elapsed_time=time.time() - time_started,
+            request_count=self._request_count,
+            sports=tuple(sports),
+        )
+        logger.info(
+            f"Catalogue crawl took {snapshot.elapsed_time} s for {snapshot.request_count} requests"
+        )
+        return snapshot
+
+
+class CatalogueCrawler(BaseCatalogueCrawler):
+    """
+    Crawls the catalogue with an APIClient, requesting each level of the tree concurrently in a thread pool so
+    the wall time is proportional to the depth of the tree rather than the number of nodes.
+    """
+
+    def crawl(self) -> resources.CatalogueSnapshot:
+        """
+        Crawls the catalogue
+        :return: CatalogueSnapshot
+        """
+        created = datetime.utcnow()
+        time_started = time.time()
+        self._request_count = 0
+        betting = self.client.betting
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            sports = [
+                s
+                for s in self._map(executor, [(betting.active_sports,)])[0]
+                if self._include_sport(s)
+            ]
+            sport_results = self._map(
+                executor,
+                [(betting.active_regions, s.sport_id) for s in sports]
+                + [(betting.active_market_types, s.sport_id) for s in sports],
+            )
+            regions, market_types = (
+                sport_results[: len(sports)],
+                sport_results[len(sports) :],
+            )
+
+            region_nodes = [
+                (sport, region)
+                for sport, sport_regions in zip(sports, regions)
+                for region in sport_regions
+            ]
+            competitions = self._map(
+                executor,
+                [
+                    (betting.active_competitions, s.sport_id, r.region_id)
+                    for s, r in region_nodes
+                ],
+            )
+
+            competition_nodes = [
+                (sport, region, competition)
+                for (sport, region), region_competitions in zip(
+                    region_nodes, competitions
+                )
+                for competition in region_competitions
+            ]
+            fixtures = self._map(
+                executor,
+                [
+                    (
+                        betting.active_fixtures,
+                        s.sport_id,
+                        r.region_id,
+                        c.competition_id,
+                    )
+                    for s, r, c in competition_nodes
+                ],
+            )
+
+            fixture_nodes = [
+                f for competition_fixtures in fixtures for f in competition_fixtures
+            ]
+            markets = self._map(
+                executor,
+                [(betting.active_markets, f.fixture_id) for f in fixture_nodes],
+            )
+
+            market_nodes = [
+                (fixture, market)
+                for fixture, fixture_markets in zip(fixture_nodes, markets)
+                for market in fixture_markets
+            ]
+            if self.include_selections:
+                selections = self._map(
+                    executor,
+                    [
+                        (
+                            betting.selections_for_market,
+                            f.fixture_id,
+                            m.market_type_id,
+                            self.top_price_only,
+                        )
+                        for f, m in market_nodes
+                    ],
+                )
+            else:
+                selections = [[] for _ in market_nodes]
+
+        # assemble the tree bottom up, each level is in the same order as its parents
+        catalogue_markets = iter(
+            resources.CatalogueMarket(market=m, selections=tuple(s))
+            for (f, m), s in zip(market_nodes, selections)
+        )
+        catalogue_fixtures = iter(
+            resources.CatalogueFixture(
+                fixture=f, markets=tuple(islice(catalogue_markets, len(ms)))
+            )
+            for f, ms in zip(fixture_nodes, markets)
+        )
+        catalogue_competitions = iter(
+            resources.CatalogueCompetition(
+                competition=c, fixtures=tuple(islice(catalogue_fixtures, len(fs)))
+            )
+            for (s, r, c), fs in zip(competition_nodes, fixtures)
+        )
+        catalogue_regions = iter(
+            resources.CatalogueRegion(
+                region=r, competitions=tuple(islice(catalogue_competitions, len(cs)))
+            )
+            for (s, r), cs in zip(region_nodes, competitions)
+        )
+        catalogue_sports = [
+            resources.CatalogueSport(
+                sport=s,
+                market_types=tuple(mts),
+                regions=tuple(islice(catalogue_regions, len(rs))),
+            )
+            for s, rs, mts in zip(sports, regions, market_types)
+        ]
+        return self._create_snapshot(created, time_started, catalogue_sports)
+
+    def _map(
+        self, executor: ThreadPoolExecutor, calls: List[Tuple[Callable, ...]]
+    ) -> List[list]:
+        """
+        Makes each call in the executor, returning the results in the same order as the calls
+        :param executor: The thread pool
+        :param calls: list of tuples (endpoint function, *args)
+        :return: list of resource lists
+        """
+        self._request_count += len(calls)
+        futures = [executor.submit(call[0], *call[1:]) for call in calls]
+        return [
+            self._as_list(future.result(), call[0])
+            for call, future in zip(calls, futures)
+        ]
+
+
+class AsyncCatalogueCrawler(BaseCatalogueCrawler):
+    """
+    Crawls the catalogue with an AsyncAPIClient, each branch is requested as soon as its parent returns with the
+    number of requests in flight bounded by max_workers.
+    """
+
+    async def crawl(self) -> resources.CatalogueSnapshot:
+        """
+        Crawls the catalogue
+        :return: CatalogueSnapshot
+        """
+        created = datetime.utcnow()
+        time_started = time.time()
+        self._request_count = 0
+        self._semaphore = asyncio.Semaphore(self.max_workers)
+
+        sports = await self._fetch(self.client.betting.active_sports)
+        catalogue_sports = await asyncio.gather(
+            *[self._crawl_sport(s) for s in sports if self._include_sport(s)]
+        )
+        return self._create_snapshot(created, time_started, catalogue_sports)
+
+    async def _fetch(self, func: Callable, *args) -> list:
+        async with self._semaphore:
+            self._request_count += 1
+            result = await func(*args)
+        return self._as_list(result, func)
+
+    async def _crawl_sport(
+        self, sport: resources.ActiveSport
+    ) -> resources.CatalogueSport:
+        betting = self.client.betting
+        regions, market_types = await asyncio.gather(
+            self._fetch(betting.active_regions, sport.sport_id),
+            self._fetch(betting.active_market_types, sport.sport_id),
+        )
+        catalogue_regions = await asyncio.gather(
+            *[self._crawl_region(sport, r) for r in regions]
+        )
+        return resources.CatalogueSport(
+            sport=sport,
+            market_types=tuple(market_types),
+            regions=tuple(catalogue_regions),
+        )
+
+    async def _crawl_region(
+        self, sport: resources.ActiveSport, region: resources.ActiveRegion
+    ) -> resources.CatalogueRegion:
+        competitions = await self._fetch(
+            self.client.betting.active_competitions, sport.sport_id, region.region_id
+        )
+        catalogue_competitions = await asyncio.gather(
+            *[self._crawl_competition(sport, region, c) for c in competitions]
+        )
+        return resources.CatalogueRegion(
+            region=region, competitions=tuple(catalogue_competitions)
+        )
+
+    async def _crawl_competition(
+        self,
+        sport: resources.ActiveSport,
+        region: resources.ActiveRegion,
+        competition: resources.ActiveCompetition,
+    ) -> resources.CatalogueCompetition:
+        fixtures = await self._fetch(
+            self.client.betting.active_fixtures,
+            sport.sport_id,
+            region.region_id,
+            competition.competition_id,
+        )
+        catalogue_fixtures = await asyncio.gather(
+            *[self._crawl_fixture(f) for f in fixtures]
+        )
+        return resources.CatalogueCompetition(
+            competition=competition, fixtures=tuple(catalogue_fixtures)
+        )
+
+    async def _crawl_fixture(
+        self, fixture: resources.ActiveFixture
+    ) -> resources.CatalogueFixture:
+        markets = await self._fetch(
+            self.client.betting.active_markets, fixture.fixture_id
+        )
+        catalogue_markets = await asyncio.gather(
+            *[self._crawl_market(fixture, m) for m in markets]
+        )
+        return resources.CatalogueFixture(
+            fixture=fixture, markets=tuple(catalogue_markets)
+        )
+
+    async def _crawl_market(
+        self, fixture: resources.ActiveFixture, market: resources.ActiveMarket
+    ) -> resources.CatalogueMarket:
+        if self.include_selections:
+            selections = await self._fetch(
+                self.client.betting.selections_for_market,
+                fixture.fixture_id,
+                market.market_type_id,
+                self.top_price_only,
+            )
+        else:
+            selections = []
+        return resources.CatalogueMarket(market=market, selections=tuple(selections))
@@ -1,2 +1,4 @@
 from .betting import Betting
 from .account import Account
+from .asyncbetting import AsyncBetting
+from .asyncaccount import AsyncAccount
@@ -4,7 +4,8 @@ from typing import Union, Tuple, Optional
 import requests
 from betconnect import exceptions
 from betconnect import resources
-from .baseendpoint import BaseEndpoint
+from betconnect import tracing
+from .baseendpoint import BaseEndpoint, Call
 
 logger = logging.getLogger(__name__)
 
@@ -17,17 +18,22 @@ class Account(BaseEndpoint):
         Retrieves user preferences for the current account
         :return: A AccountPreferences resource or an BaseRequestException when BetConnect detects an issue.
         """
-
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/get_user_preferences", authenticated=True
+        return self._set_user_preferences(self._call(self._get_user_preferences_call()))
+
+    def _get_user_preferences_call(self) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/get_user_preferences",
+            resources.AccountPreferences,
+            authenticated=True,
         )
 
-        account_preferences = self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.AccountPreferences,
-            elapsed_time=elapsed_time,
-        )
+    def _set_user_preferences(
+        self,
+        account_preferences: Union[
+            resources.AccountPreferences, resources.BaseRequestException
+        ],
+    ) -> Union[resources.AccountPreferences, resources.BaseRequestException]:
         if isinstance(account_preferences, resources.AccountPreferences):
             self.client.set_account_preferences(account_preferences=account_preferences)
         elif isinstance(account_preferences, resources.BaseRequestException):
@@ -41,17 +47,19 @@ class Account(BaseEndpoint):
         Gets the account balance
         :return: A Balance resource or an BaseRequestException when BetConnect detects an issue.
         """
-
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/get_balance", authenticated=True
+        return self._set_balance(self._call(self._get_balance_call()))
+
+    def _get_balance_call(self) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/get_balance",
+            resources.Balance,
+            authenticated=True,
         )
 
-        balance = self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.Balance,
-            elapsed_time=elapsed_time,
-        )
+    def _set_balance(
+        self, balance: Union[resources.Balance, resources.BaseRequestException]
+    ) -> Union[resources.Balance, resources.BaseRequestException]:
         if isinstance(balance, resources.Balance):
             self.client.set_account_balance(account_balance=balance)
         elif isinstance(balance, resources.BaseRequestException):
@@ -60,54 +68,45 @@ class Account(BaseEndpoint):
             )
         return balance
 
-    def login(self) -> resources.Login:
+    def login(self, if_required: bool = False) -> Optional[resources.Login]:
         """
-        Logs the user in with the username and password supplied to the client
-        :return: Login resource
+        Logs the user in with the username and password supplied to the client. Concurrent calls share a single login.
+        :param if_required: only log in if the client is still logged out once the shared login starts, so a caller
+        that found the token expired while another login was completing does not log in again
+        :return: Login resource, None if not required
         """
+        return self.client.auth_flight.do("login", self._login, if_required)
+
+    def _login(self, if_required: bool = False) -> Optional[resources.Login]:
+        if if_required and self.client.logged_in:
+            return None
 
         (response, response_json, elapsed_time) = self._post(
             method_uri=f"{self.api_version}/login"
         )
+        login_resource = self._process_login(response_json)
+
+        if self.client.account_preferences is None:
+            # try and get account preferences as well
+            self._set_user_preferences(self.get_user_preferences())
+
+        if self.client.account_balance is None:
+            self._set_balance(self.get_balance())
 
+        return login_resource
+
+    def _process_login(self, response_json: dict) -> resources.Login:
+        """
+        Sets the token from a login response on the client
+        :param response_json: the json data from the response
+        :return: Login resource
+        """
         data = response_json.get("data")
 
         if data:
             if "token" in data:
                 self.client.process_login(data["token"])
-                login_resource = resources.Login(**response_json)
-
-                if self.client.account_preferences is None:
-                    # try and get account preferences as well
-                    account_preferences: Union[
-                        resources.AccountPreferences, resources.BaseRequestException
-                    ] = self.get_user_preferences()
-
-                    if isinstance(account_preferences, resources.AccountPreferences):
-                        self.client.set_account_preferences(
-                            account_preferences=account_preferences
-                        )
-                    elif isinstance(
-                        account_preferences, resources.BaseRequestException
-                    ):
-                        logger.warning(
-                            f"Issue trying to update the account balance. Request message: {account_preferences.message}"
-                        )
-
-                if self.client.account_balance is None:
-                    balance: Union[
-                        resources.Balance, resources.BaseRequestException
-                    ] = self.get_balance()
-
-                    if isinstance(balance, resources.Balance):
-                        self.client.set_account_balance(account_balance=balance)
-                    elif isinstance(balance, resources.BaseRequestException):
-                        logger.warning(
-                            f"Issue trying to update the account balance. Request message: {balance.message}"
-                        )
-
-                return login_resource
-
+                return resources.Login(**response_json)
             else:
                 raise exceptions.LoginMissingTokenInResponse()
         else:
@@ -122,7 +121,9 @@ class Account(BaseEndpoint):
         (response, response_json, elapsed_time) = self._post(
             method_uri=f"{self.api_version}/logout"
         )
+        self._process_logout(response)
 
+    def _process_logout(self, response: requests.Response) -> None:
         if response.status_code == 200:
             self.client.process_logout()
         else:
@@ -132,14 +133,26 @@ class Account(BaseEndpoint):
 
     def refresh_session_token(self) -> Optional[resources.Login]:
         """
-        Provides a refresh token for authentication
+        Provides a refresh token for authentication. Concurrent calls share a single refresh.
         :return: returns Login resource
         """
+        return self.client.auth_flight.do(
+            "refresh_session_token", self._refresh_session_token
+        )
+
+    def _refresh_session_token(self) -> Optional[resources.Login]:
 
         (response, response_json, elapsed_time) = self._post(
             method_uri=f"{self.api_version}/status"
         )
+        return self._process_refresh(response_json)
 
+    def _process_refresh(self, response_json: dict) -> Optional[resources.Login]:
+        """
+        Sets the refreshed token from a status response on the client
+        :param response_json: the json data from the response
+        :return: Login resource, None if no refresh token was supplied
+        """
         data = response_json.get("data")
 
         if data:
@@ -167,21 +180,37 @@ class Account(BaseEndpoint):
         params = params if params else {}
 
         uri = self.client.uri + method_uri
-        time_sent = time.time()
+        timeout = self.client.timeouts.get(self._endpoint_name(method_uri))
 
-        try:
-            logger.debug(f"requesting the data for {uri}")
+        with tracing.client_span(
+            self.client.tracer, "POST", self.api_version, method_uri
+        ) as span:
+            time_sent = time.time()
 
-            response = self.session.post(uri, timeout=self._read_timeout)
+            try:
+                logger.debug("requesting the data for %s", uri)
 
-        except requests.ConnectionError as e:
-            raise exceptions.APIError(None, uri, params, e)
-        except Exception as e:
-            raise exceptions.APIError(None, uri, params, e)
+                response = self.session.post(uri, timeout=timeout)
 
-        elapsed_time = time.time() - time_sent
+            except Exception as e:
+                raise self._api_error(e, uri, params, timeout)
 
-        response_json = self.load_json_content(response)
+            elapsed_time = time.time() - time_sent
+            if span is not None:
+                tracing.record_response(span, response)
+
+        return self._process_post(response, elapsed_time)
+
+    def _process_post(
+        self, response: requests.Response, elapsed_time: float
+    ) -> Tuple[requests.Response, dict, float]:
+        """
+        Loads the json of a login, logout or status response
+        :param response: the request response
+        :param elapsed_time: secs taken by the request
+        :return: tuple of the Response, dict (json_dict), float (elapsed time)
+        """
+        response_json = self.load_json_content(response, self.client.json_loads)
 
         if self.check_status_code(response) is False:
             raise exceptions.UnexpectedResponseStatusCode(
@@ -0,0 +1,111 @@
+import logging
+import time
+from typing import Union, Tuple, Optional
+from betconnect import resources
+from betconnect import tracing
+from .account import Account
+from .asyncbaseendpoint import AsyncBaseEndpoint, AsyncResponse
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAccount(AsyncBaseEndpoint, Account):
+    """
+    asyncio version of the Account endpoint, every request function is a coroutine. Requests are built and responses
+    processed by Account, see Account for each function.
+    """
+
+    async def get_user_preferences(
+        self,
+    ) -> Union[resources.AccountPreferences, resources.BaseRequestException]:
+        """
+        See Account.get_user_preferences
+        """
+        return self._set_user_preferences(
+            await self._call(self._get_user_preferences_call())
+        )
+
+    async def get_balance(
+        self,
+    ) -> Union[resources.Balance, resources.BaseRequestException]:
+        """
+        See Account.get_balance
+        """
+        return self._set_balance(await self._call(self._get_balance_call()))
+
+    async def login(self, if_required: bool = False) -> Optional[resources.Login]:
+        """
+        See Account.login
+        """
+        return await self.client.auth_flight.do("login", self._login, if_required)
+
+    async def _login(self, if_required: bool = False) -> Optional[resources.Login]:
+        if if_required and self.client.logged_in:
+            return None
+
+        (response, response_json, elapsed_time) = await self._post(
+            method_uri=f"{self.api_version}/login"
+        )
+        login_resource = self._process_login(response_json)
+
+        if self.client.account_preferences is None:
+            # try and get account preferences as well
+            self._set_user_preferences(await self.get_user_preferences())
+
+        if self.client.account_balance is None:
+            self._set_balance(await self.get_balance())
+
+        return login_resource
+
+    async def logout(self) -> None:
+        """
+        See Account.logout
+        """
+        (response, response_json, elapsed_time) = await self._post(
+            method_uri=f"{self.api_version}/logout"
+        )
+        self._process_logout(response)
+
+    async def refresh_session_token(self) -> Optional[resources.Login]:
+        """
+        See Account.refresh_session_token
+        """
+        return await self.client.auth_flight.do(
+            "refresh_session_token", self._refresh_session_token
+        )
+
+    async def _refresh_session_token(self) -> Optional[resources.Login]:
+        (response, response_json, elapsed_time) = await self._post(
+            method_uri=f"{self.api_version}/status"
+        )
+        return self._process_refresh(response_json)
+
+    async def _post(
+        self, method_uri: str, params: dict = None, authenticated: bool = True
+    ) -> Tuple[AsyncResponse, dict, float]:
+        """
+        See Account._post
+        """
+        params = params if params else {}
+
+        uri = self.client.uri + method_uri
+        timeout = self.client.timeouts.get(self._endpoint_name(method_uri))
+
+        with tracing.client_span(
+            self.client.tracer, "POST", self.api_version, method_uri
+        ) as span:
+            time_sent = time.time()
+
+            try:
+                logger.debug("requesting the data for %s", uri)
+
+                response = await self._send("POST", uri, timeout=timeout)
+
+            except Exception as e:
+                raise self._api_error(e, uri, params, timeout)
+
+            elapsed_time = time.time() - time_sent
+            if span is not None:
+                tracing.record_response(span, response)
+
+        return self._process_post(response, elapsed_time)
@@ -0,0 +1,407 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Tuple, Optional, Mapping, Union
+import asyncio
+import inspect
+import logging
+import time
+from betconnect.compat import aiohttp
+from betconnect.timeouts import Timeout
+from betconnect.middleware import RequestContext
+from betconnect.timing import CallTiming
+from betconnect import resources, tracing
+from betconnect.resources.baseresource import BaseResource
+from .baseendpoint import BaseEndpoint, Call
+
+logger = logging.getLogger(__name__)
+
+# aiohttp < 3.10 raises ServerTimeoutError for both phases, reported as read
+_CONNECT_TIMEOUT_ERRORS = getattr(aiohttp, "ConnectionTimeoutError", ())
+
+
+async def _resolve(result: Any) -> Any:
+    # middleware hooks can be plain functions or coroutines
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+if TYPE_CHECKING:
+    from betconnect.asyncapiclient import AsyncAPIClient
+
+
+class AsyncResponse:
+    """
+    The parts of an aiohttp response used when processing, read in full so the connection can be released back
+    to the pool. Mirrors the attributes of requests.Response used by BaseEndpoint.
+    """
+
+    __slots__ = (
+        "status_code",
+        "url",
+        "headers",
+        "content",
+        "compressed_size",
+        "timing",
+    )
+
+    def __init__(
+        self,
+        status_code: int,
+        url: str,
+        headers: Mapping[str, str],
+        content: bytes,
+        compressed_size: Optional[int] = None,
+        timing: Optional[CallTiming] = None,
+    ):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.content = content
+        self.compressed_size = compressed_size
+        self.timing = timing
+
+
+class AsyncBaseEndpoint(BaseEndpoint):
+    def __init__(self, client: AsyncAPIClient):
+        super(AsyncBaseEndpoint, self).__init__(client)
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        return self.client.session
+
+    async def _send_attempt(
+        self, context: RequestContext, hedge: bool = False
+    ) -> AsyncResponse:
+        """
+        Sends a single attempt of the request through the client middleware, awaiting coroutine hooks
+        :param context: the request attempt
+        :param hedge: hedge the request as allowed by the client hedge policy
+        :return: AsyncResponse
+        """
+        middleware = self.client.middleware
+        if not middleware:
+            return await self._send_once(context, hedge)
+        response = None
+        for m in middleware:
+            response = await _resolve(m.before_send(context))
+            if response is not None:
+                break
+        if response is None:
+            try:
+                response = await self._send_once(context, hedge)
+            except Exception as e:
+                for m in reversed(middleware):
+                    response = await _resolve(m.on_error(context, e))
+                    if response is not None:
+                        break
+                else:
+                    raise
+        for m in reversed(middleware):
+            response = await _resolve(m.after_receive(context, response))
+        return response
+
+    async def _send_once(self, context: RequestContext, hedge: bool) -> AsyncResponse:
+        if hedge:
+            return await self._send_hedged(
+                context.endpoint,
+                context.method,
+                context.uri,
+                params=context.params,
+                data=context.data,
+                timeout=context.timeout,
+            )
+        return await self._send(
+            context.method,
+            context.uri,
+            params=context.params,
+            data=context.data,
+            timeout=context.timeout,
+        )
+
+    async def _send(
+        self,
+        method: str,
+        uri: str,
+        params: dict = None,
+        data: dict = None,
+        timeout: Timeout = None,
+    ) -> AsyncResponse:
+        """
+        Sends the request through the client session, reading the full body before releasing the connection and
+        recording its CallTiming
+        :param method: HTTP method
+        :param uri: full uri to be requested
+        :param params: Query Params to be used in request
+        :param data: json body of data
+        :param timeout: connect and read Timeout
+        :return: AsyncResponse
+        """
+        if timeout is None:
+            timeout = self.client.timeouts.default
+        timing = CallTiming()
+        start = time.perf_counter()
+        async with self.session.request(
+            method,
+            uri,
+            params=params if params else None,
+            json=data,
+            headers=self.client.headers,
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=timeout.connect, sock_read=timeout.read
+            ),
+            trace_request_ctx=timing,
+        ) as response:
+            headers_received = time.perf_counter()
+            content = await response.read()
+            # dns and connect are recorded by the sessions trace config
+            timing.ttfb = (
+                headers_received - start - (timing.dns or 0) - (timing.connect or 0)
+            )
+            timing.download = time.perf_counter() - headers_received
+            return AsyncResponse(
+                status_code=response.status,
+                url=str(response.url),
+                headers=response.headers,
+                content=content,
+                # aiohttp >= 3.12, bytes before decompression
+                compressed_size=getattr(response.content, "total_raw_bytes", None),
+                timing=timing,
+            )
+
+    async def _send_hedged(
+        self,
+        endpoint: str,
+        method: str,
+        uri: str,
+        params: dict = None,
+        data: dict = None,
+        timeout: Timeout = None,
+    ) -> AsyncResponse:
+        """
+        Sends the request, sending a duplicate (hedge) if it has not returned after the hedge policy delay. The first
+        response wins and the other request is cancelled.
+        :param endpoint: endpoint name
+        :param method: HTTP method
+        :param uri: full uri to be requested
+        :param params: Query Params to be used in request
+        :param data: json body of data
+        :param timeout: connect and read Timeout
+        :return: AsyncResponse
+        """
+        hedge_policy = self.client.hedge_policy
+
+        async def send_hedge() -> AsyncResponse:
+            if self.client.rate_limiter is not None:
+                await self.client.rate_limiter.acquire_async(endpoint)
+            return await self._send(
+                method, uri, params=params, data=data, timeout=timeout
+            )
+
+        start = time.time()
+        primary = asyncio.ensure_future(
+            self._send(method, uri, params=params, data=data, timeout=timeout)
+        )
+        futures = [primary]
+        try:
+            done, _ = await asyncio.wait(futures, timeout=hedge_policy.delay(endpoint))
+            if done or not hedge_policy.acquire(endpoint):
+                response = await primary
+                hedge_policy.record(endpoint, time.time() - start, False)
+                return response
+
+            futures.append(asyncio.ensure_future(send_hedge()))
+            pending = set(futures)
+            while pending:
+                _, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in futures:
+                    if future.done() and future.exception() is None:
+                        hedge_policy.record(
+                            endpoint, time.time() - start, future is not primary
+                        )
+                        return future.result()
+            # both failed
+            return primary.result()
+        finally:
+            # the losing request, releasing its connection
+            for future in futures:
+                future.cancel()
+
+    @staticmethod
+    def _compressed_size(response: AsyncResponse) -> Optional[int]:
+        if response.compressed_size:
+            return response.compressed_size
+        return BaseEndpoint._compressed_size(response)
+
+    def _connection_error(self, exception: Exception) -> bool:
+        return (
+            isinstance(exception, aiohttp.ClientConnectionError)
+            and self._timeout_phase(exception) != "read"
+        )
+
+    @staticmethod
+    def _timeout_phase(exception: Exception) -> Optional[str]:
+        if isinstance(exception, _CONNECT_TIMEOUT_ERRORS):
+            return "connect"
+        elif isinstance(exception, asyncio.TimeoutError):
+            # ServerTimeoutError / SocketTimeoutError (sock_read) are TimeoutErrors
+            return "read"
+        return None
+
+    async def _call(
+        self, call: Call
+    ) -> Union[BaseResource, list, resources.BaseRequestException]:
+        """
+        Sends the request for a call and processes the response into its resource
+        :param call: Call built by the endpoint function
+        :return: A resource for the response data or a BaseRequestException if BetConnect has detected an issue with
+        the request.
+        """
+        (response, response_json, elapsed_time) = await self._send_call(call)
+        return self._process_call(call, response, response_json, elapsed_time)
+
+    async def _request(
+        self, method_uri: str, params: dict = None, authenticated: bool = False
+    ) -> Tuple[AsyncResponse, dict, float]:
+        """
+        :param str method_uri: uri to be used, defined by each function.
+        :param dict params: Query Params to be used in request
+        :param bool authenticated: If the request requires the user to be logged in
+        :return: tuple of the AsyncResponse, dict (json_dict), float (elapsed time)
+        """
+        return await self._send_request(
+            "GET",
+            method_uri,
+            params=params if params else {},
+            authenticated=authenticated,
+        )
+
+    async def _post(
+        self, method_uri: str, data: dict, authenticated: bool = True
+    ) -> Tuple[AsyncResponse, dict, float]:
+        """
+        :param str method_uri: uri to be used, defined by each function.
+        :param dict data: body of data
+        :param bool authenticated: If the request requires the user to be logged in
+        :return: tuple of the AsyncResponse, dict (json_dict), float (elapsed time)
+        """
+        return await self._send_request(
+            "POST", method_uri, data=data, authenticated=authenticated
+        )
+
+    async def _patch(
+        self, method_uri: str, data: dict
+    ) -> Tuple[AsyncResponse, dict, float]:
+        """
+        :param str method_uri: uri to be used, defined by each function.
+        :param dict data: body of data
+        :return: tuple of the AsyncResponse, dict (json_dict), float (elapsed time)
+        """
+        return await self._send_request(
+            "PATCH", method_uri, data=data, authenticated=True
+        )
+
+    async def _put(
+        self, method_uri: str, data: dict, authenticated: bool = True
+    ) -> Tuple[AsyncResponse, dict, float]:
+        """
+        :param str method_uri: uri to be used, defined by each function.
+        :param dict data: body of data
+        :param bool authenticated: If the request requires the user to be logged in
+        :return: tuple of the AsyncResponse, dict (json_dict), float (elapsed time)
+        """
+        return await self._send_request(
+            "PUT", method_uri, data=data, authenticated=authenticated
+        )
+
+    async def _send_request(
+        self,
+        method: str,
+        method_uri: str,
+        params: dict = None,
+        data: dict = None,
+        authenticated: bool = True,
+    ) -> Tuple[AsyncResponse, dict, float]:
+        """
+        Logs in if required, checks the circuit breaker, waits on the client rate limiter and sends the request with
+        the endpoints timeout through the client middleware, hedging reads and retrying as allowed by the client hedge
+        and retry policies. Recorded in a span if the client has a tracer.
+        :param method: HTTP method
+        :param str method_uri: uri to be used, defined by each function.
+        :param dict params: Query Params to be used in request
+        :param dict data: json body of data
+        :param bool authenticated: If the request requires the user to be logged in
+        :return: tuple of the AsyncResponse, dict (json_dict), float (elapsed time)
+        """
+        tracer = self.client.tracer
+        if tracer is None:
+            return await self._send_with_retries(
+                method, method_uri, params, data, authenticated
+            )
+        with tracing.client_span(tracer, method, self.api_version, method_uri) as span:
+            response, response_json, elapsed_time = await self._send_with_retries(
+                method, method_uri, params, data, authenticated
+            )
+            tracing.record_response(span, response)
+        return response, response_json, elapsed_time
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        method_uri: str,
+        params: Optional[dict],
+        data: Optional[dict],
+        authenticated: bool,
+    ) -> Tuple[AsyncResponse, dict, float]:
+        uri = self.client.uri + method_uri
+        logger.debug("%s request for %s", method, uri)
+
+        if authenticated and self.client.logged_in is False:
+            logger.info(
+                "Need to be logged in before accessing %s. Attempting login with supplied credentials",
+                uri,
+            )
+            await self.client.account.login(if_required=True)
+
+        endpoint = self._endpoint_name(method_uri)
+        hedge = self._hedgeable(method, endpoint)
+        attempt = 0
+        while True:
+            if self.client.circuit_breaker is not None:
+                self.client.circuit_breaker.check(endpoint)
+            if self.client.rate_limiter is not None:
+                await self.client.rate_limiter.acquire_async(endpoint)
+
+            timeout = self.client.timeouts.get(endpoint)
+            time_sent = time.time()
+            try:
+                response = await self._send_attempt(
+                    RequestContext(
+                        endpoint, method, uri, params, data, timeout, attempt
+                    ),
+                    hedge,
+                )
+            except Exception as e:
+                self._record_call(endpoint, time_sent, exception=e)
+                delay = self._retry_delay(attempt, method, endpoint, data, exception=e)
+                if delay is None:
+                    raise self._api_error(
+                        e, uri, params if method == "GET" else data, timeout
+                    )
+            else:
+                self._record_call(endpoint, time_sent, response=response)
+                delay = self._retry_delay(
+                    attempt, method, endpoint, data, response=response
+                )
+                if delay is None:
+                    break
+            await asyncio.sleep(delay)
+            attempt += 1
+        elapsed_time = time.time() - time_sent
+        self._record_payload(endpoint, response)
+        self._log_response(endpoint, method, response, elapsed_time)
+
+        response_json = self._decode(endpoint, method, response)
+
+        return response, response_json, elapsed_time
@@ -0,0 +1,316 @@
+import asyncio
+import time
+from typing import Union, List, Callable, AsyncIterator, Optional
+from betconnect import config
+from betconnect import enums
+from betconnect import resources
+from betconnect.resources.baseresource import BaseResource
+from .asyncbaseendpoint import AsyncBaseEndpoint
+from .betting import Betting
+import logging
+from betconnect.cache import cached
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBetting(AsyncBaseEndpoint, Betting):
+    """
+    asyncio version of the Betting endpoint, every request function is a coroutine and iter_my_bets,
+    iter_bet_history and iter_active_bet_requests return async iterators. Requests are built and responses processed
+    by Betting, see Betting for each function.
+    """
+
+    @cached
+    async def active_bookmakers(self) -> List[resources.ActiveBookmaker]:
+        """
+        See Betting.active_bookmakers
+        """
+        return await self._call(self._active_bookmakers_call())
+
+    @cached
+    async def active_sports(
+        self, with_bets: bool = False
+    ) -> List[resources.ActiveSport]:
+        """
+        See Betting.active_sports
+        """
+        return await self._call(self._active_sports_call(with_bets))
+
+    @cached
+    async def active_regions(self, sport_id: int) -> List[resources.ActiveRegion]:
+        """
+        See Betting.active_regions
+        """
+        return await self._call(self._active_regions_call(sport_id))
+
+    @cached
+    async def active_competitions(
+        self, sport_id: int, region_id: int
+    ) -> List[resources.ActiveCompetition]:
+        """
+        See Betting.active_competitions
+        """
+        return await self._call(self._active_competitions_call(sport_id, region_id))
+
+    async def active_fixtures(
+        self, sport_id: int, region_id: int = None, competition_id: int = None
+    ) -> List[resources.ActiveFixture]:
+        """
+        See Betting.active_fixtures
+        """
+        return await self._call(
+            self._active_fixtures_call(sport_id, region_id, competition_id)
+        )
+
+    @cached
+    async def active_market_types(
+        self, sport_id: int
+    ) -> List[resources.ActiveMarketType]:
+        """
+        See Betting.active_market_types
+        """
+        return await self._call(self._active_market_types_call(sport_id))
+
+    async def active_markets(
+        self, fixture_id: int, grouped: bool = False
+    ) -> List[resources.ActiveMarket]:
+        """
+        See Betting.active_markets
+        """
+        return await self._call(self._active_markets_call(fixture_id, grouped))
+
+    async def active_selections(
+        self, fixture_id: int, market_type_id: int, handicap: str = None
+    ) -> List[resources.ActiveSelection]:
+        """
+        See Betting.active_selections
+        """
+        return await self._call(
+            self._active_selections_call(fixture_id, market_type_id, handicap)
+        )
+
+    async def bet_request_create(
+        self, request_filter: resources.CreateBetRequestFilter
+    ) -> Union[resources.BaseRequestException, resources.BetRequestCreate]:
+        """
+        See Betting.bet_request_create
+        """
+        return await self._call(self._bet_request_create_call(request_filter))
+
+    async def bet_request_get(
+        self, request_filter: resources.GetBetRequestFilter
+    ) -> Union[resources.BaseRequestException, resources.BetRequest]:
+        """
+        See Betting.bet_request_get
+        """
+        return await self._call(self._bet_request_get_call(request_filter))
+
+    async def selections_for_market(
+        self, fixture_id: int, market_type_id: int, top_price_only: bool = False
+    ) -> Union[resources.BaseRequestException, List[resources.SelectionsForMarket]]:
+        """
+        See Betting.selections_for_market
+        """
+        return await self._call(
+            self._selections_for_market_call(fixture_id, market_type_id, top_price_only)
+        )
+
+    async def bet_request_match(
+        self, bet_request_id: UUID, accepted_stake: int
+    ) -> Union[resources.BaseRequestException, resources.BetRequestMatch]:
+        """
+        See Betting.bet_request_match
+        """
+        return await self._call(
+            self._bet_request_match_call(bet_request_id, accepted_stake)
+        )
+
+    async def bet_request_match_more(
+        self, bet_request_id: UUID, requested_stake: float
+    ) -> Union[resources.BetRequestMatchMore, resources.BaseRequestException]:
+        """
+        See Betting.bet_request_match_more
+        """
+        return await self._call(
+            self._bet_request_match_more_call(bet_request_id, requested_stake)
+        )
+
+    async def bet_request_stop(
+        self, bet_request_id: UUID, stop_bet_reason: str = ""
+    ) -> Union[resources.BetRequestStop, resources.BaseRequestException]:
+        """
+        See Betting.bet_request_stop
+        """
+        return await self._call(
+            self._bet_request_stop_call(bet_request_id, stop_bet_reason)
+        )
+
+    async def get_active_bet_requests(
+        self, limit: int = None, page: int = None
+    ) -> Union[resources.ActiveBetRequests, resources.BaseRequestException]:
+        """
+        See Betting.get_active_bet_requests
+        """
+        return await self._call(self._get_active_bet_requests_call(limit, page))
+
+    async def prices(
+        self,
+        fixture_id: int,
+        market_type_id: int,
+        competitor: str,
+        handicap: str = None,
+    ) -> List[resources.Price]:
+        """
+        See Betting.prices
+        """
+        return await self._call(
+            self._prices_call(fixture_id, market_type_id, competitor, handicap)
+        )
+
+    async def bet_history(
+        self,
+        status: enums.BetStatus,
+        side: enums.BetSide,
+        limit: int = None,
+        page: int = None,
+    ) -> Union[resources.BaseRequestException, resources.BetHistoryRequest]:
+        """
+        See Betting.bet_history
+        """
+        return await self._call(self._bet_history_call(status, side, limit, page))
+
+    async def get_viewed_next_page(
+        self, bet_request_id: UUID, sport_id: int = None
+    ) -> Union[resources.Viewed, resources.BaseRequestException]:
+        """
+        See Betting.get_viewed_next_page
+        """
+        return await self._call(
+            self._get_viewed_next_page_call(bet_request_id, sport_id)
+        )
+
+    async def my_bets(
+        self,
+        side: enums.BetSide,
+        status: enums.BetRequestStatus,
+        user_id: str = None,
+        limit: int = None,
+        page: int = None,
+        get_all: str = None,
+        customer_strategy_ref: str = None,
+    ) -> Union[
+        resources.MyBetsBetRequests,
+        resources.MyBetsBets,
+        resources.BaseRequestException,
+    ]:
+        """
+        See Betting.my_bets
+        """
+        if user_id is None and not self.client.user_id:
+            logger.debug(
+                f"Trying to get your user preferences as no user_id was supplied!"
+            )
+            await self.client.account.get_user_preferences()
+
+        return await self._call(
+            self._my_bets_call(
+                side, status, user_id, limit, page, get_all, customer_strategy_ref
+            )
+        )
+
+    async def export_bet_history(
+        self,
+        status: enums.BetStatus,
+        side: enums.BetSide,
+        limit: int = config.ITER_PAGE_LIMIT_VALUE,
+        max_workers: int = config.EXPORT_MAX_WORKERS,
+        requests_per_second: Optional[float] = None,
+    ) -> List[resources.BetHistory]:
+        """
+        Bulk export of bet history. The first page is requested to find the last page, the remaining pages are then
+        requested concurrently and reassembled in page order. Bets are deduplicated by bet_request_id as rows can
+        shift between pages whilst the export is running.
+        :param status: The status of the bet
+        :param side: BetSide enum - either back or lay
+        :param limit: The number of bets requested per page
+        :param max_workers: The maximum number of page requests in flight at once
+        :param requests_per_second: Optional cap on the rate page requests are sent
+        :return: List of BetHistory resources
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        interval = 1 / requests_per_second if requests_per_second else 0
+        next_send = time.monotonic()
+
+        async def request_page(p: int) -> resources.BetHistoryRequest:
+            nonlocal next_send
+            async with semaphore:
+                if interval:
+                    send, next_send = (
+                        next_send,
+                        max(next_send, time.monotonic()) + interval,
+                    )
+                    await asyncio.sleep(max(0.0, send - time.monotonic()))
+                response = await self.bet_history(
+                    status=status, side=side, limit=limit, page=p
+                )
+            return self._check_page(response, p)
+
+        first_page = await request_page(self.client.page_start_value)
+        pages = [first_page] + list(
+            await asyncio.gather(
+                *[
+                    request_page(p)
+                    for p in range(
+                        self.client.page_start_value + 1, first_page.last_page + 1
+                    )
+                ]
+            )
+        )
+        return self._merge_pages(pages)
+
+    @staticmethod
+    async def _iter_pages(
+        request_page: Callable, page: int, prefetch: bool
+    ) -> AsyncIterator[BaseResource]:
+        """
+        Yields the bets of each page, holding at most the current page and the prefetched next page in memory
+        :param request_page: function returning the paginated resource coroutine for a page number
+        :param page: The page to start from
+        :param prefetch: Request the next page in a task while the current page is being consumed
+        :return: AsyncIterator of bet resources
+        """
+        next_page = None
+        try:
+            response = await request_page(page)
+            while True:
+                Betting._check_page(response, page)
+                last_page = page >= response.last_page
+                next_page = (
+                    asyncio.ensure_future(request_page(page + 1))
+                    if prefetch and not last_page
+                    else None
+                )
+                for bet in response.bets:
+                    yield bet
+                if last_page:
+                    return
+                page += 1
+                response = await (next_page if next_page else request_page(page))
+                next_page = None
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+    async def lock_bet(
+        self, bet_request_id: UUID, bet_status_id: int, allocated_stake: int
+    ) -> Union[resources.LockBet, resources.BaseRequestException]:
+        """
+        Matched betting premium product only. Premuim subscription required.
+        client.account_preferences.is_premium_subscriber ==1.
+        :param bet_request_id: The bet request ID
+        :param bet_status_id: The status ID of the bet
+        :param allocated_stake:
+        :return: LockBet
+        """
+        raise NotImplementedError
@@ -1,16 +1,37 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Union, List, Type, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    NamedTuple,
+    Union,
+    List,
+    Type,
+    Tuple,
+    Optional,
+    Dict,
+)
 from datetime import datetime, timedelta
 from betconnect.resources.baseresource import BaseResource
-import requests
+from betconnect.resources.lite import LITE_RESOURCES
 import json
+import requests
+from concurrent.futures import FIRST_COMPLETED, wait
 import logging
 import time
 from requests import Response
+from urllib3.exceptions import ReadTimeoutError
 from betconnect import resources
-from betconnect.exceptions import APIError
+from betconnect.exceptions import APIError, RequestTimeout
+from betconnect.timeouts import Timeout
+from betconnect.middleware import RequestContext
+from betconnect.timing import CallTiming, emit, sending
+from betconnect import tracing
+from betconnect.cache import ResponseCache
 from uuid import UUID
+from urllib.parse import urlsplit
 from betconnect import config
+from betconnect.enums import ResourceMode
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +39,44 @@ if TYPE_CHECKING:
     from betconnect.apiclient import APIClient
 
 
-class BaseEndpoint:
-    _read_timeout = config.CLIENT_READOUT_TIME_SECS
+class Call(NamedTuple):
+    """
+    A request to the api and the resource its response is processed into, built by the endpoint functions and sent
+    by the sync or async endpoint
+    """
+
+    method: str
+    method_uri: str
+    # a resource, or a function of (response, response_json) choosing one
+    resource: Union[Type[BaseResource], Callable[..., Type[BaseResource]]]
+    data: Optional[dict] = None
+    authenticated: bool = False
 
+
+class BaseEndpoint:
     def __init__(self, client: APIClient):
         self.client = client
+        self.cache: Optional[ResponseCache] = None
+
+    def enable_cache(
+        self, ttls: Dict[str, float] = None, maxsize: int = config.CACHE_MAX_SIZE
+    ) -> ResponseCache:
+        """
+        Enables caching of the responses of slow changing endpoints. Cached responses are the same resource objects
+        returned by the original request.
+        :param ttls: dict of endpoint function name to TTL in seconds, default config.CACHE_DEFAULT_TTLS
+        :param maxsize: The maximum number of responses held
+        :return: The ResponseCache, used for invalidation and hit/miss stats
+        """
+        self.cache = ResponseCache(ttls=ttls, maxsize=maxsize)
+        return self.cache
+
+    def disable_cache(self) -> None:
+        """
+        Disables and clears the response cache
+        :return: None
+        """
+        self.cache = None
 
     @property
     def session(self) -> requests.Session:
@@ -40,6 +94,55 @@ class BaseEndpoint:
     def tomorrow(self):
         return datetime.utcnow() + timedelta(days=1)
 
+    def _call(
+        self, call: Call
+    ) -> Union[BaseResource, list, resources.BaseRequestException]:
+        """
+        Sends the request for a call and processes the response into its resource
+        :param call: Call built by the endpoint function
+        :return: A resource for the response data or a BaseRequestException if BetConnect has detected an issue with
+        the request.
+        """
+        (response, response_json, elapsed_time) = self._send_call(call)
+        return self._process_call(call, response, response_json, elapsed_time)
+
+    def _send_call(self, call: Call):
+        """
+        Sends the request for a call with _request, _post, _patch or _put, a coroutine on the async endpoints
+        """
+        if call.method == "GET":
+            return self._request(
+                method_uri=call.method_uri, authenticated=call.authenticated
+            )
+        elif call.method == "POST":
+            return self._post(
+                method_uri=call.method_uri,
+                data=call.data,
+                authenticated=call.authenticated,
+            )
+        elif call.method == "PATCH":
+            return self._patch(method_uri=call.method_uri, data=call.data)
+        return self._put(
+            method_uri=call.method_uri, data=call.data, authenticated=call.authenticated
+        )
+
+    def _process_call(
+        self,
+        call: Call,
+        response: requests.Response,
+        response_json: Union[dict, list],
+        elapsed_time: float,
+    ) -> Union[BaseResource, list, resources.BaseRequestException]:
+        resource = call.resource
+        if not isinstance(resource, type):
+            resource = resource(response, response_json)
+        return self.process_response(
+            response=response,
+            response_json=response_json,
+            resource=resource,
+            elapsed_time=elapsed_time,
+        )
+
     def _request(
         self, method_uri: str, params: dict = None, authenticated: bool = False
     ) -> Tuple[requests.Response, dict, float]:
@@ -49,32 +152,37 @@ class BaseEndpoint:
         :param bool authenticated: If the request requires the user to be logged in
         :return: tuple of the Response, dict (json_dict), float (elapsed time)
         """
-        params = params if params else {}
-
-        uri = self.client.uri + method_uri
-        time_sent = time.time()
-
-        logger.debug(f"Requesting the data for {uri}")
-
-        if authenticated and self.client.logged_in is False:
-            logger.info(
-                f"Need to be logged in before accessing{uri}. Attempting login with supplied credentials"
-            )
-            self.client.account.login()
-
-        try:
-            response = self.session.get(uri, timeout=self._read_timeout, params=params)
-        except requests.ConnectionError as e:
-            raise APIError(None, uri, params, e)
-        except Exception as e:
-            raise APIError(None, uri, params, e)
-        elapsed_time = time.time() - time_sent
+        return self._send_request(
+            "GET",
+            method_uri,
+            params=params if params else {},
+            authenticated=authenticated,
+        )
 
-        response_json = self.load_json_content(response)
+    def _post(
+        self, method_uri: str, data: dict, authenticated: bool = True
+    ) -> Tuple[requests.Response, dict, float]:
+        """
+        :param str method_uri: uri to be used, defined by each function.
+        :param dict data: body of data
+        :param bool authenticated: If the request requires the user to be logged in
+        :return: tuple of the Response, dict (json_dict), float (elapsed time)
+        """
+        return self._send_request(
+            "POST", method_uri, data=data, authenticated=authenticated
+        )
 
-        return response, response_json, elapsed_time
+    def _patch(
+        self, method_uri: str, data: dict
+    ) -> Tuple[requests.Response, dict, float]:
+        """
+        :param str method_uri: uri to be used, defined by each function.
+        :param dict data: body of data
+        :return: tuple of the Response, dict (json_dict), float (elapsed time)
+        """
+        return self._send_request("PATCH", method_uri, data=data, authenticated=True)
 
-    def _post(
+    def _put(
         self, method_uri: str, data: dict, authenticated: bool = True
     ) -> Tuple[requests.Response, dict, float]:
         """
@@ -83,65 +191,455 @@ class BaseEndpoint:
         :param bool authenticated: If the request requires the user to be logged in
         :return: tuple of the Response, dict (json_dict), float (elapsed time)
         """
+        return self._send_request(
+            "PUT", method_uri, data=data, authenticated=authenticated
+        )
+
+    def _send_request(
+        self,
+        method: str,
+        method_uri: str,
+        params: dict = None,
+        data: dict = None,
+        authenticated: bool = True,
+    ) -> Tuple[requests.Response, dict, float]:
+        """
+        Logs in if required, checks the circuit breaker, waits on the client rate limiter and sends the request with
+        the endpoints timeout through the client middleware, hedging reads and retrying as allowed by the client hedge
+        and retry policies. Recorded in a span if the client has a tracer.
+        :param method: HTTP method
+        :param str method_uri: uri to be used, defined by each function.
+        :param dict params: Query Params to be used in request
+        :param dict data: json body of data
+        :param bool authenticated: If the request requires the user to be logged in
+        :return: tuple of the Response, dict (json_dict), float (elapsed time)
+        """
+        tracer = self.client.tracer
+        if tracer is None:
+            return self._send_with_retries(
+                method, method_uri, params, data, authenticated
+            )
+        with tracing.client_span(tracer, method, self.api_version, method_uri) as span:
+            response, response_json, elapsed_time = self._send_with_retries(
+                method, method_uri, params, data, authenticated
+            )
+            tracing.record_response(span, response)
+        return response, response_json, elapsed_time
+
+    def _send_with_retries(
+        self,
+        method: str,
+        method_uri: str,
+        params: Optional[dict],
+        data: Optional[dict],
+        authenticated: bool,
+    ) -> Tuple[requests.Response, dict, float]:
         uri = self.client.uri + method_uri
-        time_sent = time.time()
-        logger.debug(f"posting the data for {uri}")
+        logger.debug("%s request for %s", method, uri)
 
         if authenticated and self.client.logged_in is False:
             logger.info(
-                f"Need to be logged in before accessing{uri}. Attempting login with supplied credentials"
+                "Need to be logged in before accessing %s. Attempting login with supplied credentials",
+                uri,
             )
-            self.client.account.login()
-
-        try:
-            response = self.session.post(uri, timeout=self._read_timeout, json=data)
-        except requests.ConnectionError as e:
-            raise APIError(None, uri, data, e)
-        except Exception as e:
-            raise APIError(None, uri, data, e)
+            self.client.account.login(if_required=True)
+
+        endpoint = self._endpoint_name(method_uri)
+        hedge = self._hedgeable(method, endpoint)
+        attempt = 0
+        while True:
+            if self.client.circuit_breaker is not None:
+                self.client.circuit_breaker.check(endpoint)
+            if self.client.rate_limiter is not None:
+                self.client.rate_limiter.acquire(endpoint)
+
+            timeout = self.client.timeouts.get(endpoint)
+            time_sent = time.time()
+            try:
+                response = self._send_attempt(
+                    RequestContext(
+                        endpoint, method, uri, params, data, timeout, attempt
+                    ),
+                    hedge,
+                )
+            except Exception as e:
+                self._record_call(endpoint, time_sent, exception=e)
+                delay = self._retry_delay(attempt, method, endpoint, data, exception=e)
+                if delay is None:
+                    raise self._api_error(
+                        e, uri, params if method == "GET" else data, timeout
+                    )
+            else:
+                self._record_call(endpoint, time_sent, response=response)
+                delay = self._retry_delay(
+                    attempt, method, endpoint, data, response=response
+                )
+                if delay is None:
+                    break
+            time.sleep(delay)
+            attempt += 1
         elapsed_time = time.time() - time_sent
+        self._record_payload(endpoint, response)
+        self._log_response(endpoint, method, response, elapsed_time)
 
-        response_json = self.load_json_content(response)
+        response_json = self._decode(endpoint, method, response)
 
         return response, response_json, elapsed_time
 
-    def _patch(
-        self, method_uri: str, data: dict
-    ) -> Tuple[requests.Response, dict, float]:
+    def _send_attempt(
+        self, context: RequestContext, hedge: bool = False
+    ) -> requests.Response:
         """
-        :param str method_uri: uri to be used, defined by each function.
-        :param dict data: body of data
-        :return: tuple of the Response, dict (json_dict), float (elapsed time)
+        Sends a single attempt of the request through the client middleware
+        :param context: the request attempt
+        :param hedge: hedge the request as allowed by the client hedge policy
+        :return: requests.Response
         """
-        uri = self.client.uri + method_uri
-        time_sent = time.time()
-        logger.debug(f"patching the data for {uri}")
+        middleware = self.client.middleware
+        if not middleware:
+            return self._send_once(context, hedge)
+        response = None
+        for m in middleware:
+            response = m.before_send(context)
+            if response is not None:
+                break
+        if response is None:
+            try:
+                response = self._send_once(context, hedge)
+            except Exception as e:
+                for m in reversed(middleware):
+                    response = m.on_error(context, e)
+                    if response is not None:
+                        break
+                else:
+                    raise
+        for m in reversed(middleware):
+            response = m.after_receive(context, response)
+        return response
+
+    def _send_once(self, context: RequestContext, hedge: bool) -> requests.Response:
+        if hedge:
+            return self._send_hedged(
+                context.endpoint,
+                context.method,
+                context.uri,
+                params=context.params,
+                data=context.data,
+                timeout=context.timeout,
+            )
+        return self._send(
+            context.method,
+            context.uri,
+            params=context.params,
+            data=context.data,
+            timeout=context.timeout,
+        )
 
-        if self.client.logged_in is False:
-            logger.info(
-                f"Need to be logged in before accessing{uri}. Attempting login with supplied credentials"
+    def _send(
+        self,
+        method: str,
+        uri: str,
+        params: dict = None,
+        data: dict = None,
+        timeout: Timeout = None,
+    ) -> requests.Response:
+        """
+        Sends the request through the client session, attaching its CallTiming as response.timing
+        :param method: HTTP method
+        :param uri: full uri to be requested
+        :param params: Query Params to be used in request
+        :param data: json body of data
+        :param timeout: connect and read Timeout
+        :return: requests.Response
+        """
+        send = getattr(self.session, method.lower())
+        timing = CallTiming()
+        start = time.perf_counter()
+        with sending(timing):
+            response = send(uri, params=params, json=data, timeout=timeout)
+        # elapsed, from sending to the headers being parsed, includes connecting
+        headers_received = response.elapsed.total_seconds()
+        timing.ttfb = max(headers_received - (timing.connect or 0), 0)
+        timing.download = max(time.perf_counter() - start - headers_received, 0)
+        response.timing = timing
+        return response
+
+    def _send_hedged(
+        self,
+        endpoint: str,
+        method: str,
+        uri: str,
+        params: dict = None,
+        data: dict = None,
+        timeout: Timeout = None,
+    ) -> requests.Response:
+        """
+        Sends the request, sending a duplicate (hedge) if it has not returned after the hedge policy delay. The first
+        response wins, the other request completes in the background and its response is discarded.
+        :param endpoint: endpoint name
+        :param method: HTTP method
+        :param uri: full uri to be requested
+        :param params: Query Params to be used in request
+        :param data: json body of data
+        :param timeout: connect and read Timeout
+        :return: requests.Response
+        """
+        hedge_policy = self.client.hedge_policy
+        executor = hedge_policy.executor
+        start = time.time()
+        primary = executor.submit(
+            self._send, method, uri, params=params, data=data, timeout=timeout
+        )
+        done, _ = wait([primary], timeout=hedge_policy.delay(endpoint))
+        if done or not hedge_policy.acquire(endpoint):
+            response = primary.result()
+            hedge_policy.record(endpoint, time.time() - start, False)
+            return response
+
+        def send_hedge() -> requests.Response:
+            if self.client.rate_limiter is not None:
+                self.client.rate_limiter.acquire(endpoint)
+            return self._send(method, uri, params=params, data=data, timeout=timeout)
+
+        futures = [primary, executor.submit(send_hedge)]
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in futures:
+                if future.done() and future.exception() is None:
+                    hedge_policy.record(
+                        endpoint, time.time() - start, future is not primary
+                    )
+                    return future.result()
+        # both failed
+        return primary.result()
+
+    def _hedgeable(self, method: str, endpoint: str) -> bool:
+        hedge_policy = self.client.hedge_policy
+        return hedge_policy is not None and hedge_policy.can_hedge(method, endpoint)
+
+    def _log_response(
+        self,
+        endpoint: str,
+        method: str,
+        response: requests.Response,
+        elapsed_time: float,
+    ) -> None:
+        """
+        Logs a structured record of the response at the clients level for its status class, with endpoint, method,
+        status_code, elapsed_time and bytes as record attributes. Nothing is formatted if the level is disabled.
+        """
+        level = self._log_level(response)
+        if logger.isEnabledFor(level):
+            size = len(response.content)
+            logger.log(
+                level,
+                "%s %s %s in %.3fs, %s bytes",
+                method,
+                endpoint,
+                response.status_code,
+                elapsed_time,
+                size,
+                extra={
+                    "endpoint": endpoint,
+                    "method": method,
+                    "status_code": response.status_code,
+                    "elapsed_time": elapsed_time,
+                    "bytes": size,
+                },
             )
-            self.client.account.login()
 
-        try:
-            response = self.session.patch(uri, timeout=self._read_timeout, json=data)
-        except requests.ConnectionError as e:
-            raise APIError(None, uri, data, e)
-        except Exception as e:
-            raise APIError(None, uri, data, e)
-        elapsed_time = time.time() - time_sent
+    def _record_payload(self, endpoint: str, response: requests.Response) -> None:
+        """
+        Records the bytes received and decoded in the client payload stats
+        """
+        uncompressed = len(response.content)
+        compressed = self._compressed_size(response)
+        self.client.payload_stats.record(
+            endpoint,
+            response.headers.get("Content-Encoding", "identity"),
+            uncompressed if compressed is None else compressed,
+            uncompressed,
+        )
 
-        response_json = self.load_json_content(response)
+    @staticmethod
+    def _compressed_size(response: requests.Response) -> Optional[int]:
+        """
+        Bytes received, urllib3 counts the bytes read unless the body was chunked
+        """
+        raw = getattr(response, "raw", None)
+        if raw is not None and hasattr(raw, "tell") and raw.tell():
+            return raw.tell()
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            return int(content_length)
+        return None
+
+    def _record_call(
+        self,
+        endpoint: str,
+        time_sent: float,
+        exception: Exception = None,
+        response: requests.Response = None,
+    ) -> None:
+        """
+        Records the call result in the client circuit breaker and metrics, if any
+        """
+        metrics = self.client.metrics
+        if metrics is not None:
+            if exception is None:
+                metrics.record_request(
+                    endpoint,
+                    response.status_code,
+                    time.time() - time_sent,
+                    len(response.content),
+                )
+            else:
+                metrics.record_error(endpoint, self._timeout_phase(exception))
+        circuit_breaker = self.client.circuit_breaker
+        if circuit_breaker is not None:
+            circuit_breaker.record(
+                endpoint,
+                time.time() - time_sent,
+                exception is not None
+                or response.status_code in circuit_breaker.status_codes,
+            )
 
-        return response, response_json, elapsed_time
+    def _retry_delay(
+        self,
+        attempt: int,
+        method: str,
+        endpoint: str,
+        data: Optional[dict],
+        exception: Exception = None,
+        response: requests.Response = None,
+    ) -> Optional[float]:
+        """
+        Secs to wait before retrying a failed request, None if it is not retried
+        :param attempt: retries made so far
+        :param method: HTTP method
+        :param endpoint: endpoint name
+        :param data: json body of data
+        :param exception: the exception raised sending the request
+        :param response: the response, retried on the policies status codes
+        """
+        retry_policy = self.client.retry_policy
+        if retry_policy is None:
+            return None
+        if exception is not None:
+            if not self._connection_error(exception):
+                return None
+            reason = repr(exception)
+        elif response.status_code in retry_policy.status_codes:
+            reason = f"status code {response.status_code}"
+        else:
+            return None
+        if not retry_policy.can_retry(attempt, method, endpoint, data):
+            return None
+        delay = retry_policy.delay(
+            attempt,
+            response.headers.get("Retry-After") if response is not None else None,
+        )
+        if delay is not None:
+            retry_policy.record(endpoint, delay, reason)
+            if self.client.metrics is not None:
+                self.client.metrics.record_retry(endpoint)
+            if self.client.tracer is not None:
+                tracing.record_retry(attempt, reason)
+        return delay
+
+    def _connection_error(self, exception: Exception) -> bool:
+        """
+        Whether the request failed to connect, a read timeout may have been processed by BetConnect
+        """
+        return (
+            isinstance(exception, requests.ConnectionError)
+            and self._timeout_phase(exception) != "read"
+        )
+
+    def _api_error(
+        self, exception: Exception, uri: str, params: Optional[dict], timeout: Timeout
+    ) -> APIError:
+        """
+        Wraps a request exception in an APIError, or a RequestTimeout naming the phase that timed out
+        """
+        phase = self._timeout_phase(exception)
+        if phase is None:
+            return APIError(None, uri, params, exception)
+        return RequestTimeout(
+            phase,
+            timeout.connect if phase == "connect" else timeout.read,
+            uri,
+            params,
+            exception,
+        )
+
+    @staticmethod
+    def _timeout_phase(exception: Exception) -> Optional[str]:
+        if isinstance(exception, requests.ConnectTimeout):
+            return "connect"
+        elif isinstance(exception, requests.ReadTimeout):
+            return "read"
+        elif isinstance(exception, requests.ConnectionError) and any(
+            isinstance(arg, ReadTimeoutError) for arg in exception.args
+        ):
+            # timed out reading the body, after the response headers
+            return "read"
+        return None
+
+    def _decode(self, endpoint: str, method: str, response: requests.Response):
+        """
+        Decodes the json response, timed in the call timing and client metrics
+        """
+        start = time.perf_counter()
+        response_json = self.load_json_content(response, self.client.json_loads)
+        decode_time = time.perf_counter() - start
+        timing = getattr(response, "timing", None)
+        if timing is None:
+            # _send overridden
+            timing = response.timing = CallTiming()
+        timing.endpoint = endpoint
+        timing.method = method
+        timing.decode = decode_time
+        if self.client.metrics is not None:
+            self.client.metrics.record_decode(endpoint, decode_time)
+        return response_json
+
+    def _endpoint_name(self, method_uri: str) -> str:
+        """
+        The endpoint name from the method uri, e.g. selections_for_market from api/v2/selections_for_market/1/2/False
+        """
+        return method_uri[len(self.api_version) + 1 :].split("/", 1)[0]
+
+    def _url_endpoint_name(self, url: str) -> str:
+        """
+        The endpoint name from a response url
+        """
+        path = urlsplit(url).path
+        return path.split(f"/{self.api_version}/", 1)[-1].split("/", 1)[0]
+
+    def _log_level(self, response: requests.Response) -> int:
+        """
+        The level a response is logged at, from the client log_levels by status class
+        """
+        return self.client.log_levels.get(response.status_code // 100, logging.WARNING)
 
     @staticmethod
     def process_request_exception(
-        response: requests.Response, response_json: dict
+        response: requests.Response, response_json: dict, level: int = logging.WARNING
     ) -> resources.BaseRequestException:
-        logger.exception(
-            f"Issue with request for: {response.url}, message: {response_json.get('message')}"
-        )
+        """
+        :param response: the request response
+        :param response_json: the json data from the response
+        :param level: level the issue is logged at
+        """
+        if logger.isEnabledFor(level):
+            logger.log(
+                level,
+                "Issue with request for: %s, message: %s",
+                response.url,
+                response_json.get("message"),
+            )
         return resources.BaseRequestException(
             message=response_json.get("message"),
             request_url=response.url,
@@ -154,14 +652,25 @@ class BaseEndpoint:
             raise Exception(f"Incorrect UUID supplied for the bet_request_id")
 
     @staticmethod
-    def load_json_content(response: requests.Response):
-        if response.headers["content-type"] in [
-            "application/json",
-            "application/json; charset=utf-8",
-        ]:
-            return json.loads(response.content.decode("utf-8"))
+    def load_json_content(
+        response: requests.Response, json_loads: Callable[[bytes], Any] = json.loads
+    ):
+        """
+        :param response: the request response
+        :param json_loads: function decoding the response bytes, the client json_loads
+        """
+        # media type without parameters (charset etc.), e.g. application/json or application/problem+json
+        media_type = (
+            response.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        )
+        if media_type == "application/json" or media_type.endswith("+json"):
+            return json_loads(response.content)
         else:
-            logger.exception("Unrecognised content encoding type")
+            logger.warning(
+                "Unrecognised content type %s for %s",
+                response.headers.get("content-type"),
+                response.url,
+            )
 
     def process_response(
         self,
@@ -179,21 +688,68 @@ class BaseEndpoint:
         :return: A resource for the response data or a BaseRequestException if BetConnect has detected an issue with
         the request.
         """
+        tracer = self.client.tracer
+        timing = getattr(response, "timing", None)
+        if not isinstance(timing, CallTiming):
+            timing = None
+        start = time.perf_counter()
+        try:
+            if tracer is None:
+                return self._process_response(
+                    response, response_json, resource, elapsed_time
+                )
+            with tracing.parse_span(tracer, self._response_endpoint(response, timing)):
+                return self._process_response(
+                    response, response_json, resource, elapsed_time
+                )
+        finally:
+            self._record_parse(response, timing, time.perf_counter() - start)
+
+    def _response_endpoint(
+        self, response: requests.Response, timing: Optional[CallTiming]
+    ) -> str:
+        """
+        The endpoint name of a response, from its call timing if it has one
+        """
+        return timing.endpoint if timing else self._url_endpoint_name(response.url)
+
+    def _record_parse(
+        self,
+        response: requests.Response,
+        timing: Optional[CallTiming],
+        parse_time: float,
+    ) -> None:
+        """
+        Records the parse time in the client metrics and completes the call timing, passing it to the timing hook
+        """
+        if self.client.metrics is not None:
+            self.client.metrics.record_parse(
+                self._response_endpoint(response, timing), parse_time
+            )
+        if timing is not None:
+            timing.parse = parse_time
+            emit(timing, self.client.timing_hook)
+
+    def _process_response(
+        self,
+        response: requests.Response,
+        response_json: Union[dict, list],
+        resource: Type[BaseResource],
+        elapsed_time: float,
+    ) -> Union[BaseResource, dict, list, resources.BaseRequestException]:
+        if self.client.resource_mode is ResourceMode.LITE:
+            resource = LITE_RESOURCES.get(resource, resource)
 
         if self.check_status_code(response):
             if "data" in response_json:
                 data = response_json["data"]
 
-                logger.debug(
-                    f"It took {elapsed_time} s to request the data for url {response.url}"
-                )
-
                 if isinstance(data, dict):
                     return resource.create_from_dict(data)
                 elif isinstance(data, list):
                     if len(data) == 0:
-                        logger.info(f"No data could be found for {response.url}")
-                    return [resource.create_from_dict(r) for r in data]
+                        logger.info("No data could be found for %s", response.url)
+                    return resource.create_list_from_dicts(data)
                 else:
                     raise Exception(
                         "Unkown response data type"
@@ -208,38 +764,9 @@ class BaseEndpoint:
                 raise Exception("Expected response json to contain data key")
 
         else:
-            return self.process_request_exception(response, response_json)
-
-    def _put(
-        self, method_uri: str, data: dict, authenticated: bool = True
-    ) -> Tuple[requests.Response, dict, float]:
-        """
-        :param str method_uri: uri to be used, defined by each function.
-        :param dict data: body of data
-        :param bool authenticated: If the request requires the user to be logged in
-        :return: tuple of the Response, dict (json_dict), float (elapsed time)
-        """
-        uri = self.client.uri + method_uri
-        time_sent = time.time()
-        logger.debug(f"putting the data for {uri}")
-
-        if authenticated and self.client.logged_in is False:
-            logger.info(
-                f"Need to be logged in before accessing{uri}. Attempting login with supplied credentials"
+            return self.process_request_exception(
+                response, response_json, self._log_level(response)
             )
-            self.client.account.login()
-
-        try:
-            response = self.session.put(uri, timeout=self._read_timeout, json=data)
-        except requests.ConnectionError as e:
-            raise APIError(None, uri, data, e)
-        except Exception as e:
-            raise APIError(None, uri, data, e)
-        elapsed_time = time.time() - time_sent
-
-        response_json = self.load_json_content(response)
-
-        return response, response_json, elapsed_time
 
     @staticmethod
     def check_status_code(response: Response, codes: List[int] = None) -> bool:
@@ -1,69 +1,71 @@
-from typing import Union, List
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, List, Callable, Iterator, Optional, Tuple, Type
 import requests
+from betconnect import config
 from betconnect import enums
 from betconnect import resources
-from .baseendpoint import BaseEndpoint
+from betconnect.resources.baseresource import BaseResource
+from .baseendpoint import BaseEndpoint, Call
 import logging
 from betconnect import exceptions
+from betconnect.cache import cached
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
 
 
 class Betting(BaseEndpoint):
+    @cached
     def active_bookmakers(self) -> List[resources.ActiveBookmaker]:
         """
         Returns a list of active sports
         :return: List of ActiveBookmaker
         """
+        return self._call(self._active_bookmakers_call())
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/active_bookmakers", authenticated=True
-        )
-
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.ActiveBookmaker,
-            elapsed_time=elapsed_time,
+    def _active_bookmakers_call(self) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/active_bookmakers",
+            resources.ActiveBookmaker,
+            authenticated=True,
         )
 
+    @cached
     def active_sports(self, with_bets: bool = False) -> List[resources.ActiveSport]:
         """
         Gets a list of active sports
         :param with_bets: boolean value (True, False). Returns the number of active bet_request available for each sport
         :return: List of ActiveSport
         """
+        return self._call(self._active_sports_call(with_bets))
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/active_sports{'/True' if with_bets else ''}"
-        )
-
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.ActiveSport,
-            elapsed_time=elapsed_time,
+    def _active_sports_call(self, with_bets: bool) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/active_sports{'/True' if with_bets else ''}",
+            resources.ActiveSport,
         )
 
+    @cached
     def active_regions(self, sport_id: int) -> List[resources.ActiveRegion]:
         """
         Gets the active regions for a sport
         :param sport_id: The sport ID
         :return: List of ActiveRegion
         """
+        return self._call(self._active_regions_call(sport_id))
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/active_regions/{sport_id}"
-        )
-
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.ActiveRegion,
-            elapsed_time=elapsed_time,
+    def _active_regions_call(self, sport_id: int) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/active_regions/{sport_id}",
+            resources.ActiveRegion,
         )
 
+    @cached
     def active_competitions(
         self, sport_id: int, region_id: int
     ) -> List[resources.ActiveCompetition]:
@@ -73,16 +75,13 @@ class Betting(BaseEndpoint):
         :param int region_id: The region ID
         :return: List of ActiveCompetition
         """
+        return self._call(self._active_competitions_call(sport_id, region_id))
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/active_competitions/{sport_id}/{region_id}"
-        )
-
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.ActiveCompetition,
-            elapsed_time=elapsed_time,
+    def _active_competitions_call(self, sport_id: int, region_id: int) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/active_competitions/{sport_id}/{region_id}",
+            resources.ActiveCompetition,
         )
 
     def active_fixtures(
@@ -95,36 +94,36 @@ class Betting(BaseEndpoint):
         :param competition_id: The competition ID
         :return: List of ActiveFixture
         """
+        return self._call(
+            self._active_fixtures_call(sport_id, region_id, competition_id)
+        )
+
+    def _active_fixtures_call(
+        self, sport_id: int, region_id: Optional[int], competition_id: Optional[int]
+    ) -> Call:
         if competition_id:
             assert region_id is not None
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/active_fixtures/{sport_id}/{region_id if region_id else ''}{f'/{competition_id}' if competition_id is not None else ''}"
-        )
-
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.ActiveFixture,
-            elapsed_time=elapsed_time,
+        return Call(
+            "GET",
+            f"{self.api_version}/active_fixtures/{sport_id}/{region_id if region_id else ''}{f'/{competition_id}' if competition_id is not None else ''}",
+            resources.ActiveFixture,
         )
 
+    @cached
     def active_market_types(self, sport_id: int) -> List[resources.ActiveMarketType]:
         """
         Gets the active market type for a sport
         :param sport_id: The sport ID
         :return: List of ActiveMarketType
         """
+        return self._call(self._active_market_types_call(sport_id))
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/active_market_types/{sport_id}"
-        )
-
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.ActiveMarketType,
-            elapsed_time=elapsed_time,
+    def _active_market_types_call(self, sport_id: int) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/active_market_types/{sport_id}",
+            resources.ActiveMarketType,
         )
 
     def active_markets(
@@ -136,16 +135,13 @@ class Betting(BaseEndpoint):
         :param grouped: boolean value to determine whether the response should be grouped
         :return: List of ActiveMarket
         """
+        return self._call(self._active_markets_call(fixture_id, grouped))
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/active_markets/{fixture_id}{'/grouped' if grouped else ''}"
-        )
-
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.ActiveMarket,
-            elapsed_time=elapsed_time,
+    def _active_markets_call(self, fixture_id: int, grouped: bool) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/active_markets/{fixture_id}{'/grouped' if grouped else ''}",
+            resources.ActiveMarket,
         )
 
     def active_selections(
@@ -158,15 +154,17 @@ class Betting(BaseEndpoint):
         :param handicap: string handicap value. example '4.5'
         :return: List of ActiveSelection
         """
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/active_selections/{fixture_id}/{market_type_id}{f'/{handicap}' if handicap is not None else ''}"
+        return self._call(
+            self._active_selections_call(fixture_id, market_type_id, handicap)
         )
 
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.ActiveSelection,
-            elapsed_time=elapsed_time,
+    def _active_selections_call(
+        self, fixture_id: int, market_type_id: int, handicap: Optional[str]
+    ) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/active_selections/{fixture_id}/{market_type_id}{f'/{handicap}' if handicap is not None else ''}",
+            resources.ActiveSelection,
         )
 
     def bet_request_create(
@@ -177,17 +175,17 @@ class Betting(BaseEndpoint):
         :param request_filter: The bet create filter
         :return: a successful BetRequestCreate resource or an BaseRequestException when BetConnect detects an issue.
         """
+        return self._call(self._bet_request_create_call(request_filter))
 
-        (response, response_json, elapsed_time) = self._post(
-            method_uri=f"{self.api_version}/bet_request_create",
+    def _bet_request_create_call(
+        self, request_filter: resources.CreateBetRequestFilter
+    ) -> Call:
+        return Call(
+            "POST",
+            f"{self.api_version}/bet_request_create",
+            resources.BetRequestCreate,
             data=request_filter.generate_request_data(exclude_none=True),
-        )
-
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.BetRequestCreate,
-            elapsed_time=elapsed_time,
+            authenticated=True,
         )
 
     def bet_request_get(
@@ -201,41 +199,35 @@ class Betting(BaseEndpoint):
         :param request_filter: A bet request filter, either enter a bet request id or other filter values
         :return: A bet BetRequest resource or an BaseRequestException when BetConnect detects an issue.
         """
+        return self._call(self._bet_request_get_call(request_filter))
 
+    def _bet_request_get_call(
+        self, request_filter: resources.GetBetRequestFilter
+    ) -> Call:
         if request_filter.bet_request_id:
-            (response, response_json, elapsed_time) = self._post(
-                method_uri=f"{self.api_version}/bet_request_get",
-                data=request_filter.generate_request_data(
-                    exclude={
-                        "sport_id",
-                        "bookmakers",
-                        "min_odds",
-                        "max_odds",
-                        "accept_each_way",
-                    }
-                ),
+            data = request_filter.generate_request_data(
+                exclude={
+                    "sport_id",
+                    "bookmakers",
+                    "min_odds",
+                    "max_odds",
+                    "accept_each_way",
+                }
             )
         else:
             if request_filter.accept_each_way:
-                (response, response_json, elapsed_time) = self._post(
-                    method_uri=f"{self.api_version}/bet_request_get",
-                    data=request_filter.generate_request_data(
-                        exclude={"bet_request_id", "accept_each_way"}
-                    ),
+                data = request_filter.generate_request_data(
+                    exclude={"bet_request_id", "accept_each_way"}
                 )
             else:
-                (response, response_json, elapsed_time) = self._post(
-                    method_uri=f"{self.api_version}/bet_request_get",
-                    data=request_filter.generate_request_data(
-                        exclude={"bet_request_id"}
-                    ),
-                )
+                data = request_filter.generate_request_data(exclude={"bet_request_id"})
 
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.BetRequest,
-            elapsed_time=elapsed_time,
+        return Call(
+            "POST",
+            f"{self.api_version}/bet_request_get",
+            resources.BetRequest,
+            data=data,
+            authenticated=True,
         )
 
     def _is_line_market(self, response: requests.Response, response_json: dict) -> bool:
@@ -266,24 +258,26 @@ class Betting(BaseEndpoint):
         :param top_price_only: a bool value that represents whether to only return the top value
         :return: A List of SelectionsForMarket resources or an BaseRequestException when BetConnect detects an issue.
         """
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/selections_for_market/{fixture_id}/{market_type_id}/{f'True'if top_price_only else 'False'}"
+        return self._call(
+            self._selections_for_market_call(fixture_id, market_type_id, top_price_only)
+        )
+
+    def _selections_for_market_call(
+        self, fixture_id: int, market_type_id: int, top_price_only: bool
+    ) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/selections_for_market/{fixture_id}/{market_type_id}/{f'True'if top_price_only else 'False'}",
+            self._selections_for_market_resource,
         )
+
+    def _selections_for_market_resource(
+        self, response: requests.Response, response_json: dict
+    ) -> Type[BaseResource]:
         # Check is response a line market
         if self._is_line_market(response=response, response_json=response_json):
-            return self.process_response(
-                response=response,
-                response_json=response_json,
-                resource=resources.LineMarketsSelectionsForMarket,
-                elapsed_time=elapsed_time,
-            )
-        else:
-            return self.process_response(
-                response=response,
-                response_json=response_json,
-                resource=resources.SelectionsForMarket,
-                elapsed_time=elapsed_time,
-            )
+            return resources.LineMarketsSelectionsForMarket
+        return resources.SelectionsForMarket
 
     def bet_request_match(
         self, bet_request_id: UUID, accepted_stake: int
@@ -294,21 +288,22 @@ class Betting(BaseEndpoint):
         :param accepted_stake: the target stake you would like to match
         :return: A BetRequestMatch resource or an BaseRequestException when BetConnect detects an issue.
         """
+        return self._call(self._bet_request_match_call(bet_request_id, accepted_stake))
+
+    def _bet_request_match_call(
+        self, bet_request_id: UUID, accepted_stake: int
+    ) -> Call:
         self.check_bet_request_id(bet_request_id=bet_request_id)
 
-        (response, response_json, elapsed_time) = self._patch(
-            method_uri=f"{self.api_version}/bet_request_match",
+        return Call(
+            "PATCH",
+            f"{self.api_version}/bet_request_match",
+            resources.BetRequestMatch,
             data={
                 "bet_request_id": str(bet_request_id),
                 "accepted_stake": accepted_stake,
             },
-        )
-
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.BetRequestMatch,
-            elapsed_time=elapsed_time,
+            authenticated=True,
         )
 
     def bet_request_match_more(
@@ -321,21 +316,24 @@ class Betting(BaseEndpoint):
         :param requested_stake: The requested stake
         :return: A BetRequestMatchMore resource or an BaseRequestException when BetConnect detects an issue.
         """
+        return self._call(
+            self._bet_request_match_more_call(bet_request_id, requested_stake)
+        )
+
+    def _bet_request_match_more_call(
+        self, bet_request_id: UUID, requested_stake: float
+    ) -> Call:
         self.check_bet_request_id(bet_request_id=bet_request_id)
 
-        (response, response_json, elapsed_time) = self._patch(
-            method_uri=f"{self.api_version}/bet_request_match_more",
+        return Call(
+            "PATCH",
+            f"{self.api_version}/bet_request_match_more",
+            resources.BetRequestMatchMore,
             data={
                 "bet_request_id": str(bet_request_id),
                 "requested_stake": int(requested_stake),
             },
-        )
-
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.BetRequestMatchMore,
-            elapsed_time=elapsed_time,
+            authenticated=True,
         )
 
     def bet_request_stop(
@@ -347,10 +345,17 @@ class Betting(BaseEndpoint):
         :param stop_bet_reason: optional reason (i.e. 'no longer value')
         :return: A BetRequestStop resource or an BaseRequestException when BetConnect detects an issue.
         """
+        return self._call(self._bet_request_stop_call(bet_request_id, stop_bet_reason))
+
+    def _bet_request_stop_call(
+        self, bet_request_id: UUID, stop_bet_reason: str
+    ) -> Call:
         self.check_bet_request_id(bet_request_id=bet_request_id)
 
-        (response, response_json, elapsed_time) = self._post(
-            method_uri=f"{self.api_version}/bet_request_stop",
+        return Call(
+            "POST",
+            f"{self.api_version}/bet_request_stop",
+            resources.BetRequestStop,
             data={
                 "bet_request_id": str(bet_request_id),
                 "stop_bet_reason": stop_bet_reason,
@@ -358,21 +363,11 @@ class Betting(BaseEndpoint):
             authenticated=True,
         )
 
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.BetRequestStop,
-            elapsed_time=elapsed_time,
-        )
-
-    def get_active_bet_requests(
-        self, limit: int = None, page: int = None
-    ) -> Union[resources.ActiveBetRequests, resources.BaseRequestException]:
+    def _limit_page(
+        self, limit: Optional[int], page: Optional[int]
+    ) -> Tuple[Optional[int], Optional[int]]:
         """
-        Gets active bet requests, taking into account pagination
-        :param limit: Limit the number of active bets returned
-        :param page: The page starting number
-        :return: A ActiveBetRequests resource or an BaseRequestException when BetConnect detects an issue.
+        The limit and page of a paginated request, raised to the client minimums if either is given
         """
         if (page is not None) or (limit is not None):
             limit = (
@@ -385,17 +380,29 @@ class Betting(BaseEndpoint):
                 if page
                 else self.client.page_start_value
             )
+        return limit, page
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/get_active_bet_requests{f'/{limit}/{page}' if page is not None else ''}",
-            authenticated=True,
-        )
+    def get_active_bet_requests(
+        self, limit: int = None, page: int = None
+    ) -> Union[resources.ActiveBetRequests, resources.BaseRequestException]:
+        """
+        Gets active bet requests, taking into account pagination
+        :param limit: Limit the number of active bets returned
+        :param page: The page starting number
+        :return: A ActiveBetRequests resource or an BaseRequestException when BetConnect detects an issue.
+        """
+        return self._call(self._get_active_bet_requests_call(limit, page))
 
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.ActiveBetRequests,
-            elapsed_time=elapsed_time,
+    def _get_active_bet_requests_call(
+        self, limit: Optional[int], page: Optional[int]
+    ) -> Call:
+        limit, page = self._limit_page(limit, page)
+
+        return Call(
+            "GET",
+            f"{self.api_version}/get_active_bet_requests{f'/{limit}/{page}' if page is not None else ''}",
+            resources.ActiveBetRequests,
+            authenticated=True,
         )
 
     def prices(
@@ -413,16 +420,21 @@ class Betting(BaseEndpoint):
         :param handicap: handicap string value (If the market type is a handicap market a handicap is required)
         :return: A List of Price resources
         """
-
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/prices/{fixture_id}/{market_type_id}/{competitor.lower()}{f'/{handicap}' if handicap is not None else ''}"
+        return self._call(
+            self._prices_call(fixture_id, market_type_id, competitor, handicap)
         )
 
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.Price,
-            elapsed_time=elapsed_time,
+    def _prices_call(
+        self,
+        fixture_id: int,
+        market_type_id: int,
+        competitor: str,
+        handicap: Optional[str],
+    ) -> Call:
+        return Call(
+            "GET",
+            f"{self.api_version}/prices/{fixture_id}/{market_type_id}/{competitor.lower()}{f'/{handicap}' if handicap is not None else ''}",
+            resources.Price,
         )
 
     def bet_history(
@@ -440,30 +452,24 @@ class Betting(BaseEndpoint):
         :param page: The page number to start from
         :return: A BetHistoryRequest resource or an BaseRequestException when BetConnect detects an issue.
         """
-        if (page is not None) or (limit is not None):
-            limit = (
-                max(limit, self.client.minimum_limit_value)
-                if limit
-                else self.client.minimum_limit_value
-            )
-            page = (
-                max(page, self.client.page_start_value)
-                if page
-                else self.client.page_start_value
-            )
+        return self._call(self._bet_history_call(status, side, limit, page))
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/bet_history/{str(side.value)}/{self.client.username}/{str(status.value)}{f'/{limit}/{page}'if page is not None else ''}",
+    def _bet_history_call(
+        self,
+        status: enums.BetStatus,
+        side: enums.BetSide,
+        limit: Optional[int],
+        page: Optional[int],
+    ) -> Call:
+        limit, page = self._limit_page(limit, page)
+
+        return Call(
+            "GET",
+            f"{self.api_version}/bet_history/{str(side.value)}/{self.client.username}/{str(status.value)}{f'/{limit}/{page}'if page is not None else ''}",
+            resources.BetHistoryRequest,
             authenticated=True,
         )
 
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.BetHistoryRequest,
-            elapsed_time=elapsed_time,
-        )
-
     def get_viewed_next_page(
         self, bet_request_id: UUID, sport_id: int = None
     ) -> Union[resources.Viewed, resources.BaseRequestException]:
@@ -474,17 +480,17 @@ class Betting(BaseEndpoint):
         :param sport_id: the sport ID
         :return: A Viewed resource or an BaseRequestException when BetConnect detects an issue.
         """
-        self.check_bet_request_id(bet_request_id=bet_request_id)
+        return self._call(self._get_viewed_next_page_call(bet_request_id, sport_id))
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/get_viewed_next_prev/{str(bet_request_id)}{f'/{sport_id}'if sport_id is not None else ''}"
-        )
+    def _get_viewed_next_page_call(
+        self, bet_request_id: UUID, sport_id: Optional[int]
+    ) -> Call:
+        self.check_bet_request_id(bet_request_id=bet_request_id)
 
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.Viewed,
-            elapsed_time=elapsed_time,
+        return Call(
+            "GET",
+            f"{self.api_version}/get_viewed_next_prev/{str(bet_request_id)}{f'/{sport_id}'if sport_id is not None else ''}",
+            resources.Viewed,
         )
 
     def my_bets(
@@ -512,19 +518,33 @@ class Betting(BaseEndpoint):
         :param customer_strategy_ref: The customer strategy ref which has been attached to any bet requests
         :return: A MyBetsBetRequests resource or an BaseRequestException when BetConnect detects an issue.
         """
+        if user_id is None and not self.client.user_id:
+            logger.debug(
+                f"Trying to get your user preferences as no user_id was supplied!"
+            )
+            self.client.account.get_user_preferences()
 
+        return self._call(
+            self._my_bets_call(
+                side, status, user_id, limit, page, get_all, customer_strategy_ref
+            )
+        )
+
+    def _my_bets_call(
+        self,
+        side: enums.BetSide,
+        status: enums.BetRequestStatus,
+        user_id: Optional[str],
+        limit: Optional[int],
+        page: Optional[int],
+        get_all: Optional[str],
+        customer_strategy_ref: Optional[str],
+    ) -> Call:
         if user_id is None:
             if self.client.user_id:
                 user_id = self.client.user_id
             else:
-                logger.debug(
-                    f"Trying to get your user preferences as no user_id was supplied!"
-                )
-                self.client.account.get_user_preferences()
-                if self.client.user_id:
-                    user_id = self.client.user_id
-                else:
-                    raise exceptions.MissingUserPerferences()
+                raise exceptions.MissingUserPerferences()
 
         uri_extension = ""
 
@@ -553,25 +573,199 @@ class Betting(BaseEndpoint):
                 f"/{customer_strategy_ref}" if customer_strategy_ref else ""
             )
 
-        (response, response_json, elapsed_time) = self._request(
-            method_uri=f"{self.api_version}/my_bets/{side.value}/{user_id}/{str(status.value)}{uri_extension}",
+        return Call(
+            "GET",
+            f"{self.api_version}/my_bets/{side.value}/{user_id}/{str(status.value)}{uri_extension}",
+            resources.MyBetsBetRequests
+            if side.value == "back"
+            else resources.MyBetsBets,
             authenticated=True,
         )
 
-        if side.value == "back":
-            return self.process_response(
-                response=response,
-                response_json=response_json,
-                resource=resources.MyBetsBetRequests,
-                elapsed_time=elapsed_time,
+    def iter_my_bets(
+        self,
+        side: enums.BetSide,
+        status: enums.BetRequestStatus,
+        user_id: str = None,
+        limit: int = config.ITER_PAGE_LIMIT_VALUE,
+        page: int = None,
+        customer_strategy_ref: str = None,
+        prefetch: bool = True,
+    ) -> Iterator[Union[resources.MyActiveBet, resources.MyActiveLayBet]]:
+        """
+        Iterates over every bet returned by my_bets, requesting a page at a time until the last page
+        :param side: the side of the bet, enum value BACK and LAY
+        :param status: The bet request status, enum values ACTIVE and SETTLED
+        :param user_id: The user_id, optional will try to get this from the user preference which is called on login.
+        :param limit: The number of bets requested per page
+        :param page: The page to start from, default the first page
+        :param customer_strategy_ref: The customer strategy ref which has been attached to any bet requests
+        :param prefetch: Request the next page while the current page is being consumed
+        :return: Iterator of MyActiveBet (BACK) or MyActiveLayBet (LAY) resources
+        """
+        return self._iter_pages(
+            lambda p: self.my_bets(
+                side=side,
+                status=status,
+                user_id=user_id,
+                limit=limit,
+                page=p,
+                customer_strategy_ref=customer_strategy_ref,
+            ),
+            page=page if page is not None else self.client.page_start_value,
+            prefetch=prefetch,
+        )
+
+    def iter_bet_history(
+        self,
+        status: enums.BetStatus,
+        side: enums.BetSide,
+        limit: int = config.ITER_PAGE_LIMIT_VALUE,
+        page: int = None,
+        prefetch: bool = True,
+    ) -> Iterator[resources.BetHistory]:
+        """
+        Iterates over every bet returned by bet_history, requesting a page at a time until the last page
+        :param status: The status of the bet
+        :param side: BetSide enum - either back or lay
+        :param limit: The number of bets requested per page
+        :param page: The page to start from, default the first page
+        :param prefetch: Request the next page while the current page is being consumed
+        :return: Iterator of BetHistory resources
+        """
+        return self._iter_pages(
+            lambda p: self.bet_history(status=status, side=side, limit=limit, page=p),
+            page=page if page is not None else self.client.page_start_value,
+            prefetch=prefetch,
+        )
+
+    def iter_active_bet_requests(
+        self,
+        limit: int = config.ITER_PAGE_LIMIT_VALUE,
+        page: int = None,
+        prefetch: bool = True,
+    ) -> Iterator[resources.ActiveBet]:
+        """
+        Iterates over every bet returned by get_active_bet_requests, requesting a page at a time until the last page
+        :param limit: The number of bets requested per page
+        :param page: The page to start from, default the first page
+        :param prefetch: Request the next page while the current page is being consumed
+        :return: Iterator of ActiveBet resources
+        """
+        return self._iter_pages(
+            lambda p: self.get_active_bet_requests(limit=limit, page=p),
+            page=page if page is not None else self.client.page_start_value,
+            prefetch=prefetch,
+        )
+
+    def export_bet_history(
+        self,
+        status: enums.BetStatus,
+        side: enums.BetSide,
+        limit: int = config.ITER_PAGE_LIMIT_VALUE,
+        max_workers: int = config.EXPORT_MAX_WORKERS,
+        requests_per_second: Optional[float] = None,
+    ) -> List[resources.BetHistory]:
+        """
+        Bulk export of bet history. The first page is requested to find the last page, the remaining pages are then
+        requested concurrently and reassembled in page order. Bets are deduplicated by bet_request_id as rows can
+        shift between pages whilst the export is running.
+        :param status: The status of the bet
+        :param side: BetSide enum - either back or lay
+        :param limit: The number of bets requested per page
+        :param max_workers: The maximum number of page requests in flight at once
+        :param requests_per_second: Optional cap on the rate page requests are sent
+        :return: List of BetHistory resources
+        """
+
+        def request_page(p: int) -> resources.BetHistoryRequest:
+            return self._check_page(
+                self.bet_history(status=status, side=side, limit=limit, page=p), p
             )
-        else:
-            return self.process_response(
-                response=response,
-                response_json=response_json,
-                resource=resources.MyBetsBets,
-                elapsed_time=elapsed_time,
+
+        first_page = request_page(self.client.page_start_value)
+        pages = [first_page]
+        interval = 1 / requests_per_second if requests_per_second else 0
+        next_send = time.monotonic() + interval
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for p in range(self.client.page_start_value + 1, first_page.last_page + 1):
+                if interval:
+                    time.sleep(max(0.0, next_send - time.monotonic()))
+                    next_send = max(next_send, time.monotonic()) + interval
+                # timeout overrides and record_timings apply to every page
+                futures.append(
+                    executor.submit(contextvars.copy_context().run, request_page, p)
+                )
+            pages.extend(f.result() for f in futures)
+        return self._merge_pages(pages)
+
+    @staticmethod
+    def _check_page(response, page: int):
+        if isinstance(response, resources.BaseRequestException):
+            raise exceptions.PageRequestException(
+                page=page,
+                message=response.message,
+                status_code=response.status_code,
+                url=response.request_url,
+            )
+        return response
+
+    @staticmethod
+    def _merge_pages(pages: list) -> list:
+        """
+        Joins the bets of each page in order, dropping any bet_request_id already seen on an earlier page
+        :param pages: list of paginated resources in page order
+        :return: list of bet resources
+        """
+        seen = set()
+        bets = []
+        for page in pages:
+            for bet in page.bets:
+                if bet.bet_request_id not in seen:
+                    seen.add(bet.bet_request_id)
+                    bets.append(bet)
+        duplicates = sum(len(page.bets) for page in pages) - len(bets)
+        if duplicates:
+            logger.info(f"Removed {duplicates} duplicate bets shifted between pages")
+        if pages and len(bets) < pages[-1].total_bets:
+            logger.warning(
+                f"Exported {len(bets)} bets, expected {pages[-1].total_bets}. Bets may have shifted between pages"
             )
+        return bets
+
+    @staticmethod
+    def _iter_pages(
+        request_page: Callable, page: int, prefetch: bool
+    ) -> Iterator[BaseResource]:
+        """
+        Yields the bets of each page, holding at most the current page and the prefetched next page in memory
+        :param request_page: function returning the paginated resource for a page number
+        :param page: The page to start from
+        :param prefetch: Request the next page in a background thread while the current page is being consumed
+        :return: Iterator of bet resources
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            response = request_page(page)
+            while True:
+                Betting._check_page(response, page)
+                last_page = page >= response.last_page
+                next_page = (
+                    executor.submit(
+                        contextvars.copy_context().run, request_page, page + 1
+                    )
+                    if executor and not last_page
+                    else None
+                )
+                yield from response.bets
+                if last_page:
+                    return
+                page += 1
+                response = next_page.result() if next_page else request_page(page)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
 
     def lock_bet(
         self, bet_request_id: UUID, bet_status_id: int, allocated_stake: int
@@ -586,17 +780,21 @@ class Betting(BaseEndpoint):
         """
         raise NotImplementedError
 
-        (response, response_json, elapsed_time) = self._put(
-            method_uri=f"{self.api_version}/lock_bet",
+        return self._call(
+            self._lock_bet_call(bet_request_id, bet_status_id, allocated_stake)
+        )
+
+    def _lock_bet_call(
+        self, bet_request_id: UUID, bet_status_id: int, allocated_stake: int
+    ) -> Call:
+        return Call(
+            "PUT",
+            f"{self.api_version}/lock_bet",
+            resources.LockBet,
             data={
                 "bet_request_id": str(bet_request_id),
                 "bet_status_id": bet_status_id,
                 "allocated_stake": allocated_stake,
             },
-        )
-        return self.process_response(
-            response=response,
-            response_json=response_json,
-            resource=resources.LockBet,
-            elapsed_time=elapsed_time,
+            authenticated=True,
         )
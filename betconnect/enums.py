@@ -38,3 +38,20 @@ class BetStatus(Enum):
     MATCHED = "matched"
     MATCHED_MORE = "matched_more"
     EXPIRED = "expired"
+
+
+class JSONDecoder(Enum):
+    STDLIB = "stdlib"
+    ORJSON = "orjson"
+    MSGSPEC = "msgspec"
+
+
+class ResourceMode(Enum):
+    PYDANTIC = "pydantic"
+    LITE = "lite"
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
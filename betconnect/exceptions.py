@@ -173,6 +173,25 @@ class BetRequestInvalidCustomerStrategyRefFormatException(BetConnectException):
         return f"The supplied customer_strategy_ref does not match the required length of {config.MIN_CUSTOMER_STRATEGY_REF_LENGTH}->{config.MAX_CUSTOMER_STRATEGY_REF_LENGTH}"
 
 
+class PageRequestException(BetConnectException):
+    def __init__(self, page: int, message: str, status_code: int, url: str):
+        """
+        Raised when BetConnect returns an error for a page while iterating over a paginated endpoint
+        :param page: the page number requested
+        :param message: the BetConnect error message
+        :param status_code: the response status code
+        :param url: the request url
+        """
+        super(PageRequestException, self).__init__(page, message, status_code, url)
+        self.page = page
+        self.message = message
+        self.status_code = status_code
+        self.url = url
+
+    def __str__(self) -> str:
+        return f"Request for page {self.page} failed with status code ({self.status_code}) for request: {self.url}, message: {self.message}"
+
+
 class APIError(BetConnectException):
     """
     Exception raised if error is found.
@@ -194,3 +213,46 @@ class APIError(BetConnectException):
         else:
             message = "%s \nParams: %s \nException: %s" % (uri, params, exception)
         super(APIError, self).__init__(message)
+
+
+class RequestTimeout(APIError):
+    def __init__(
+        self,
+        phase: str,
+        timeout: float,
+        uri: str,
+        params: dict = None,
+        exception: Exception = None,
+    ):
+        """
+        Raised when a request times out, an APIError so existing handlers still catch it
+        :param phase: the phase that timed out, connect or read
+        :param timeout: the timeout (secs) of the phase
+        :param uri: the request uri
+        :param params: the request params / data
+        :param exception: the underlying timeout exception
+        """
+        super(RequestTimeout, self).__init__(None, uri, params, exception)
+        self.phase = phase
+        self.timeout = timeout
+        self.uri = uri
+
+    def __str__(self) -> str:
+        return f"{self.phase.capitalize()} timeout ({self.timeout}s) for request: {self.uri}"
+
+
+class CircuitBreakerOpen(APIError):
+    def __init__(self, endpoint: str, retry_in: float):
+        """
+        Raised without sending the request while the endpoints circuit breaker is open
+        :param endpoint: the endpoint name
+        :param retry_in: secs until a probe request is let through
+        """
+        super(CircuitBreakerOpen, self).__init__(None, endpoint)
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+    def __str__(self) -> str:
+        return (
+            f"Circuit breaker open for {self.endpoint}, retry in {self.retry_in:.1f}s"
+        )
@@ -0,0 +1,148 @@
+import logging
+import threading
+import weakref
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Iterable
+from betconnect import config
+
+logger = logging.getLogger(__name__)
+
+
+class HedgePolicy:
+    def __init__(
+        self,
+        endpoints: Iterable[str] = config.HEDGE_ENDPOINTS,
+        percentile: float = config.HEDGE_PERCENTILE,
+        initial_delay: float = config.HEDGE_INITIAL_DELAY_SECS,
+        min_delay: float = config.HEDGE_MIN_DELAY_SECS,
+        budget: float = config.HEDGE_BUDGET,
+        window: int = config.HEDGE_LATENCY_WINDOW,
+        min_samples: int = config.HEDGE_MIN_SAMPLES,
+        read_endpoints: Iterable[str] = config.RETRY_READ_ENDPOINTS,
+        workers_per_caller: int = config.HEDGE_WORKERS_PER_CALLER,
+    ):
+        """
+        Hedges latency critical reads, if a request has not returned after the endpoints percentile latency a
+        duplicate is sent on another pooled connection and the first response wins. Only GETs and POSTs that only
+        read (read_endpoints) are hedged, never order actions. The extra load is capped by budget.
+        :param endpoints: endpoint names hedged
+        :param percentile: latency percentile (0-100) of recent requests after which the hedge is sent
+        :param initial_delay: hedge delay secs until min_samples latencies have been recorded
+        :param min_delay: min hedge delay secs
+        :param budget: max hedges as a fraction of hedgeable requests, e.g. 0.05 for 5%
+        :param window: latencies kept per endpoint
+        :param min_samples: latencies recorded before the percentile is used
+        :param read_endpoints: endpoint names sent as a POST that only read and are safe to hedge
+        :param workers_per_caller: threads sending hedged requests for each thread calling the APIClient, a request
+            and its hedge never queue behind other callers requests
+        """
+        self.endpoints = frozenset(endpoints)
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.budget = budget
+        self.min_samples = min_samples
+        self.read_endpoints = frozenset(read_endpoints)
+        self.workers_per_caller = workers_per_caller
+        self.latencies: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+        self.requests: Dict[str, int] = defaultdict(int)
+        self.hedges: Dict[str, int] = defaultdict(int)
+        self.wins: Dict[str, int] = defaultdict(int)
+        self._local = threading.local()
+        self._executors: "weakref.WeakSet[ThreadPoolExecutor]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        The calling threads executor, released with the thread
+        """
+        executor = getattr(self._local, "executor", None)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=self.workers_per_caller,
+                thread_name_prefix="betconnect-hedge",
+            )
+            self._local.executor = executor
+            with self._lock:
+                self._executors.add(executor)
+        return executor
+
+    def close(self) -> None:
+        """
+        Shuts down the executors used by the APIClient, without waiting for in flight requests
+        """
+        with self._lock:
+            executors = list(self._executors)
+            self._executors.clear()
+            self._local = threading.local()
+        for executor in executors:
+            executor.shutdown(wait=False)
+
+    def can_hedge(self, method: str, endpoint: str) -> bool:
+        """
+        Whether a request can be hedged
+        :param method: HTTP method
+        :param endpoint: endpoint name, e.g. selections_for_market
+        """
+        return endpoint in self.endpoints and (
+            method == "GET" or endpoint in self.read_endpoints
+        )
+
+    def delay(self, endpoint: str) -> float:
+        """
+        Secs to wait on the first request before sending the hedge, the percentile of recent latencies
+        :param endpoint: endpoint name
+        """
+        with self._lock:
+            latencies = sorted(self.latencies[endpoint])
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+        index = min(int(len(latencies) * self.percentile / 100), len(latencies) - 1)
+        return max(latencies[index], self.min_delay)
+
+    def acquire(self, endpoint: str) -> bool:
+        """
+        Takes a hedge from the budget
+        :param endpoint: endpoint name
+        :return: True if the hedge can be sent
+        """
+        with self._lock:
+            requests = sum(self.requests.values())
+            hedges = sum(self.hedges.values())
+            if hedges + 1 > requests * self.budget:
+                return False
+            self.hedges[endpoint] += 1
+        logger.debug(f"Hedging {endpoint}")
+        return True
+
+    def record(self, endpoint: str, elapsed_time: float, hedge_won: bool) -> None:
+        """
+        Records the latency of a hedgeable request
+        :param endpoint: endpoint name
+        :param elapsed_time: secs until the first response
+        :param hedge_won: True if the hedge responded first
+        """
+        with self._lock:
+            self.requests[endpoint] += 1
+            self.latencies[endpoint].append(elapsed_time)
+            if hedge_won:
+                self.wins[endpoint] += 1
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Hedgeable requests, hedges sent and hedges responding first per endpoint
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": self.requests[endpoint],
+                    "hedges": self.hedges[endpoint],
+                    "wins": self.wins[endpoint],
+                }
+                for endpoint in self.requests
+            }
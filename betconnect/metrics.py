@@ -0,0 +1,237 @@
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+from betconnect import config
+
+# 16 sub buckets per power of two, values are recorded within 6.25%
+_SUB_BUCKETS = 16
+_SUB_BUCKET_BITS = 4
+# microseconds, 2 ** 31 us is ~35 minutes
+_MAX_VALUE = 2**31 - 1
+_BUCKETS = 2 * _SUB_BUCKETS + (31 - _SUB_BUCKET_BITS - 1) * _SUB_BUCKETS
+
+
+def _bucket_index(value: int) -> int:
+    if value < 2 * _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    return (
+        2 * _SUB_BUCKETS + (shift - 1) * _SUB_BUCKETS + (value >> shift) - _SUB_BUCKETS
+    )
+
+
+def _bucket_upper(index: int) -> int:
+    if index < 2 * _SUB_BUCKETS:
+        return index
+    shift, sub = divmod(index - 2 * _SUB_BUCKETS, _SUB_BUCKETS)
+    return ((sub + _SUB_BUCKETS + 1) << (shift + 1)) - 1
+
+
+class Histogram:
+    def __init__(self):
+        """
+        Fixed memory log-linear (HDR style) histogram of durations in secs, recorded with microsecond resolution to
+        within 6.25% up to ~35 minutes. Not thread safe, guarded by the MetricsRegistry lock.
+        """
+        self.counts: List[int] = [0] * _BUCKETS
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """
+        :param value: duration secs
+        """
+        self.counts[_bucket_index(min(max(int(value * 1e6), 0), _MAX_VALUE))] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :param percentile: 0-100
+        :return: the highest value (secs) within the bucket holding the percentile, 0 if empty
+        """
+        if self.count == 0:
+            return 0.0
+        target = max(self.count * percentile / 100, 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(_bucket_upper(index) / 1e6, self.max)
+        return self.max
+
+    def summary(self, percentiles: Iterable[float]) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "max": self.max,
+            **{f"p{p:g}": self.percentile(p) for p in percentiles},
+        }
+
+
+class _EndpointMetrics:
+    __slots__ = (
+        "latency",
+        "decode",
+        "parse",
+        "status_codes",
+        "bytes",
+        "retries",
+        "timeouts",
+        "errors",
+    )
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.decode = Histogram()
+        self.parse = Histogram()
+        self.status_codes: Dict[int, int] = defaultdict(int)
+        self.bytes = 0
+        self.retries = 0
+        self.timeouts: Dict[str, int] = defaultdict(int)
+        self.errors = 0
+
+
+class MetricsRegistry:
+    def __init__(self, percentiles: Iterable[float] = config.METRICS_PERCENTILES):
+        """
+        Request metrics per endpoint, network latency, json decode and resource parse time histograms kept separate,
+        status code counts, bytes received, retries, timeouts and connection errors. Thread and asyncio safe.
+        :param percentiles: latency percentiles (0-100) reported by snapshot and prometheus
+        """
+        self.percentiles = tuple(percentiles)
+        self._endpoints: Dict[str, _EndpointMetrics] = defaultdict(_EndpointMetrics)
+        self._lock = threading.Lock()
+
+    def record_request(
+        self, endpoint: str, status_code: int, elapsed_time: float, size: int
+    ) -> None:
+        """
+        :param endpoint: endpoint name, e.g. selections_for_market
+        :param status_code: response status code
+        :param elapsed_time: secs from sending the request to the response being read
+        :param size: bytes received
+        """
+        with self._lock:
+            metrics = self._endpoints[endpoint]
+            metrics.latency.record(elapsed_time)
+            metrics.status_codes[status_code] += 1
+            metrics.bytes += size
+
+    def record_decode(self, endpoint: str, decode_time: float) -> None:
+        """
+        :param endpoint: endpoint name
+        :param decode_time: secs decoding the json response
+        """
+        with self._lock:
+            self._endpoints[endpoint].decode.record(decode_time)
+
+    def record_parse(self, endpoint: str, parse_time: float) -> None:
+        """
+        :param endpoint: endpoint name
+        :param parse_time: secs building resources from the decoded response
+        """
+        with self._lock:
+            self._endpoints[endpoint].parse.record(parse_time)
+
+    def record_retry(self, endpoint: str) -> None:
+        with self._lock:
+            self._endpoints[endpoint].retries += 1
+
+    def record_error(self, endpoint: str, timeout_phase: Optional[str] = None) -> None:
+        """
+        Records a request that failed without a response
+        :param endpoint: endpoint name
+        :param timeout_phase: connect or read if the request timed out
+        """
+        with self._lock:
+            metrics = self._endpoints[endpoint]
+            if timeout_phase is None:
+                metrics.errors += 1
+            else:
+                metrics.timeouts[timeout_phase] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Metrics per endpoint, latency / decode / parse summaries (count, mean, max and percentiles in secs), status
+        code counts, bytes, retries, timeouts per phase and errors
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "latency": metrics.latency.summary(self.percentiles),
+                    "decode": metrics.decode.summary(self.percentiles),
+                    "parse": metrics.parse.summary(self.percentiles),
+                    "status_codes": dict(metrics.status_codes),
+                    "bytes": metrics.bytes,
+                    "retries": metrics.retries,
+                    "timeouts": dict(metrics.timeouts),
+                    "errors": metrics.errors,
+                }
+                for endpoint, metrics in self._endpoints.items()
+            }
+
+    def prometheus(self, prefix: str = "betconnect") -> str:
+        """
+        The metrics in the Prometheus text exposition format, histograms as summaries with the registry percentiles
+        as quantiles. Serve from an existing http endpoint or write to a node exporter textfile.
+        :param prefix: metric name prefix
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for name, help_text in (
+            ("latency", "Request network latency"),
+            ("decode", "Response json decode time"),
+            ("parse", "Response resource parse time"),
+        ):
+            metric = f"{prefix}_{name}_seconds"
+            lines.append(f"# HELP {metric} {help_text} in seconds")
+            lines.append(f"# TYPE {metric} summary")
+            for endpoint, metrics in snapshot.items():
+                summary = metrics[name]
+                for p in self.percentiles:
+                    lines.append(
+                        f'{metric}{{endpoint="{endpoint}",quantile="{p / 100:g}"}} {summary[f"p{p:g}"]}'
+                    )
+                lines.append(f'{metric}_sum{{endpoint="{endpoint}"}} {summary["sum"]}')
+                lines.append(
+                    f'{metric}_count{{endpoint="{endpoint}"}} {summary["count"]}'
+                )
+        for name, help_text, values in (
+            (
+                "responses_total",
+                "Responses by status code",
+                lambda m: (
+                    (f'status_code="{code}"', count)
+                    for code, count in m["status_codes"].items()
+                ),
+            ),
+            ("response_bytes_total", "Bytes received", lambda m: (("", m["bytes"]),)),
+            ("retries_total", "Requests retried", lambda m: (("", m["retries"]),)),
+            (
+                "timeouts_total",
+                "Requests timed out by phase",
+                lambda m: ((f'phase="{p}"', c) for p, c in m["timeouts"].items()),
+            ),
+            (
+                "errors_total",
+                "Requests failed without a response",
+                lambda m: (("", m["errors"]),),
+            ),
+        ):
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for endpoint, metrics in snapshot.items():
+                for labels, value in values(metrics):
+                    labels = f",{labels}" if labels else ""
+                    lines.append(f'{metric}{{endpoint="{endpoint}"{labels}}} {value}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,77 @@
+from typing import Any, Dict, Optional
+from betconnect.timeouts import Timeout
+
+
+class RequestContext:
+    """
+    A single attempt of a request passed through the client middleware. params, data, uri and timeout can be
+    changed by before_send hooks, state is free for middleware to share values between hooks.
+    """
+
+    __slots__ = (
+        "endpoint",
+        "method",
+        "uri",
+        "params",
+        "data",
+        "timeout",
+        "attempt",
+        "state",
+    )
+
+    def __init__(
+        self,
+        endpoint: str,
+        method: str,
+        uri: str,
+        params: Optional[dict],
+        data: Optional[dict],
+        timeout: Timeout,
+        attempt: int,
+    ):
+        self.endpoint = endpoint
+        self.method = method
+        self.uri = uri
+        self.params = params
+        self.data = data
+        self.timeout = timeout
+        self.attempt = attempt
+        self.state: Dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"<RequestContext {self.method} {self.endpoint} attempt={self.attempt}>"
+
+
+class Middleware:
+    """
+    Hooks around each request attempt sent by the endpoints (_request, _post, _patch and _put), override any of
+    them. before_send hooks are called in the order the middleware is added, after_receive and on_error in reverse.
+    Hooks may be coroutines on the AsyncAPIClient, the APIClient only calls them synchronously.
+    """
+
+    def before_send(self, context: RequestContext) -> Optional[Any]:
+        """
+        Called before the request is sent
+        :param context: the request attempt
+        :return: None to send the request, or a response to use instead (cache, replay), skipping later
+        before_send hooks and the send
+        """
+        return None
+
+    def after_receive(self, context: RequestContext, response: Any) -> Any:
+        """
+        Called with every response, including those returned by before_send or on_error
+        :param context: the request attempt
+        :param response: requests.Response or AsyncResponse
+        :return: the response, or a replacement
+        """
+        return response
+
+    def on_error(self, context: RequestContext, exception: Exception) -> Optional[Any]:
+        """
+        Called when sending the request raised
+        :param context: the request attempt
+        :param exception: the exception raised
+        :return: None to raise the exception (retried as usual), or a response to recover with
+        """
+        return None
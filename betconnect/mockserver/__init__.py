@@ -0,0 +1,10 @@
+from .server import (
+    MockServer,
+    Fault,
+    ROUTES,
+    AUTHENTICATED,
+    RESPONSES_DIR,
+    uniform,
+    lognormal,
+    main,
+)
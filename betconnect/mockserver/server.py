@@ -0,0 +1,419 @@
+"""
+Local asyncio http server standing in for BetConnect, serving recorded responses for every Betting and Account
+route with configurable latency, injected faults (429 / 5xx, stalls and dropped connections) and optional token
+expiry. Used by the tests and for load / latency benchmarks without the network.
+
+    python -m betconnect.mockserver --port 8080 --latency 0.02 --sigma 0.5 --error-rate 0.01 --token-ttl 60
+
+and point a client at it with client.uri = "http://127.0.0.1:8080/"
+"""
+import argparse
+import asyncio
+import gzip
+import itertools
+import json
+import math
+import os
+import random
+import threading
+from collections import Counter
+from http import HTTPStatus
+from typing import Callable, Dict, List, Optional, Set, Union
+from urllib.parse import urlsplit
+
+API_VERSION = "api/v2"
+# recorded responses, package data
+RESPONSES_DIR = os.path.join(os.path.dirname(__file__), "responses")
+
+# (method, endpoint name) to the recorded response served, relative to RESPONSES_DIR
+ROUTES = {
+    ("POST", "login"): "account/mock_account_login_response_success.json",
+    ("POST", "logout"): "account/mock_account_logout_response.json",
+    ("POST", "status"): "account/mock_refresh_session_token_response.json",
+    ("GET", "get_user_preferences"): "account/mock_get_user_preferences_response.json",
+    ("GET", "get_balance"): "account/mock_get_balance_response.json",
+    ("GET", "active_bookmakers"): "betting/active_bookmakers_response.json",
+    ("GET", "active_sports"): "betting/active_sports_response.json",
+    ("GET", "active_regions"): "betting/active_regions_response.json",
+    ("GET", "active_competitions"): "betting/active_competitions_response.json",
+    ("GET", "active_fixtures"): "betting/active_fixtures_response.json",
+    ("GET", "active_market_types"): "betting/active_market_types_response.json",
+    ("GET", "active_markets"): "betting/active_markets_response.json",
+    ("GET", "active_selections"): "betting/active_selections_response.json",
+    ("GET", "selections_for_market"): "betting/selections_for_market_response.json",
+    ("GET", "prices"): "betting/prices_response.json",
+    ("GET", "get_active_bet_requests"): "betting/get_active_bet_requests_response.json",
+    ("GET", "bet_history"): "betting/bet_history_response.json",
+    ("GET", "my_bets"): "betting/my_bets_response.json",
+    ("GET", "get_viewed_next_prev"): "betting/get_viewed_next_page_response.json",
+    ("POST", "bet_request_create"): "betting/bet_request_create_response.json",
+    ("POST", "bet_request_get"): "betting/bet_request_get_response.json",
+    ("POST", "bet_request_stop"): "betting/bet_request_stop_response.json",
+    ("PATCH", "bet_request_match"): "betting/bet_request_match_response.json",
+    ("PATCH", "bet_request_match_more"): "betting/bet_request_match_more_response.json",
+}
+# endpoints requiring a token issued by the server when token_ttl is set
+AUTHENTICATED = {
+    "logout",
+    "status",
+    "get_user_preferences",
+    "get_balance",
+    "active_bookmakers",
+    "get_active_bet_requests",
+    "bet_history",
+    "my_bets",
+    "bet_request_create",
+    "bet_request_get",
+    "bet_request_stop",
+    "bet_request_match",
+    "bet_request_match_more",
+}
+# secs, kept in flight for a while so concurrent callers overlap
+DEFAULT_LATENCY = {"login": 0.05, "status": 0.05}
+
+# secs to wait before responding, drawn from the servers random.Random
+Latency = Union[float, Callable[[random.Random], float]]
+
+
+def uniform(low: float, high: float) -> Callable[[random.Random], float]:
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float) -> Callable[[random.Random], float]:
+    """
+    Long tailed latency, e.g. lognormal(0.02, 0.5) has a p99 of ~64ms
+    """
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+class Fault:
+    """
+    A failure injected into requests for an endpoint (all endpoints if None): a stall holding the request before it is
+    answered (client read timeout), then a status code response with an optional Retry-After, a dropped connection
+    or, with neither, the normal response. Applied to rate of the matching requests, times requests in total if
+    given.
+    """
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        stall: Optional[float] = None,
+        drop: bool = False,
+        rate: float = 1.0,
+        times: Optional[int] = None,
+    ):
+        self.endpoint = endpoint
+        self.status = status
+        self.retry_after = retry_after
+        self.stall = stall
+        self.drop = drop
+        self.rate = rate
+        self.remaining = times
+
+    def applies(self, endpoint: str, rng: random.Random) -> bool:
+        if self.endpoint is not None and self.endpoint != endpoint:
+            return False
+        if self.remaining == 0 or rng.random() >= self.rate:
+            return False
+        if self.remaining is not None:
+            self.remaining -= 1
+        return True
+
+
+class MockServer:
+    """
+    Local asyncio http server serving the recorded endpoint responses, run in a background thread by start() or in
+    the current event loop with open() / close(). Counts requests by (method, path), connections, responses by status
+    code and the peak number of requests in flight.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Optional[Dict[str, Latency]] = None,
+        token_ttl: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        :param host: interface to listen on
+        :param port: port to listen on, 0 for a free port
+        :param latency: endpoint name ("*" for the default) to secs or a latency distribution, e.g. lognormal
+        :param token_ttl: secs tokens issued by login / status are valid, authenticated endpoints respond 401 without
+        a valid token. None (default) accepts any token.
+        :param seed: seed of the random.Random drawing latencies and faults
+        """
+        self.host = host
+        self.port = port
+        self.latency: Dict[str, Latency] = {**DEFAULT_LATENCY, **(latency or {})}
+        self.token_ttl = token_ttl
+        self.random = random.Random(seed)
+        self.faults: List[Fault] = []
+        self.requests = Counter()
+        self.statuses = Counter()
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._tokens: Dict[str, float] = {}
+        self._token_ids = itertools.count(1)
+        self._content = {
+            route: _load(os.path.join(RESPONSES_DIR, response))
+            for route, response in ROUTES.items()
+        }
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed: Optional[asyncio.Event] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def uri(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def inject(self, *args, **kwargs) -> Fault:
+        """
+        Adds a Fault, e.g. inject("prices", status=503, rate=0.1) or inject(stall=5, times=1)
+        """
+        fault = Fault(*args, **kwargs)
+        self.faults.append(fault)
+        return fault
+
+    def expire_tokens(self) -> None:
+        """
+        Expires every token issued
+        """
+        self._tokens.clear()
+
+    async def open(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        self._server.close()
+        # keep-alive connections are not closed by the server
+        for writer in list(self._writers):
+            writer.transport.abort()
+        await self._server.wait_closed()
+
+    def start(self) -> None:
+        """
+        Serves in a background thread until stop()
+        """
+        ready = threading.Event()
+
+        async def run() -> None:
+            self._loop = asyncio.get_running_loop()
+            self._closed = asyncio.Event()
+            await self.open()
+            ready.set()
+            await self._closed.wait()
+            await self.close()
+
+        self._thread = threading.Thread(target=asyncio.run, args=(run(),), daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._closed.set)
+        self._thread.join()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                request_line, *lines = head.decode("latin-1").rstrip().split("\r\n")
+                method, target, _ = request_line.split(" ", 2)
+                headers = {}
+                for line in lines:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length:
+                    await reader.readexactly(length)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    keep_alive &= await self._respond(
+                        writer, method, urlsplit(target).path, headers
+                    )
+                finally:
+                    self.in_flight -= 1
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        path: str,
+        headers: Dict[str, str],
+    ) -> bool:
+        """
+        :return: False if the connection is to be closed
+        """
+        self.requests[(method, path)] += 1
+        endpoint = path.split(f"/{API_VERSION}/", 1)[-1].split("/", 1)[0]
+
+        latency = self.latency.get(endpoint, self.latency.get("*", 0))
+        delay = latency if isinstance(latency, (int, float)) else latency(self.random)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        for fault in self.faults:
+            if fault.applies(endpoint, self.random):
+                if fault.stall is not None:
+                    await asyncio.sleep(fault.stall)
+                if fault.drop:
+                    writer.transport.abort()
+                    return False
+                if fault.status is None:
+                    # stalled only, answered as normal
+                    break
+                extra = {}
+                if fault.retry_after is not None:
+                    extra["Retry-After"] = f"{fault.retry_after:g}"
+                return await self._write(
+                    writer,
+                    headers,
+                    fault.status,
+                    {"message": HTTPStatus(fault.status).phrase},
+                    extra,
+                )
+
+        if method == "HEAD":
+            return await self._write(writer, headers, 200, None)
+        content = self._content.get((method, endpoint))
+        if content is None:
+            return await self._write(writer, headers, 404, {"message": "Not Found"})
+        if self.token_ttl is not None:
+            if endpoint == "login":
+                if "authorization" not in headers:
+                    return await self._write(
+                        writer,
+                        headers,
+                        401,
+                        {"message": "Could not verify Username and Password."},
+                    )
+            elif endpoint in AUTHENTICATED and not self._valid_token(
+                headers.get("x-auth-token")
+            ):
+                return await self._write(
+                    writer, headers, 401, {"message": "Token has expired"}
+                )
+        if endpoint == "login":
+            content = {"message": "OK: Authorized", "data": {"token": self._issue()}}
+        elif endpoint == "status":
+            content = {
+                "message": "OK: Authorized",
+                "data": {"refresh_token": self._issue()},
+            }
+        elif endpoint == "logout":
+            self._tokens.pop(headers.get("x-auth-token"), None)
+        return await self._write(writer, headers, 200, content)
+
+    def _issue(self) -> str:
+        token = f"mock-token-{next(self._token_ids)}"
+        if self.token_ttl is not None:
+            self._tokens[token] = self._now() + self.token_ttl
+        return token
+
+    def _valid_token(self, token: Optional[str]) -> bool:
+        expiry = self._tokens.get(token)
+        return expiry is not None and self._now() < expiry
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    async def _write(
+        self,
+        writer: asyncio.StreamWriter,
+        headers: Dict[str, str],
+        status: int,
+        content: Union[bytes, dict, None],
+        extra: Dict[str, str] = None,
+    ) -> bool:
+        self.statuses[status] += 1
+        response_headers = [(k, v) for k, v in (extra or {}).items()]
+        if content is None:
+            body = b""
+        else:
+            body = (
+                content if isinstance(content, bytes) else json.dumps(content).encode()
+            )
+            response_headers.append(("Content-Type", "application/json; charset=utf-8"))
+            if "gzip" in headers.get("accept-encoding", ""):
+                body = gzip.compress(body)
+                response_headers.append(("Content-Encoding", "gzip"))
+        response_headers.append(("Content-Length", str(len(body))))
+        head = f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in response_headers
+        )
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+        await writer.drain()
+        return True
+
+
+def _load(path: str) -> bytes:
+    # re-encoded compactly
+    with open(path, "r") as f:
+        return json.dumps(json.load(f)).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="median latency secs"
+    )
+    parser.add_argument(
+        "--sigma", type=float, default=0.0, help="lognormal latency sigma, 0 is fixed"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="fraction of 503 responses"
+    )
+    parser.add_argument("--token-ttl", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    latency: Latency = args.latency
+    if args.latency and args.sigma:
+        latency = lognormal(args.latency, args.sigma)
+    server = MockServer(
+        args.host,
+        args.port,
+        latency={"*": latency},
+        token_ttl=args.token_ttl,
+        seed=args.seed,
+    )
+    if args.error_rate:
+        server.inject(status=503, rate=args.error_rate)
+
+    async def run() -> None:
+        await server.open()
+        print(f"Serving on {server.uri}")
+        await server._server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple
+from betconnect import config
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Thread and asyncio safe token bucket. Priority callers are served before any other caller takes a token.
+        :param rate: tokens (requests) added per second
+        :param capacity: max tokens held, the burst size. Defaults to rate
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._priority_waiting = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, priority: bool = False) -> float:
+        """
+        Takes a token, sleeping until one is available
+        :param priority: Served before callers without priority
+        :return: seconds waited
+        """
+        start = None
+        waiting = False
+        try:
+            while True:
+                delay, waiting = self._take(priority, waiting)
+                if delay == 0:
+                    return 0 if start is None else time.monotonic() - start
+                if start is None:
+                    start = time.monotonic()
+                time.sleep(delay)
+        finally:
+            if waiting:
+                self._stop_waiting()
+
+    async def acquire_async(self, priority: bool = False) -> float:
+        """
+        Takes a token, sleeping the task until one is available
+        :param priority: Served before callers without priority
+        :return: seconds waited
+        """
+        start = None
+        waiting = False
+        try:
+            while True:
+                delay, waiting = self._take(priority, waiting)
+                if delay == 0:
+                    return 0 if start is None else time.monotonic() - start
+                if start is None:
+                    start = time.monotonic()
+                await asyncio.sleep(delay)
+        finally:
+            if waiting:
+                self._stop_waiting()
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _take(self, priority: bool, waiting: bool) -> Tuple[float, bool]:
+        """
+        Takes a token if one is available and no priority caller is waiting for it
+        :return: tuple of the seconds until a token is expected (0 if taken) and whether a priority caller is
+        now registered as waiting
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1 and (priority or not self._priority_waiting):
+                self._tokens -= 1
+                return 0, waiting
+            if priority and not waiting:
+                self._priority_waiting += 1
+                waiting = True
+            if self._tokens >= 1:
+                # token held back for a waiting priority caller, check again after it is expected to be taken
+                return 1 / self.rate, waiting
+            return (1 - self._tokens) / self.rate, waiting
+
+    def _stop_waiting(self) -> None:
+        with self._lock:
+            self._priority_waiting -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        limits: Dict[str, Tuple[float, float]] = None,
+        families: Dict[str, str] = None,
+        global_limit: Optional[Tuple[float, float]] = config.RATE_LIMIT_GLOBAL,
+        priority_endpoints: Iterable[str] = config.RATE_LIMIT_PRIORITY_ENDPOINTS,
+    ):
+        """
+        Paces requests with a token bucket per endpoint family, plus a global bucket shared by every limited request.
+        Can be shared by clients using the same api key. Priority endpoints (order placement) are served before
+        other requests waiting on the same bucket.
+        :param limits: dict of family to tuple of (requests per second, burst). Defaults to config.RATE_LIMITS
+        :param families: dict of endpoint name to family. Defaults to config.RATE_LIMIT_FAMILIES, endpoints without a
+        family (login etc.) are not limited
+        :param global_limit: tuple of (requests per second, burst) over all families, None for no global limit
+        :param priority_endpoints: endpoint names given priority
+        """
+        limits = config.RATE_LIMITS if limits is None else limits
+        self.families = dict(
+            config.RATE_LIMIT_FAMILIES if families is None else families
+        )
+        self.priority_endpoints = frozenset(priority_endpoints)
+        self.buckets: Dict[str, TokenBucket] = {
+            family: TokenBucket(rate, capacity)
+            for family, (rate, capacity) in limits.items()
+        }
+        self.global_bucket = TokenBucket(*global_limit) if global_limit else None
+        self.requests: Dict[str, int] = defaultdict(int)
+        self.wait_time: Dict[str, float] = defaultdict(float)
+        self.max_wait_time: Dict[str, float] = defaultdict(float)
+        self._stats_lock = threading.Lock()
+
+    def acquire(self, endpoint: str) -> float:
+        """
+        Waits until the endpoint can be requested
+        :param endpoint: endpoint name, e.g. selections_for_market
+        :return: seconds waited
+        """
+        buckets = self._buckets(endpoint)
+        if not buckets:
+            return 0
+        priority = endpoint in self.priority_endpoints
+        waited = sum(bucket.acquire(priority) for bucket in buckets)
+        self._record(endpoint, waited)
+        return waited
+
+    async def acquire_async(self, endpoint: str) -> float:
+        """
+        Waits until the endpoint can be requested, without blocking the event loop
+        :param endpoint: endpoint name, e.g. selections_for_market
+        :return: seconds waited
+        """
+        buckets = self._buckets(endpoint)
+        if not buckets:
+            return 0
+        priority = endpoint in self.priority_endpoints
+        waited = 0
+        for bucket in buckets:
+            waited += await bucket.acquire_async(priority)
+        self._record(endpoint, waited)
+        return waited
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Queue wait count, total and max wait time (secs) per family
+        """
+        with self._stats_lock:
+            return {
+                family: {
+                    "requests": self.requests[family],
+                    "wait_time": self.wait_time[family],
+                    "max_wait_time": self.max_wait_time[family],
+                }
+                for family in self.requests
+            }
+
+    def _buckets(self, endpoint: str) -> Tuple[TokenBucket, ...]:
+        bucket = self.buckets.get(self.families.get(endpoint))
+        if bucket is None:
+            return ()
+        elif self.global_bucket is None:
+            return (bucket,)
+        return bucket, self.global_bucket
+
+    def _record(self, endpoint: str, waited: float) -> None:
+        family = self.families[endpoint]
+        with self._stats_lock:
+            self.requests[family] += 1
+            self.wait_time[family] += waited
+            if waited > self.max_wait_time[family]:
+                self.max_wait_time[family] = waited
+        if waited:
+            logger.debug(f"Rate limited {endpoint} for {waited:.3f}s")
@@ -0,0 +1,178 @@
+from __future__ import annotations
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional, Union
+from betconnect import config
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from betconnect.apiclient import APIClient
+    from betconnect.asyncapiclient import AsyncAPIClient
+
+
+class BaseTokenRefresher:
+    def __init__(
+        self,
+        client: Union[APIClient, AsyncAPIClient],
+        lead_time: float = config.TOKEN_REFRESH_LEAD_SECS,
+        retry_interval: float = config.TOKEN_REFRESH_RETRY_SECS,
+    ):
+        """
+        Keeps the client logged in off the request path, refreshing the token lead_time seconds before the clients
+        next_refresh_time so requests never block on a login.
+        :param client: The client to keep logged in
+        :param lead_time: seconds before next_refresh_time the token is refreshed
+        :param retry_interval: seconds to wait before trying again after a failed refresh / login
+        """
+        self.client = client
+        self.lead_time = lead_time
+        self.retry_interval = retry_interval
+
+    @property
+    def login_required(self) -> bool:
+        """
+        True if there is no token to refresh, a full login is needed
+        """
+        return self.client._token is None or self.client.logged_in is False
+
+    def seconds_until_refresh(self) -> float:
+        """
+        Seconds until the token should be refreshed, 0 if due now or a login is required
+        """
+        next_refresh_time: Optional[datetime] = self.client.next_refresh_time
+        if self.login_required or next_refresh_time is None:
+            return 0
+        delay = (next_refresh_time - datetime.utcnow()).total_seconds()
+        return max(delay - self.lead_time, 0)
+
+
+class TokenRefresher(BaseTokenRefresher):
+    def __init__(
+        self,
+        client: APIClient,
+        lead_time: float = config.TOKEN_REFRESH_LEAD_SECS,
+        retry_interval: float = config.TOKEN_REFRESH_RETRY_SECS,
+    ):
+        super(TokenRefresher, self).__init__(client, lead_time, retry_interval)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Starts refreshing in a daemon thread
+        :return: None
+        """
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.run, name="betconnect-token-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the refresher thread, waiting up to timeout seconds for it to finish
+        :return: None
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            delay = self.seconds_until_refresh()
+            if delay:
+                # woken early by stop, else check again as the token may have been refreshed elsewhere
+                self._stop_event.wait(delay)
+                continue
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(
+                    f"Token refresh failed, retrying in {self.retry_interval}s: {e}"
+                )
+                self._stop_event.wait(self.retry_interval)
+
+    def refresh(self) -> None:
+        """
+        Refreshes the token, logging in if there is no token or it could not be refreshed
+        :return: None
+        """
+        if not self.login_required:
+            if self.client.account.refresh_session_token() is not None:
+                logger.debug("Token refreshed in background")
+                return
+        self.client.account.login()
+        logger.debug("Logged in in background")
+
+
+class AsyncTokenRefresher(BaseTokenRefresher):
+    def __init__(
+        self,
+        client: AsyncAPIClient,
+        lead_time: float = config.TOKEN_REFRESH_LEAD_SECS,
+        retry_interval: float = config.TOKEN_REFRESH_RETRY_SECS,
+    ):
+        super(AsyncTokenRefresher, self).__init__(client, lead_time, retry_interval)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """
+        Starts refreshing in an asyncio task, must be called from within a running event loop
+        :return: None
+        """
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """
+        Cancels the refresher task
+        :return: None
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run(self) -> None:
+        while True:
+            delay = self.seconds_until_refresh()
+            if delay:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(
+                    f"Token refresh failed, retrying in {self.retry_interval}s: {e}"
+                )
+                await asyncio.sleep(self.retry_interval)
+
+    async def refresh(self) -> None:
+        """
+        Refreshes the token, logging in if there is no token or it could not be refreshed
+        :return: None
+        """
+        if not self.login_required:
+            if await self.client.account.refresh_session_token() is not None:
+                logger.debug("Token refreshed in background")
+                return
+        await self.client.account.login()
+        logger.debug("Logged in in background")
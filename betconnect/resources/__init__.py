@@ -21,6 +21,7 @@ from .betting import (
     BetRequestMatchMore,
     PricesBookmaker,
     MyActiveBet,
+    MyActiveLayBet,
     MyBetsBetRequests,
     MyBetsBets,
     BetRequestStop,
@@ -37,6 +38,24 @@ from .filters import (
     CreateBetRequestFilter,
 )
 
+from .catalogue import (
+    CatalogueSnapshot,
+    CatalogueSport,
+    CatalogueRegion,
+    CatalogueCompetition,
+    CatalogueFixture,
+    CatalogueMarket,
+)
+
+from .lite import (
+    LiteResource,
+    LitePricesBookmaker,
+    LitePrice,
+    LiteSelectionsForMarket,
+    LiteLineMarketsSelectionsForMarket,
+    LiteBetRequest,
+)
+
 from .account import Login, Token, AccountPreferences
 
 from .messages import BaseRequestException, ResponseMessage
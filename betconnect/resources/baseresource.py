@@ -1,4 +1,6 @@
-from pydantic import BaseModel, ConfigDict
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic_core import SchemaValidator
 
 
 class BaseResource(BaseModel):
@@ -7,6 +9,8 @@ class BaseResource(BaseModel):
         frozen=False,
         extra="allow",
     )
+    # compiled per class on first list parse, see _compile_list_validator
+    _list_validator: ClassVar[Optional[SchemaValidator]]
 
     @property
     def info(self):
@@ -25,3 +29,23 @@ class BaseResource(BaseModel):
             return cls.parse_obj(d["line"])
         else:
             return cls.parse_obj(d)
+
+    @classmethod
+    def create_list_from_dicts(cls, data: List[dict]) -> list:
+        """
+        Validates a list of response data dicts in a single pydantic-core call, using a list validator compiled
+        once per class. Line market rows wrapped in "line" are unwrapped.
+        :param data: The response data list
+        :return: A list of the resource
+        """
+        validator = cls.__dict__.get("_list_validator")
+        if validator is None:
+            validator = cls._compile_list_validator()
+        if data and "line" in data[0]:
+            data = [d["line"] for d in data]
+        return validator.validate_python(data)
+
+    @classmethod
+    def _compile_list_validator(cls) -> SchemaValidator:
+        cls._list_validator = TypeAdapter(List[cls]).validator
+        return cls._list_validator
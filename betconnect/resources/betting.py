@@ -217,7 +217,7 @@ class Price(BaseResource):
 
     @classmethod
     def create_from_dict(cls, d):
-        return [cls.parse_obj(data) for data in d["prices"]]
+        return cls.create_list_from_dicts(d["prices"])
 
     def __repr__(self) -> str:
         return f"Price: {self.price}, Bookmakers #:{len(self.bookmakers)}"
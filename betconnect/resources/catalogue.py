@@ -0,0 +1,103 @@
+from datetime import datetime
+from typing import Tuple, Union, Iterator, Optional
+from pydantic import ConfigDict, Field
+from .baseresource import BaseResource
+from .betting import (
+    ActiveSport,
+    ActiveRegion,
+    ActiveCompetition,
+    ActiveFixture,
+    ActiveMarketType,
+    ActiveMarket,
+    SelectionsForMarket,
+    LineMarketsSelectionsForMarket,
+)
+from .lite import LiteSelectionsForMarket, LiteLineMarketsSelectionsForMarket
+
+
+class CatalogueResource(BaseResource):
+    model_config = ConfigDict(frozen=True)
+
+
+class CatalogueMarket(CatalogueResource):
+    # lite selections when crawled with a resource_mode="lite" client
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    market: ActiveMarket
+    selections: Tuple[
+        Union[
+            SelectionsForMarket,
+            LineMarketsSelectionsForMarket,
+            LiteSelectionsForMarket,
+            LiteLineMarketsSelectionsForMarket,
+        ],
+        ...,
+    ] = Field(default=())
+
+    def __repr__(self) -> str:
+        return (
+            f"CatalogueMarket: {self.market.name}, Selections #: {len(self.selections)}"
+        )
+
+
+class CatalogueFixture(CatalogueResource):
+    fixture: ActiveFixture
+    markets: Tuple[CatalogueMarket, ...] = Field(default=())
+
+    def __repr__(self) -> str:
+        return f"CatalogueFixture: {self.fixture.display_name}({self.fixture.fixture_id}), Markets #: {len(self.markets)}"
+
+
+class CatalogueCompetition(CatalogueResource):
+    competition: ActiveCompetition
+    fixtures: Tuple[CatalogueFixture, ...] = Field(default=())
+
+    def __repr__(self) -> str:
+        return f"CatalogueCompetition: {self.competition.name}({self.competition.competition_id}), Fixtures #: {len(self.fixtures)}"
+
+
+class CatalogueRegion(CatalogueResource):
+    region: ActiveRegion
+    competitions: Tuple[CatalogueCompetition, ...] = Field(default=())
+
+    def __repr__(self) -> str:
+        return f"CatalogueRegion: {self.region.name}({self.region.region_id}), Competitions #: {len(self.competitions)}"
+
+
+class CatalogueSport(CatalogueResource):
+    sport: ActiveSport
+    market_types: Tuple[ActiveMarketType, ...] = Field(default=())
+    regions: Tuple[CatalogueRegion, ...] = Field(default=())
+
+    def __repr__(self) -> str:
+        return f"CatalogueSport: {self.sport.display_name}({self.sport.sport_id}), Regions #: {len(self.regions)}"
+
+
+class CatalogueSnapshot(CatalogueResource):
+    created: datetime
+    elapsed_time: float
+    request_count: int
+    sports: Tuple[CatalogueSport, ...] = Field(default=())
+
+    def get_sport(self, sport_id: int) -> Optional[CatalogueSport]:
+        """
+        Returns the crawled sport for the sport id
+        :param sport_id: The sport ID
+        :return: CatalogueSport or None if the sport was not crawled
+        """
+        for sport in self.sports:
+            if sport.sport.sport_id == sport_id:
+                return sport
+
+    def iter_fixtures(self) -> Iterator[CatalogueFixture]:
+        """
+        Iterates over every fixture in the snapshot
+        :return: Iterator of CatalogueFixture
+        """
+        for sport in self.sports:
+            for region in sport.regions:
+                for competition in region.competitions:
+                    yield from competition.fixtures
+
+    def __repr__(self) -> str:
+        return f"CatalogueSnapshot: {self.created}, Sports #: {len(self.sports)}, Requests #: {self.request_count}"
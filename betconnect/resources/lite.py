@@ -0,0 +1,320 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Type
+from uuid import UUID
+from . import betting
+
+
+class LiteResource:
+    """
+    Lightweight, slotted alternative to a BaseResource with the same attribute names, used for the high frequency
+    resources when the client is created with resource_mode="lite". Built straight from the response json without
+    validation and keeps no extra fields, for a fraction of the memory and construction time.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def create_from_dict(cls, d: dict):
+        raise NotImplementedError
+
+    @classmethod
+    def create_list_from_dicts(cls, data: List[dict]) -> list:
+        create_from_dict = cls.create_from_dict
+        return [create_from_dict(d) for d in data]
+
+    @property
+    def info(self) -> Dict[str, Any]:
+        return {name: _info(getattr(self, name)) for name in self.__slots__}
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is self.__class__:
+            return all(
+                getattr(self, name) == getattr(other, name) for name in self.__slots__
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        attributes = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{self.__class__.__name__}({attributes})"
+
+
+def _info(value: Any) -> Any:
+    if isinstance(value, LiteResource):
+        return value.info
+    elif isinstance(value, list):
+        return [_info(v) for v in value]
+    return value
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+class LitePricesBookmaker(LiteResource):
+    __slots__ = ("id", "name")
+
+    def __init__(self, id: str, name: str):
+        self.id = id
+        self.name = name
+
+    @classmethod
+    def create_from_dict(cls, d: dict):
+        return cls(d["id"], d["name"])
+
+    def __repr__(self) -> str:
+        return f"Bookie Name: {self.name} ({self.id})"
+
+
+class LitePrice(LiteResource):
+    __slots__ = ("price", "numerator", "denominator", "bookmakers")
+
+    def __init__(
+        self,
+        price: str,
+        numerator: int,
+        denominator: int,
+        bookmakers: List[LitePricesBookmaker] = None,
+    ):
+        self.price = price
+        self.numerator = numerator
+        self.denominator = denominator
+        self.bookmakers = bookmakers if bookmakers is not None else []
+
+    @classmethod
+    def create_from_dict(cls, d: dict):
+        if "prices" in d:
+            return [cls.create_from_dict(p) for p in d["prices"]]
+        return cls._create(d)
+
+    @classmethod
+    def _create(cls, d: dict):
+        create_bookmaker = LitePricesBookmaker.create_from_dict
+        return cls(
+            d["price"],
+            int(d["numerator"]),
+            int(d["denominator"]),
+            [create_bookmaker(b) for b in d.get("bookmakers", ())],
+        )
+
+    @classmethod
+    def create_list_from_dicts(cls, data: List[dict]) -> list:
+        create = cls._create
+        return [create(d) for d in data]
+
+    @classmethod
+    def create_from_bet_request(cls, d: dict):
+        # bet requests send price as a decimal and a fraction, see BetRequest.price_parser
+        return cls(
+            d["decimal"],
+            int(d["fraction"]["numerator"]),
+            int(d["fraction"]["denominator"]),
+        )
+
+    def __repr__(self) -> str:
+        return f"Price: {self.price}, Bookmakers #:{len(self.bookmakers)}"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LitePrice):
+            return other.price == self.price
+        return False
+
+
+class LiteSelectionsForMarket(LiteResource):
+    __slots__ = (
+        "source_fixture_id",
+        "source_market_id",
+        "source_market_type_id",
+        "source_selection_id",
+        "trading_status",
+        "name",
+        "competitor_id",
+        "ut",
+        "order",
+        "max_price",
+        "prices",
+        "outcome",
+    )
+
+    def __init__(
+        self,
+        source_fixture_id: str,
+        source_market_id: str,
+        source_market_type_id: str,
+        source_selection_id: str,
+        trading_status: str,
+        name: str,
+        ut: datetime,
+        prices: List[LitePrice],
+        competitor_id: Optional[str] = None,
+        order: Optional[int] = None,
+        max_price: Optional[float] = None,
+        outcome: Optional[str] = None,
+    ):
+        self.source_fixture_id = source_fixture_id
+        self.source_market_id = source_market_id
+        self.source_market_type_id = source_market_type_id
+        self.source_selection_id = source_selection_id
+        self.trading_status = trading_status
+        self.name = name
+        self.competitor_id = competitor_id
+        self.ut = ut
+        self.order = order
+        self.max_price = max_price
+        self.prices = prices
+        self.outcome = outcome
+
+    @classmethod
+    def create_from_dict(cls, d: dict):
+        if "line" in d:
+            d = d["line"]
+        max_price = d.get("max_price")
+        return cls(
+            source_fixture_id=d["source_fixture_id"],
+            source_market_id=d["source_market_id"],
+            source_market_type_id=d["source_market_type_id"],
+            source_selection_id=d["source_selection_id"],
+            trading_status=d["trading_status"],
+            name=d["name"],
+            ut=_parse_datetime(d["ut"]),
+            prices=LitePrice.create_list_from_dicts(d["prices"]),
+            competitor_id=d.get("competitor_id"),
+            order=d.get("order"),
+            max_price=float(max_price) if max_price is not None else None,
+            outcome=d.get("outcome"),
+        )
+
+
+class LiteLineMarketsSelectionsForMarket(LiteResource):
+    __slots__ = ("name", "display_name", "handicap", "line_data")
+
+    def __init__(
+        self,
+        name: str,
+        display_name: str,
+        handicap: str,
+        line_data: List[LiteSelectionsForMarket],
+    ):
+        self.name = name
+        self.display_name = display_name
+        self.handicap = handicap
+        self.line_data = line_data
+
+    @classmethod
+    def create_from_dict(cls, d: dict):
+        if "line" in d:
+            d = d["line"]
+        return cls(
+            d["name"],
+            d["display_name"],
+            d["handicap"],
+            LiteSelectionsForMarket.create_list_from_dicts(d["line_data"]),
+        )
+
+
+class LiteBetRequest(LiteResource):
+    __slots__ = (
+        "sport_name",
+        "sport_id",
+        "competition_name",
+        "region_name",
+        "start_time_utc",
+        "fixture_name",
+        "market_name",
+        "selection_name",
+        "price",
+        "fixture_id",
+        "market_type_id",
+        "competitor",
+        "bet_request_id",
+        "bet_type",
+        "requested_stake",
+        "liability",
+        "locked_stake",
+        "others_viewing_bet",
+        "lockable",
+    )
+
+    def __init__(
+        self,
+        sport_name: str,
+        sport_id: str,
+        competition_name: str,
+        region_name: str,
+        start_time_utc: datetime,
+        fixture_name: str,
+        market_name: str,
+        selection_name: str,
+        price: LitePrice,
+        fixture_id: int,
+        market_type_id: int,
+        competitor: str,
+        bet_request_id: UUID,
+        requested_stake: float,
+        liability: float,
+        locked_stake: float,
+        others_viewing_bet: int,
+        lockable: bool,
+        bet_type: Optional[str] = None,
+    ):
+        self.sport_name = sport_name
+        self.sport_id = sport_id
+        self.competition_name = competition_name
+        self.region_name = region_name
+        self.start_time_utc = start_time_utc
+        self.fixture_name = fixture_name
+        self.market_name = market_name
+        self.selection_name = selection_name
+        self.price = price
+        self.fixture_id = fixture_id
+        self.market_type_id = market_type_id
+        self.competitor = competitor
+        self.bet_request_id = bet_request_id
+        self.bet_type = bet_type
+        self.requested_stake = requested_stake
+        self.liability = liability
+        self.locked_stake = locked_stake
+        self.others_viewing_bet = others_viewing_bet
+        self.lockable = lockable
+
+    @classmethod
+    def create_from_dict(cls, d: dict):
+        if "line" in d:
+            d = d["line"]
+        return cls(
+            sport_name=d["sport_name"],
+            sport_id=d["sport_id"],
+            competition_name=d["competition_name"],
+            region_name=d["region_name"],
+            start_time_utc=_parse_datetime(d["start_time_utc"]),
+            fixture_name=d["fixture_name"],
+            market_name=d["market_name"],
+            selection_name=d["selection_name"],
+            price=LitePrice.create_from_bet_request(d["price"]),
+            fixture_id=int(d["fixture_id"]),
+            market_type_id=int(d["market_type_id"]),
+            competitor=d["competitor"],
+            bet_request_id=UUID(d["bet_request_id"]),
+            requested_stake=float(d["requested_stake"]),
+            liability=float(d["liability"]),
+            locked_stake=float(d["locked_stake"]),
+            others_viewing_bet=int(d["others_viewing_bet"]),
+            lockable=d["lockable"],
+            bet_type=d.get("bet_type"),
+        )
+
+    def __hash__(self):
+        return hash(
+            f"{self.fixture_name}-{self.selection_name}-{self.start_time_utc.isoformat()}"
+        )
+
+
+# resources replaced by their lite version in process_response when the client resource_mode is lite
+LITE_RESOURCES: Dict[Type[betting.BaseResource], Type[LiteResource]] = {
+    betting.PricesBookmaker: LitePricesBookmaker,
+    betting.Price: LitePrice,
+    betting.SelectionsForMarket: LiteSelectionsForMarket,
+    betting.LineMarketsSelectionsForMarket: LiteLineMarketsSelectionsForMarket,
+    betting.BetRequest: LiteBetRequest,
+}
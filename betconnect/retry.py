@@ -0,0 +1,99 @@
+import logging
+import random
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+from betconnect import config
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_retries: int = config.RETRY_MAX_RETRIES,
+        backoff: float = config.RETRY_BACKOFF_SECS,
+        max_backoff: float = config.RETRY_MAX_BACKOFF_SECS,
+        max_retry_after: float = config.RETRY_MAX_RETRY_AFTER_SECS,
+        status_codes: Iterable[int] = config.RETRY_STATUS_CODES,
+        read_endpoints: Iterable[str] = config.RETRY_READ_ENDPOINTS,
+    ):
+        """
+        Retries failed requests with exponential backoff and full jitter. Only requests safe to repeat are retried,
+        GETs, POSTs that only read (read_endpoints) and bet_request_create when a customer_order_ref is sent, so
+        BetConnect can detect a duplicate.
+        :param max_retries: max retries of a request, after the first attempt
+        :param backoff: base backoff secs, the delay before retry n is random between 0 and backoff * 2 ** n
+        :param max_backoff: max backoff secs
+        :param max_retry_after: max secs waited for a Retry-After header, longer waits are not retried
+        :param status_codes: response status codes retried, connection errors are always retried
+        :param read_endpoints: endpoint names sent as a POST that only read and are safe to retry
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.status_codes = frozenset(status_codes)
+        self.read_endpoints = frozenset(read_endpoints)
+        self.retries: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def can_retry(
+        self, attempt: int, method: str, endpoint: str, data: Optional[dict]
+    ) -> bool:
+        """
+        Whether a request can be retried
+        :param attempt: retries made so far
+        :param method: HTTP method
+        :param endpoint: endpoint name, e.g. bet_request_create
+        :param data: json body of the request
+        """
+        if attempt >= self.max_retries:
+            return False
+        elif method == "GET" or endpoint in self.read_endpoints:
+            return True
+        elif endpoint == "bet_request_create":
+            return bool(data and data.get("customer_order_ref"))
+        return False
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Secs to wait before the retry, the Retry-After header if sent else the jittered backoff
+        :param attempt: retries made so far
+        :param retry_after: Retry-After header value, secs or an HTTP date
+        :return: secs or None if Retry-After is beyond max_retry_after
+        """
+        if retry_after:
+            wait = _parse_retry_after(retry_after)
+            if wait is not None:
+                return wait if wait <= self.max_retry_after else None
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    def record(self, endpoint: str, delay: float, reason: str) -> None:
+        with self._lock:
+            self.retries[endpoint] += 1
+        logger.warning(f"Retrying {endpoint} in {delay:.3f}s: {reason}")
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Retries per endpoint
+        """
+        with self._lock:
+            return dict(self.retries)
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
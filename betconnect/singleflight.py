@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        Coalesces concurrent calls with the same key into a single call, callers arriving while it is in flight wait
+        for and share its result (or exception). Used by the client to login / refresh the token once however many
+        threads find it expired.
+        """
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Calls func unless a call for key is already in flight, in which case its result is returned once done
+        :param key: the operation, e.g. login
+        :param func: function called by the first caller
+        :return: the result of the in flight call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            logger.debug(f"Waiting on in flight {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
+
+
+class AsyncSingleFlight:
+    def __init__(self):
+        """
+        asyncio version of SingleFlight, concurrent tasks awaiting the same key share one call. The call runs in its
+        own task so a cancelled caller does not cancel it for the others.
+        """
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(
+        self, key: Hashable, func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """
+        Awaits func unless a call for key is already in flight, in which case its result is returned once done
+        :param key: the operation, e.g. login
+        :param func: coroutine function called by the first caller
+        :return: the result of the in flight call
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            logger.debug(f"Waiting on in flight {key}")
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # retrieved here in case every caller was cancelled, avoids the never retrieved warning
+            task.exception()
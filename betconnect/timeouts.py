@@ -0,0 +1,78 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+from betconnect import config
+
+
+class Timeout(NamedTuple):
+    connect: float
+    read: float
+
+
+# (connect, read) override set by TimeoutProfiles.override, per thread / asyncio task
+_override: ContextVar[Tuple[Optional[float], Optional[float]]] = ContextVar(
+    "betconnect_timeout_override", default=(None, None)
+)
+
+
+class TimeoutProfiles:
+    def __init__(
+        self,
+        profiles: Dict[str, Tuple[float, float]] = None,
+        endpoints: Dict[str, str] = None,
+        default: Tuple[float, float] = config.TIMEOUT_DEFAULT,
+    ):
+        """
+        Connect and read timeouts per endpoint, grouped into profiles so latency sensitive requests fail fast.
+        :param profiles: dict of profile to tuple of (connect, read) secs. Defaults to config.TIMEOUTS
+        :param endpoints: dict of endpoint name to profile. Defaults to config.TIMEOUT_PROFILES
+        :param default: tuple of (connect, read) secs for endpoints without a profile
+        """
+        self.profiles: Dict[str, Timeout] = {
+            profile: Timeout(*timeout)
+            for profile, timeout in (
+                config.TIMEOUTS if profiles is None else profiles
+            ).items()
+        }
+        self.endpoints = dict(
+            config.TIMEOUT_PROFILES if endpoints is None else endpoints
+        )
+        self.default = Timeout(*default)
+
+    def get(self, endpoint: str) -> Timeout:
+        """
+        The timeout for an endpoint, including any override in the current context
+        :param endpoint: endpoint name, e.g. prices
+        :return: Timeout
+        """
+        timeout = self.profiles.get(self.endpoints.get(endpoint), self.default)
+        connect, read = _override.get()
+        if connect is None and read is None:
+            return timeout
+        return Timeout(
+            timeout.connect if connect is None else connect,
+            timeout.read if read is None else read,
+        )
+
+    @staticmethod
+    @contextmanager
+    def override(
+        connect: Optional[float] = None, read: Optional[float] = None
+    ) -> Iterator[None]:
+        """
+        Overrides the profile timeouts for requests made within the block, in this thread / asyncio task only.
+        e.g. with client.timeouts.override(read=1): client.betting.prices(...)
+        :param connect: connect timeout secs, None keeps the profile value
+        :param read: read timeout secs, None keeps the profile value
+        """
+        outer_connect, outer_read = _override.get()
+        token = _override.set(
+            (
+                outer_connect if connect is None else connect,
+                outer_read if read is None else read,
+            )
+        )
+        try:
+            yield
+        finally:
+            _override.reset(token)
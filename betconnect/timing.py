@@ -0,0 +1,185 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class CallTiming:
+    """
+    Timing breakdown of a call in secs, None where a stage was not measured (the connection was reused, or the
+    session was supplied without the timed adapter / trace config).
+    dns: resolving the host, AsyncAPIClient only (included in connect on the APIClient)
+    connect: opening the connection, TCP and TLS handshakes
+    ttfb: from the request being sent (after connecting) to the response headers
+    download: reading the response body
+    decode: decoding the json
+    parse: building the resources
+    """
+
+    __slots__ = (
+        "endpoint",
+        "method",
+        "dns",
+        "connect",
+        "ttfb",
+        "download",
+        "decode",
+        "parse",
+    )
+
+    def __init__(self):
+        self.endpoint: Optional[str] = None
+        self.method: Optional[str] = None
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.download: Optional[float] = None
+        self.decode: Optional[float] = None
+        self.parse: Optional[float] = None
+
+    @property
+    def total(self) -> float:
+        return sum(
+            value
+            for value in (
+                self.dns,
+                self.connect,
+                self.ttfb,
+                self.download,
+                self.decode,
+                self.parse,
+            )
+            if value is not None
+        )
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        return {
+            **{name: getattr(self, name) for name in self.__slots__},
+            "total": self.total,
+        }
+
+    def __repr__(self) -> str:
+        stages = ", ".join(
+            f"{name}={value:.6f}"
+            for name, value in self.as_dict().items()
+            if isinstance(value, float)
+        )
+        return f"<CallTiming {self.method} {self.endpoint} {stages}>"
+
+
+# timing of the request being sent in this thread / asyncio task, filled in by the timed connections
+_sending: ContextVar[Optional[CallTiming]] = ContextVar(
+    "betconnect_sending", default=None
+)
+# lists collecting timings, set by record_timings
+_collectors: ContextVar[tuple] = ContextVar("betconnect_timing_collectors", default=())
+
+
+@contextmanager
+def sending(timing: CallTiming) -> Iterator[CallTiming]:
+    """
+    Marks timing as the call being sent in this thread, so the connection opened for it is timed
+    """
+    token = _sending.set(timing)
+    try:
+        yield timing
+    finally:
+        _sending.reset(token)
+
+
+@contextmanager
+def record_timings() -> Iterator[List[CallTiming]]:
+    """
+    Collects the CallTiming of every call processed within the block, in this thread / asyncio task only.
+    e.g. with record_timings() as timings: client.betting.prices(...)
+    """
+    timings: List[CallTiming] = []
+    token = _collectors.set(_collectors.get() + (timings,))
+    try:
+        yield timings
+    finally:
+        _collectors.reset(token)
+
+
+def emit(timing: CallTiming, hook: Optional[Callable[[CallTiming], None]]) -> None:
+    """
+    Passes a completed timing to the client hook and any record_timings blocks
+    """
+    for timings in _collectors.get():
+        timings.append(timing)
+    if hook is not None:
+        hook(timing)
+
+
+class _TimedConnectionMixin:
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super(_TimedConnectionMixin, self).connect()
+        timing = _sending.get()
+        if timing is not None:
+            timing.connect = time.perf_counter() - start
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connections record the time taken to connect in the CallTiming being sent
+    """
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super(TimedHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def trace_config():
+    """
+    aiohttp TraceConfig recording dns and connect times in the CallTiming passed as the trace_request_ctx
+    """
+    from betconnect.compat import aiohttp
+
+    async def on_dns_start(session, context, params) -> None:
+        context.dns_start = time.perf_counter()
+
+    async def on_dns_end(session, context, params) -> None:
+        timing = context.trace_request_ctx
+        if isinstance(timing, CallTiming):
+            timing.dns = time.perf_counter() - context.dns_start
+
+    async def on_connect_start(session, context, params) -> None:
+        context.connect_start = time.perf_counter()
+
+    async def on_connect_end(session, context, params) -> None:
+        timing = context.trace_request_ctx
+        if isinstance(timing, CallTiming):
+            # excluding dns
+            timing.connect = (
+                time.perf_counter() - context.connect_start - (timing.dns or 0)
+            )
+
+    config = aiohttp.TraceConfig()
+    config.on_dns_resolvehost_start.append(on_dns_start)
+    config.on_dns_resolvehost_end.append(on_dns_end)
+    config.on_connection_create_start.append(on_connect_start)
+    config.on_connection_create_end.append(on_connect_end)
+    return config
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BaseTokenStore:
+    """
+    Persists the client session (token, login times and account preferences) so a new process can reuse a valid
+    session without logging in. Subclass and implement load, save and clear to use another store, e.g. redis.
+    """
+
+    def load(self, key: str) -> Optional[dict]:
+        """
+        :param key: The session key, unique per user and api uri
+        :return: the saved session dict or None
+        """
+        raise NotImplementedError
+
+    def save(self, key: str, session: dict) -> None:
+        """
+        :param key: The session key, unique per user and api uri
+        :param session: json serialisable session dict
+        :return: None
+        """
+        raise NotImplementedError
+
+    def clear(self, key: str) -> None:
+        """
+        :param key: The session key, unique per user and api uri
+        :return: None
+        """
+        raise NotImplementedError
+
+
+class FileTokenStore(BaseTokenStore):
+    def __init__(self, directory: str):
+        """
+        Stores each session as a json file in a directory, readable by the current user only. Files are replaced
+        atomically so processes restarting together never read a partial write.
+        :param directory: The directory sessions are stored in, created if missing
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        # hashed so the username is not in the file name
+        name = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return os.path.join(self.directory, f"betconnect-{name}.json")
+
+    def load(self, key: str) -> Optional[dict]:
+        try:
+            with open(self.path(key), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unable to load session from token store: {e}")
+            return None
+
+    def save(self, key: str, session: dict) -> None:
+        path = self.path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(session, f)
+        os.replace(tmp_path, path)
+
+    def clear(self, key: str) -> None:
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,129 @@
+from contextlib import contextmanager
+from typing import Any, Iterator
+from betconnect.compat import otel_context, otel_trace
+
+# span attributes, OpenTelemetry http semantic conventions where one exists
+METHOD = "http.request.method"
+URL_TEMPLATE = "url.template"
+STATUS_CODE = "http.response.status_code"
+BODY_SIZE = "http.response.body.size"
+ERROR_TYPE = "error.type"
+ENDPOINT = "betconnect.endpoint"
+RETRIES = "betconnect.retries"
+
+
+def uri_template(api_version: str, method_uri: str) -> str:
+    """
+    The method uri with its path parameters replaced, keeping span names and attributes low cardinality, e.g.
+    api/v2/selections_for_market/{}/{}/{} from api/v2/selections_for_market/1/2/False
+    """
+    name, _, params = method_uri[len(api_version) + 1 :].partition("/")
+    return f"{api_version}/{name}" + "/{}" * (params.count("/") + 1 if params else 0)
+
+
+def start_span(tracer: Any, method: str, api_version: str, method_uri: str) -> Any:
+    """
+    Starts a client span for a call, ended by end_span
+    :param tracer: OpenTelemetry Tracer
+    :param method: HTTP method
+    :param api_version: client api version
+    :param method_uri: uri to be used, defined by each function.
+    """
+    template = uri_template(api_version, method_uri)
+    return tracer.start_span(
+        f"{method} {template}",
+        kind=otel_trace.SpanKind.CLIENT,
+        attributes={
+            METHOD: method,
+            URL_TEMPLATE: template,
+            ENDPOINT: template[len(api_version) + 1 :].split("/", 1)[0],
+            RETRIES: 0,
+        },
+    )
+
+
+def activate(span: Any) -> object:
+    """
+    Makes span the current span, so login and refresh calls made while sending are its children
+    :return: token passed to deactivate
+    """
+    return otel_context.attach(otel_trace.set_span_in_context(span))
+
+
+def deactivate(token: object) -> None:
+    otel_context.detach(token)
+
+
+def record_retry(attempt: int, reason: str) -> None:
+    """
+    Records a retry on the current span
+    :param attempt: retries made so far
+    :param reason: why the request is retried
+    """
+    span = otel_trace.get_current_span()
+    span.set_attribute(RETRIES, attempt + 1)
+    span.add_event("retry", {"attempt": attempt + 1, "reason": reason})
+
+
+def record_response(span: Any, response: Any) -> None:
+    """
+    :param span: the call span
+    :param response: requests.Response or AsyncResponse
+    """
+    span.set_attribute(STATUS_CODE, response.status_code)
+    span.set_attribute(BODY_SIZE, len(response.content))
+    if response.status_code >= 400:
+        span.set_attribute(ERROR_TYPE, str(response.status_code))
+        span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+
+
+def end_span(span: Any, exception: Exception = None) -> None:
+    """
+    :param span: the call span
+    :param exception: the exception raised by the call, if any
+    """
+    if exception is not None:
+        span.record_exception(exception)
+        span.set_attribute(ERROR_TYPE, type(exception).__name__)
+        span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(exception)))
+    span.end()
+
+
+@contextmanager
+def client_span(
+    tracer: Any, method: str, api_version: str, method_uri: str
+) -> Iterator[Any]:
+    """
+    A client span around a call, current within the block so login and refresh calls made while sending are its
+    children. Yields None if tracer is None.
+    """
+    if tracer is None:
+        yield None
+        return
+    span = start_span(tracer, method, api_version, method_uri)
+    token = activate(span)
+    try:
+        yield span
+    except Exception as e:
+        end_span(span, exception=e)
+        raise
+    else:
+        end_span(span)
+    finally:
+        deactivate(token)
+
+
+@contextmanager
+def parse_span(tracer: Any, endpoint: str) -> Iterator[Any]:
+    """
+    An internal span around building resources from a response. The call span ends when the request returns, so
+    the parse time is this spans duration rather than an attribute on the (already ended) call span.
+    :param tracer: OpenTelemetry Tracer
+    :param endpoint: endpoint name, e.g. selections_for_market
+    """
+    with tracer.start_as_current_span(
+        f"parse {endpoint}",
+        kind=otel_trace.SpanKind.INTERNAL,
+        attributes={ENDPOINT: endpoint},
+    ) as span:
+        yield span
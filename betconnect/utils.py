@@ -1,7 +1,13 @@
 from __future__ import annotations
 import hashlib
-from typing import List, Union, TYPE_CHECKING
+import json
+import logging
+from typing import Any, Callable, List, Union, TYPE_CHECKING
 from uuid import UUID
+from betconnect.compat import orjson, msgspec
+from betconnect.enums import JSONDecoder
+
+logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from betconnect.resources import SelectionsForMarket
@@ -70,3 +76,29 @@ def create_cheap_hash(txt: str, length: int = 15) -> str:
     hash_ = hashlib.sha1()
     hash_.update(txt.encode())
     return hash_.hexdigest()[:length]
+
+
+def get_json_loads(
+    json_decoder: Union[JSONDecoder, str, Callable[[bytes], Any]]
+) -> Callable[[bytes], Any]:
+    """
+    Returns the function used to parse response bytes, straight from bytes with no intermediate str. Falls back to
+    the stdlib json if the requested decoder is not installed.
+    :param json_decoder: A JSONDecoder (or its value) or a function parsing bytes
+    :return: function parsing json bytes
+    """
+    if callable(json_decoder):
+        return json_decoder
+    json_decoder = JSONDecoder(json_decoder)
+    if json_decoder is JSONDecoder.ORJSON:
+        if orjson is not None:
+            return orjson.loads
+    elif json_decoder is JSONDecoder.MSGSPEC:
+        if msgspec is not None:
+            return msgspec.json.Decoder().decode
+    else:
+        return json.loads
+    logger.warning(
+        f"{json_decoder.value} is not installed, falling back to the stdlib json decoder"
+    )
+    return json.loads
@@ -25,6 +25,7 @@ setup(
     author_email="oliverashleyvarney@gmail.com",
     license=about["__license__"],
     package_dir={"betconnect": "betconnect"},
+    package_data={"betconnect.mockserver": ["responses/*/*.json"]},
     classifiers=[
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
@@ -34,5 +35,11 @@ setup(
         "Programming Language :: Python :: 3.11",
     ],
     install_requires=INSTALL_REQUIRES,
+    extras_require={
+        "async": ["aiohttp"],
+        "speed": ["orjson"],
+        "compression": ["brotli", "zstandard"],
+        "tracing": ["opentelemetry-api"],
+    },
     test_suite="tests",
 )
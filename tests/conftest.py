@@ -2,12 +2,14 @@ from betconnect import endpoints
 import pytest
 from betconnect import resources
 from betconnect.apiclient import APIClient
+from betconnect.asyncapiclient import AsyncAPIClient
 from betconnect.baseclient import BaseClient
 from betconnect.enums import Environment
 from decouple import config
 from requests import Response
 from typing import Tuple, Dict, Any
-from tests.utils import build_path, load_pickle, load_json
+from tests.utils import build_path, build_response_path, load_pickle, load_json
+from betconnect.mockserver import MockServer
 from pytest_mock import mocker
 
 
@@ -33,6 +35,25 @@ def mock_api_client() -> APIClient:
     )
 
 
+@pytest.fixture
+def mock_async_api_client() -> AsyncAPIClient:
+    return AsyncAPIClient(
+        username="test",
+        password="123",
+        api_key="456",
+        environment=Environment.STAGING,
+        personalised_production_url=config("PRODUCTION_URI"),
+    )
+
+
+@pytest.fixture
+def mock_server() -> MockServer:
+    server = MockServer()
+    server.start()
+    yield server
+    server.stop()
+
+
 @pytest.fixture
 def staging_api_client() -> APIClient:
     return APIClient(
@@ -65,6 +86,16 @@ def mock_account_endpoint(staging_api_client) -> endpoints.Account:
     return endpoints.Account(staging_api_client)
 
 
+@pytest.fixture
+def mock_async_betting_endpoint(mock_async_api_client) -> endpoints.AsyncBetting:
+    return endpoints.AsyncBetting(mock_async_api_client)
+
+
+@pytest.fixture
+def mock_async_account_endpoint(mock_async_api_client) -> endpoints.AsyncAccount:
+    return endpoints.AsyncAccount(mock_async_api_client)
+
+
 @pytest.fixture()
 def mock_login_response_pkl() -> Response:
     return load_pickle(
@@ -77,9 +108,7 @@ def mock_login_response_pkl() -> Response:
 @pytest.fixture()
 def mock_login_response_json() -> Dict[str, Any]:
     return load_json(
-        build_path(
-            "resources/endpoints/account/mock_account_login_response_success.json"
-        )
+        build_response_path("account/mock_account_login_response_success.json")
     )
 
 
@@ -125,9 +154,7 @@ def mock_logout_response_pkl() -> Response:
 
 @pytest.fixture()
 def mock_logout_response_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/account/mock_account_logout_response.json")
-    )
+    return load_json(build_response_path("account/mock_account_logout_response.json"))
 
 
 @pytest.fixture()
@@ -146,9 +173,7 @@ def mock_active_bookmakers_pkl() -> Response:
 
 @pytest.fixture()
 def mock_active_bookmakers_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/active_bookmakers_response.json")
-    )
+    return load_json(build_response_path("betting/active_bookmakers_response.json"))
 
 
 @pytest.fixture()
@@ -167,9 +192,7 @@ def mock_active_sports_pkl() -> Response:
 
 @pytest.fixture()
 def mock_active_sports_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/active_sports_response.json")
-    )
+    return load_json(build_response_path("betting/active_sports_response.json"))
 
 
 @pytest.fixture()
@@ -188,9 +211,7 @@ def mock_active_regions_pkl() -> Response:
 
 @pytest.fixture()
 def mock_active_regions_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/active_regions_response.json")
-    )
+    return load_json(build_response_path("betting/active_regions_response.json"))
 
 
 @pytest.fixture()
@@ -209,9 +230,7 @@ def mock_active_competitions_pkl() -> Response:
 
 @pytest.fixture()
 def mock_active_competitions_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/active_competitions_response.json")
-    )
+    return load_json(build_response_path("betting/active_competitions_response.json"))
 
 
 @pytest.fixture()
@@ -231,9 +250,7 @@ def mock_active_fixtures_pkl() -> Response:
 
 @pytest.fixture()
 def mock_active_fixtures_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/active_fixtures_response.json")
-    )
+    return load_json(build_response_path("betting/active_fixtures_response.json"))
 
 
 @pytest.fixture()
@@ -252,9 +269,7 @@ def mock_active_market_types_pkl() -> Response:
 
 @pytest.fixture()
 def mock_active_market_types_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/active_market_types_response.json")
-    )
+    return load_json(build_response_path("betting/active_market_types_response.json"))
 
 
 @pytest.fixture()
@@ -274,9 +289,7 @@ def mock_active_markets_pkl() -> Response:
 
 @pytest.fixture()
 def mock_active_markets_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/active_markets_response.json")
-    )
+    return load_json(build_response_path("betting/active_markets_response.json"))
 
 
 @pytest.fixture()
@@ -295,9 +308,7 @@ def mock_active_selections_pkl() -> Response:
 
 @pytest.fixture()
 def mock_active_selections_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/active_selections_response.json")
-    )
+    return load_json(build_response_path("betting/active_selections_response.json"))
 
 
 @pytest.fixture()
@@ -316,9 +327,7 @@ def mock_bet_history_pkl() -> Response:
 
 @pytest.fixture()
 def mock_bet_history_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/bet_history_response.json")
-    )
+    return load_json(build_response_path("betting/bet_history_response.json"))
 
 
 @pytest.fixture()
@@ -356,7 +365,7 @@ def mock_my_bets_pkl() -> Response:
 
 @pytest.fixture()
 def mock_my_bets_json() -> Dict[str, Any]:
-    return load_json(build_path("resources/endpoints/betting/my_bets_response.json"))
+    return load_json(build_response_path("betting/my_bets_response.json"))
 
 
 @pytest.fixture()
@@ -376,7 +385,7 @@ def mock_selections_for_market_line_market_pkl() -> Response:
 @pytest.fixture()
 def mock_selections_for_market_line_market_json() -> Dict[str, Any]:
     return load_json(
-        build_path("resources/endpoints/betting/selections_for_market_line_market.json")
+        build_response_path("betting/selections_for_market_line_market.json")
     )
 
 
@@ -399,7 +408,7 @@ def mock_prices_pkl() -> Response:
 
 @pytest.fixture()
 def mock_prices_json() -> Dict[str, Any]:
-    return load_json(build_path("resources/endpoints/betting/prices_response.json"))
+    return load_json(build_response_path("betting/prices_response.json"))
 
 
 @pytest.fixture()
@@ -418,9 +427,7 @@ def mock_bet_request_create_pkl() -> Response:
 
 @pytest.fixture()
 def mock_bet_request_create_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/bet_request_create_response.json")
-    )
+    return load_json(build_response_path("betting/bet_request_create_response.json"))
 
 
 @pytest.fixture()
@@ -439,9 +446,7 @@ def mock_bet_request_get_pkl() -> Response:
 
 @pytest.fixture()
 def mock_bet_request_get_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/bet_request_get_response.json")
-    )
+    return load_json(build_response_path("betting/bet_request_get_response.json"))
 
 
 @pytest.fixture()
@@ -460,9 +465,7 @@ def mock_bet_request_match_pkl() -> Response:
 
 @pytest.fixture()
 def mock_bet_request_match_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/bet_request_match_response.json")
-    )
+    return load_json(build_response_path("betting/bet_request_match_response.json"))
 
 
 @pytest.fixture()
@@ -481,9 +484,7 @@ def mock_bet_request_stop_pkl() -> Response:
 
 @pytest.fixture()
 def mock_bet_request_stop_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/bet_request_stop_response.json")
-    )
+    return load_json(build_response_path("betting/bet_request_stop_response.json"))
 
 
 @pytest.fixture()
@@ -503,7 +504,7 @@ def mock_bet_request_match_more_pkl() -> Response:
 @pytest.fixture()
 def mock_bet_request_match_more_json() -> Dict[str, Any]:
     return load_json(
-        build_path("resources/endpoints/betting/bet_request_match_more_response.json")
+        build_response_path("betting/bet_request_match_more_response.json")
     )
 
 
@@ -525,7 +526,7 @@ def mock_get_active_bet_requests_pkl() -> Response:
 @pytest.fixture()
 def mock_get_active_bet_requests_json() -> Dict[str, Any]:
     return load_json(
-        build_path("resources/endpoints/betting/get_active_bet_requests_response.json")
+        build_response_path("betting/get_active_bet_requests_response.json")
     )
 
 
@@ -546,9 +547,7 @@ def mock_get_viewed_next_page_pkl() -> Response:
 
 @pytest.fixture()
 def mock_get_viewed_next_page_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/get_viewed_next_page_response.json")
-    )
+    return load_json(build_response_path("betting/get_viewed_next_page_response.json"))
 
 
 @pytest.fixture()
@@ -568,9 +567,7 @@ def mock_selections_for_market_pkl() -> Response:
 
 @pytest.fixture()
 def mock_selections_for_market_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/betting/selections_for_market_response.json")
-    )
+    return load_json(build_response_path("betting/selections_for_market_response.json"))
 
 
 @pytest.fixture()
@@ -596,9 +593,7 @@ def mock_get_user_preferences_response_pkl() -> Response:
 @pytest.fixture()
 def mock_get_user_preferences_response_json() -> Dict[str, Any]:
     return load_json(
-        build_path(
-            "resources/endpoints/account/mock_get_user_preferences_response.json"
-        )
+        build_response_path("account/mock_get_user_preferences_response.json")
     )
 
 
@@ -644,9 +639,7 @@ def mock_get_balance_response_pkl() -> Response:
 
 @pytest.fixture()
 def mock_get_balance_response_json() -> Dict[str, Any]:
-    return load_json(
-        build_path("resources/endpoints/account/mock_get_balance_response.json")
-    )
+    return load_json(build_response_path("account/mock_get_balance_response.json"))
 
 
 @pytest.fixture()
@@ -684,9 +677,7 @@ def mock_refresh_session_token_response_pkl() -> Response:
 @pytest.fixture()
 def mock_refresh_session_token_response_json() -> Dict[str, Any]:
     return load_json(
-        build_path(
-            "resources/endpoints/account/mock_refresh_session_token_response.json"
-        )
+        build_response_path("account/mock_refresh_session_token_response.json")
     )
 
 
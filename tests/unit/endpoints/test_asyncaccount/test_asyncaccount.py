@@ -0,0 +1,75 @@
+import asyncio
+from typing import Tuple, Dict, Any
+import pytest
+from pytest_mock import MockerFixture
+from requests import Response
+from betconnect import resources
+from betconnect import exceptions
+from betconnect.endpoints import Account, AsyncAccount
+
+
+class TestAsyncAccount:
+    def test_coroutines(self):
+        # request functions shared with Account would block the event loop
+        for name in ("_login", "_refresh_session_token", "_post"):
+            assert asyncio.iscoroutinefunction(vars(AsyncAccount)[name]), name
+        for name, func in vars(Account).items():
+            if name.startswith("_") or not callable(func):
+                continue
+            assert asyncio.iscoroutinefunction(vars(AsyncAccount).get(name)), name
+
+    def test_login(
+        self,
+        mocker: MockerFixture,
+        mock_async_account_endpoint: AsyncAccount,
+        mock_login_response: Tuple[Response, Dict[str, Any], float],
+        mock_login_failure_response: Tuple[Response, Dict[str, Any], float],
+        mock_get_user_preferences_response_response: Tuple[
+            Response, Dict[str, Any], float
+        ],
+    ):
+        login_request = mocker.patch(
+            "betconnect.endpoints.asyncaccount.AsyncAccount._post",
+            return_value=mock_login_response,
+        )
+        request = mocker.patch(
+            "betconnect.endpoints.asyncaccount.AsyncAccount._request",
+            return_value=mock_get_user_preferences_response_response,
+        )
+        get_balance = mocker.patch(
+            "betconnect.endpoints.asyncaccount.AsyncAccount.get_balance"
+        )
+
+        login = asyncio.run(mock_async_account_endpoint.login())
+        assert isinstance(login, resources.Login)
+        login_request.assert_awaited_with(method_uri="api/v2/login")
+        request.assert_awaited_once()
+        get_balance.assert_awaited_once()
+        client = mock_async_account_endpoint.client
+        assert client.logged_in is True
+        assert client.headers["X-AUTH-TOKEN"] == client._token
+        assert isinstance(client.account_preferences, resources.AccountPreferences)
+
+        mocker.patch(
+            "betconnect.endpoints.asyncaccount.AsyncAccount._post",
+            return_value=mock_login_failure_response,
+        )
+        with pytest.raises(exceptions.FailedLogin):
+            asyncio.run(mock_async_account_endpoint.login())
+
+    def test_refresh_session_token(
+        self,
+        mocker: MockerFixture,
+        mock_async_account_endpoint: AsyncAccount,
+        mock_refresh_session_token_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        mocker.patch(
+            "betconnect.endpoints.asyncaccount.AsyncAccount._post",
+            return_value=mock_refresh_session_token_response,
+        )
+        status = asyncio.run(mock_async_account_endpoint.refresh_session_token())
+        assert isinstance(status, resources.Login)
+        assert (
+            mock_async_account_endpoint.client.headers["X-AUTH-TOKEN"]
+            == status.data.token
+        )
@@ -0,0 +1,275 @@
+import asyncio
+from typing import Tuple, Dict, Any
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+from requests import Response
+from betconnect import config
+from betconnect import resources
+from betconnect import enums
+from betconnect import exceptions
+from betconnect.asyncapiclient import AsyncAPIClient
+from betconnect.compat import aiohttp
+from betconnect.endpoints import AsyncBetting, Betting
+from betconnect.endpoints.asyncbaseendpoint import AsyncResponse
+from betconnect.timeouts import Timeout
+
+
+class TestAsyncBetting:
+    def test___init__(self, mock_async_api_client: AsyncAPIClient):
+        betting = AsyncBetting(mock_async_api_client)
+        assert betting.client == mock_async_api_client
+
+    def test_coroutines(self):
+        # request functions shared with Betting would block the event loop
+        for name, func in vars(Betting).items():
+            if name.startswith("_") or not callable(func):
+                continue
+            if name.startswith("iter_"):
+                assert getattr(AsyncBetting, name) is func
+            else:
+                assert name in vars(AsyncBetting), name
+
+    def test__request(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_active_sports_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        pkl = mock_active_sports_response[0]
+        send = mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            return_value=AsyncResponse(
+                status_code=pkl.status_code,
+                url=pkl.url,
+                headers=pkl.headers,
+                content=pkl.content,
+            ),
+        )
+        active_sports = asyncio.run(mock_async_betting_endpoint.active_sports())
+        assert isinstance(active_sports, list)
+        for s in active_sports:
+            assert isinstance(s, resources.ActiveSport)
+        send.assert_called_with(
+            "GET",
+            "https://stgapi.betconnect.com/api/v2/active_sports",
+            params={},
+            data=None,
+            timeout=Timeout(*config.TIMEOUT_DEFAULT),
+        )
+
+    def test__request_error(
+        self, mocker: MockerFixture, mock_async_betting_endpoint: AsyncBetting
+    ):
+        mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            side_effect=asyncio.TimeoutError(),
+        )
+        with pytest.raises(exceptions.RequestTimeout) as e:
+            asyncio.run(mock_async_betting_endpoint.active_sports())
+        assert e.value.phase == "read"
+
+    def test__request_connect_timeout(
+        self, mocker: MockerFixture, mock_async_betting_endpoint: AsyncBetting
+    ):
+        mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            side_effect=aiohttp.ConnectionTimeoutError(),
+        )
+        with pytest.raises(exceptions.RequestTimeout) as e:
+            asyncio.run(mock_async_betting_endpoint.prices(1, 6, "1"))
+        assert e.value.phase == "connect"
+        assert e.value.timeout == config.TIMEOUTS["pricing"][0]
+
+    def test__request_timeout_server(
+        self, mock_async_betting_endpoint: AsyncBetting, mock_server
+    ):
+        client = mock_async_betting_endpoint.client
+        client.uri = mock_server.uri
+        client.process_login("token")
+
+        async def run():
+            async with client:
+                with client.timeouts.override(read=0.01):
+                    await client.account.refresh_session_token()
+
+        with pytest.raises(exceptions.RequestTimeout) as e:
+            asyncio.run(run())
+        assert e.value.phase == "read"
+        assert e.value.timeout == 0.01
+
+    def test__request_authenticated(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_active_bookmakers_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        pkl = mock_active_bookmakers_response[0]
+        login = mocker.patch(
+            "betconnect.endpoints.asyncaccount.AsyncAccount.login",
+        )
+        mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            return_value=AsyncResponse(
+                status_code=pkl.status_code,
+                url=pkl.url,
+                headers=pkl.headers,
+                content=pkl.content,
+            ),
+        )
+        asyncio.run(mock_async_betting_endpoint.active_bookmakers())
+        login.assert_awaited_once()
+
+    def test_selections_for_market(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_selections_for_market_response: Tuple[Response, Dict[str, Any], float],
+        mock_selections_for_market_line_market_response: Tuple[
+            Response, Dict[str, Any], float
+        ],
+    ):
+        mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._request",
+            return_value=mock_selections_for_market_response,
+        )
+        selections = asyncio.run(
+            mock_async_betting_endpoint.selections_for_market(
+                fixture_id=8763863, market_type_id=6
+            )
+        )
+        for s in selections:
+            assert isinstance(s, resources.SelectionsForMarket)
+
+        mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._request",
+            return_value=mock_selections_for_market_line_market_response,
+        )
+        selections = asyncio.run(
+            mock_async_betting_endpoint.selections_for_market(
+                fixture_id=8172709, market_type_id=259
+            )
+        )
+        for s in selections:
+            assert isinstance(s, resources.LineMarketsSelectionsForMarket)
+
+    def test_bet_request_match(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_bet_request_match_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        patch = mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._patch",
+            return_value=mock_bet_request_match_response,
+        )
+        bet_request_id = uuid4()
+        match = asyncio.run(
+            mock_async_betting_endpoint.bet_request_match(
+                bet_request_id=bet_request_id, accepted_stake=10
+            )
+        )
+        assert isinstance(match, resources.BetRequestMatch)
+        patch.assert_awaited_with(
+            method_uri="api/v2/bet_request_match",
+            data={"bet_request_id": str(bet_request_id), "accepted_stake": 10},
+        )
+
+    def test_my_bets(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_my_bets_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        request = mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._request",
+            return_value=mock_my_bets_response,
+        )
+        my_bets = asyncio.run(
+            mock_async_betting_endpoint.my_bets(
+                side=enums.BetSide.BACK,
+                status=enums.BetRequestStatus.SETTLED,
+                user_id="a6a1eb91",
+                limit=100,
+                page=1,
+            )
+        )
+        assert isinstance(my_bets, resources.MyBetsBetRequests)
+        request.assert_awaited_with(
+            method_uri="api/v2/my_bets/back/a6a1eb91/settled/100/1/get_all",
+            authenticated=True,
+        )
+
+    def test_iter_bet_history(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_bet_history_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        request = mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._request",
+            return_value=mock_bet_history_response,
+        )
+
+        async def run():
+            return [
+                b
+                async for b in mock_async_betting_endpoint.iter_bet_history(
+                    status=enums.BetStatus.MATCHED, side=enums.BetSide.BACK, page=5
+                )
+            ]
+
+        bets = asyncio.run(run())
+        assert request.await_count == 2
+        assert len(bets) == 2 * len(mock_bet_history_response[1]["data"]["bets"])
+        for b in bets:
+            assert isinstance(b, resources.BetHistory)
+
+    def test_iter_pages_exception(
+        self, mocker: MockerFixture, mock_async_betting_endpoint: AsyncBetting
+    ):
+        mocker.patch(
+            "betconnect.endpoints.asyncbetting.AsyncBetting.get_active_bet_requests",
+            return_value=resources.BaseRequestException(
+                message="error", request_url="url", status_code=500
+            ),
+        )
+
+        async def run():
+            return [
+                b async for b in mock_async_betting_endpoint.iter_active_bet_requests()
+            ]
+
+        with pytest.raises(exceptions.PageRequestException):
+            asyncio.run(run())
+
+    def test_export_bet_history(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_bet_history_json: Dict[str, Any],
+    ):
+        bets = mock_bet_history_json["data"]["bets"]
+        pages = {1: bets[0:10], 2: bets[9:19], 3: bets[19:25]}
+
+        async def bet_history(status, side, limit, page):
+            return resources.BetHistoryRequest(
+                bets=pages[page], last_page=3, total_bets=25
+            )
+
+        request = mocker.patch(
+            "betconnect.endpoints.asyncbetting.AsyncBetting.bet_history",
+            side_effect=bet_history,
+        )
+        exported = asyncio.run(
+            mock_async_betting_endpoint.export_bet_history(
+                status=enums.BetStatus.MATCHED,
+                side=enums.BetSide.BACK,
+                requests_per_second=1000,
+            )
+        )
+        assert request.await_count == 3
+        assert [str(b.bet_request_id) for b in exported] == [
+            b["bet_request_id"] for b in bets
+        ]
@@ -1,15 +1,20 @@
+import logging
 import uuid
 from typing import Tuple, Dict, Any
 
 import pytest
+import requests
 from pytest_mock import MockerFixture
+from urllib3.exceptions import ReadTimeoutError
 from requests import Response
 from betconnect import resources
 from betconnect.apiclient import APIClient
 from betconnect.endpoints import Betting
 from uuid import UUID
 from uuid import uuid4
+from betconnect import config
 from betconnect import enums
+from betconnect import exceptions
 
 
 class TestBetting:
@@ -17,6 +22,130 @@ class TestBetting:
         configuration = Betting(mock_api_client)
         assert configuration.client == mock_api_client
 
+    def test__send_request_timeout(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        get = mocker.patch(
+            "requests.sessions.Session.get", return_value=mock_prices_response[0]
+        )
+        mock_betting_endpoint.prices(fixture_id=1, market_type_id=6, competitor="1")
+        assert get.call_args.kwargs["timeout"] == config.TIMEOUTS["pricing"]
+
+        with mock_betting_endpoint.client.timeouts.override(read=1):
+            mock_betting_endpoint.prices(fixture_id=1, market_type_id=6, competitor="1")
+        assert get.call_args.kwargs["timeout"] == (config.TIMEOUTS["pricing"][0], 1)
+
+    @pytest.mark.parametrize(
+        "exception, phase",
+        [
+            (requests.ConnectTimeout(), "connect"),
+            (requests.ReadTimeout(), "read"),
+            (
+                requests.ConnectionError(ReadTimeoutError(None, None, "timed out")),
+                "read",
+            ),
+        ],
+    )
+    def test__send_request_timeout_error(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        exception: Exception,
+        phase: str,
+    ):
+        mocker.patch("requests.sessions.Session.get", side_effect=exception)
+        with pytest.raises(exceptions.RequestTimeout) as e:
+            mock_betting_endpoint.prices(fixture_id=1, market_type_id=6, competitor="1")
+        assert e.value.phase == phase
+        assert (
+            e.value.timeout
+            == config.TIMEOUTS["pricing"][0 if phase == "connect" else 1]
+        )
+
+    def test__send_request_error(
+        self, mocker: MockerFixture, mock_betting_endpoint: Betting
+    ):
+        mocker.patch(
+            "requests.sessions.Session.get", side_effect=requests.ConnectionError()
+        )
+        with pytest.raises(exceptions.APIError) as e:
+            mock_betting_endpoint.prices(fixture_id=1, market_type_id=6, competitor="1")
+        assert not isinstance(e.value, exceptions.RequestTimeout)
+
+    def test__send_request_timeout_server(
+        self, mock_betting_endpoint: Betting, mock_server
+    ):
+        client = mock_betting_endpoint.client
+        client.uri = mock_server.uri
+        client.process_login("token")
+        with client.timeouts.override(read=0.01):
+            with pytest.raises(exceptions.RequestTimeout) as e:
+                client.account.refresh_session_token()
+        assert e.value.phase == "read"
+        assert e.value.timeout == 0.01
+
+    def test__send_request_log(
+        self,
+        mocker: MockerFixture,
+        caplog: pytest.LogCaptureFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        response = mock_prices_response[0]
+        mocker.patch("requests.sessions.Session.get", return_value=response)
+        with caplog.at_level(logging.DEBUG, logger="betconnect.endpoints"):
+            mock_betting_endpoint.prices(fixture_id=1, market_type_id=6, competitor="1")
+        record = next(r for r in caplog.records if hasattr(r, "endpoint"))
+        assert record.levelno == logging.DEBUG
+        assert record.endpoint == "prices"
+        assert record.method == "GET"
+        assert record.status_code == 200
+        assert record.elapsed_time >= 0
+        assert record.bytes == len(response.content)
+
+        # 2xx disabled, nothing formatted
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="betconnect.endpoints"):
+            mock_betting_endpoint.prices(fixture_id=1, market_type_id=6, competitor="1")
+        assert caplog.records == []
+
+    def test__send_request_log_error(
+        self,
+        mocker: MockerFixture,
+        caplog: pytest.LogCaptureFixture,
+        mock_betting_endpoint: Betting,
+    ):
+        response = Response()
+        response.status_code = 404
+        response.url = "https://stgapi.betconnect.com/api/v2/prices"
+        response.headers["content-type"] = "application/json"
+        response._content = b'{"message": "no bet found"}'
+        mocker.patch("requests.sessions.Session.get", return_value=response)
+        with caplog.at_level(logging.INFO, logger="betconnect.endpoints"):
+            mock_betting_endpoint.prices(fixture_id=1, market_type_id=6, competitor="1")
+        assert [r.levelno for r in caplog.records] == [logging.INFO, logging.INFO]
+        assert caplog.records[0].status_code == 404
+        assert "no bet found" in caplog.records[1].getMessage()
+        # no traceback on routine errors
+        assert all(r.exc_info is None for r in caplog.records)
+
+        caplog.clear()
+        mock_betting_endpoint.client.log_levels[4] = logging.ERROR
+        with caplog.at_level(logging.INFO, logger="betconnect.endpoints"):
+            mock_betting_endpoint.prices(fixture_id=1, market_type_id=6, competitor="1")
+        assert [r.levelno for r in caplog.records] == [logging.ERROR, logging.ERROR]
+
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="betconnect.endpoints"):
+            exception = Betting.process_request_exception(
+                response, {"message": "no bet found"}
+            )
+        assert exception.status_code == 404
+        assert [r.levelno for r in caplog.records] == [logging.WARNING]
+
     def test_active_bookmakers(
         self,
         mocker: MockerFixture,
@@ -412,6 +541,191 @@ class TestBetting:
             is False
         )
 
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_iter_bet_history(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_bet_history_response: Tuple[Response, Dict[str, Any], float],
+        prefetch: bool,
+    ):
+        request = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._request",
+            return_value=mock_bet_history_response,
+        )
+        bets = list(
+            mock_betting_endpoint.iter_bet_history(
+                status=enums.BetStatus.MATCHED,
+                side=enums.BetSide.BACK,
+                limit=25,
+                prefetch=prefetch,
+            )
+        )
+        # recorded response has last_page 6
+        assert request.call_count == 6
+        assert len(bets) == 6 * len(mock_bet_history_response[1]["data"]["bets"])
+        for b in bets:
+            assert isinstance(b, resources.BetHistory)
+        request.assert_called_with(
+            method_uri=f"api/v2/bet_history/back/{mock_betting_endpoint.client.username}/matched/25/6",
+            authenticated=True,
+        )
+
+    def test_iter_my_bets(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_my_bets_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        request = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._request",
+            return_value=mock_my_bets_response,
+        )
+        bets = mock_betting_endpoint.iter_my_bets(
+            side=enums.BetSide.BACK,
+            status=enums.BetRequestStatus.SETTLED,
+            user_id="a6a1eb91",
+            page=2,
+        )
+        request.assert_not_called()
+        bets = list(bets)
+        assert request.call_count == 1
+        assert len(bets) == 100
+        for b in bets:
+            assert isinstance(b, resources.MyActiveBet)
+
+    def test_iter_active_bet_requests(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_bet_get_active_bet_requests_response: Tuple[
+            Response, Dict[str, Any], float
+        ],
+    ):
+        request = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._request",
+            return_value=mock_bet_get_active_bet_requests_response,
+        )
+        bets = list(mock_betting_endpoint.iter_active_bet_requests())
+        assert len(bets) == 6
+        request.assert_called_once_with(
+            method_uri="api/v2/get_active_bet_requests/100/1", authenticated=True
+        )
+
+    def test_export_bet_history(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_bet_history_json: Dict[str, Any],
+    ):
+        bets = mock_bet_history_json["data"]["bets"]
+        # second page starts with the last bet of the first page, as if a bet settled during the export
+        pages = {1: bets[0:10], 2: bets[9:19], 3: bets[19:25]}
+
+        def bet_history(status, side, limit, page):
+            return resources.BetHistoryRequest(
+                bets=pages[page], last_page=3, total_bets=25
+            )
+
+        request = mocker.patch(
+            "betconnect.endpoints.betting.Betting.bet_history",
+            side_effect=bet_history,
+        )
+        exported = mock_betting_endpoint.export_bet_history(
+            status=enums.BetStatus.MATCHED,
+            side=enums.BetSide.BACK,
+            limit=10,
+            requests_per_second=1000,
+        )
+        assert request.call_count == 3
+        assert [str(b.bet_request_id) for b in exported] == [
+            b["bet_request_id"] for b in bets
+        ]
+
+    def test_pages_context(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_bet_history_json: Dict[str, Any],
+    ):
+        bets = mock_bet_history_json["data"]["bets"]
+        timeouts = mock_betting_endpoint.client.timeouts
+        read_timeouts = []
+
+        def bet_history(status, side, limit, page):
+            read_timeouts.append(timeouts.get("bet_history").read)
+            return resources.BetHistoryRequest(
+                bets=bets[page - 1 : page], last_page=3, total_bets=3
+            )
+
+        mocker.patch(
+            "betconnect.endpoints.betting.Betting.bet_history",
+            side_effect=bet_history,
+        )
+        # the override applies to pages requested in the background
+        with timeouts.override(read=1):
+            mock_betting_endpoint.export_bet_history(
+                status=enums.BetStatus.MATCHED, side=enums.BetSide.BACK
+            )
+            list(
+                mock_betting_endpoint.iter_bet_history(
+                    status=enums.BetStatus.MATCHED,
+                    side=enums.BetSide.BACK,
+                    prefetch=True,
+                )
+            )
+        assert read_timeouts == [1] * 6
+
+    def test_iter_pages_exception(
+        self, mocker: MockerFixture, mock_betting_endpoint: Betting
+    ):
+        mocker.patch(
+            "betconnect.endpoints.betting.Betting.get_active_bet_requests",
+            return_value=resources.BaseRequestException(
+                message="error", request_url="url", status_code=500
+            ),
+        )
+        with pytest.raises(exceptions.PageRequestException):
+            list(mock_betting_endpoint.iter_active_bet_requests())
+
     def test_lock_bet(self, mock_betting_endpoint):
         with pytest.raises(NotImplementedError):
             mock_betting_endpoint.lock_bet(uuid.uuid4(), 1, 1)
+
+    def test_process_response_list(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_active_fixtures_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        create_list_from_dicts = mocker.spy(
+            resources.ActiveFixture, "create_list_from_dicts"
+        )
+        active_fixtures = mock_betting_endpoint.process_response(
+            *mock_active_fixtures_response[:2],
+            resource=resources.ActiveFixture,
+            elapsed_time=mock_active_fixtures_response[2],
+        )
+        create_list_from_dicts.assert_called_once()
+        assert len(active_fixtures) == len(mock_active_fixtures_response[1]["data"])
+
+    def test_process_response_lite(
+        self,
+        mock_betting_endpoint: Betting,
+        mock_selections_for_market_response: Tuple[Response, Dict[str, Any], float],
+        mock_active_fixtures_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        mock_betting_endpoint.client.resource_mode = enums.ResourceMode.LITE
+        selections = mock_betting_endpoint.process_response(
+            *mock_selections_for_market_response[:2],
+            resource=resources.SelectionsForMarket,
+            elapsed_time=1.0,
+        )
+        assert all(isinstance(s, resources.LiteSelectionsForMarket) for s in selections)
+        # resources without a lite version are unchanged
+        active_fixtures = mock_betting_endpoint.process_response(
+            *mock_active_fixtures_response[:2],
+            resource=resources.ActiveFixture,
+            elapsed_time=1.0,
+        )
+        assert all(isinstance(f, resources.ActiveFixture) for f in active_fixtures)
@@ -648,3 +648,27 @@ class TestBettingResources:
         assert isinstance(line_markets.line_data, list)
         for market in line_markets.line_data:
             assert isinstance(market, resources.SelectionsForMarket)
+
+    @pytest.mark.parametrize(
+        "resource,fixture",
+        [
+            (resources.ActiveFixture, "mock_active_fixtures_json"),
+            (resources.SelectionsForMarket, "mock_selections_for_market_json"),
+            (
+                resources.LineMarketsSelectionsForMarket,
+                "mock_selections_for_market_line_market_json",
+            ),
+        ],
+    )
+    def test_create_list_from_dicts(self, request, resource, fixture):
+        data = request.getfixturevalue(fixture)["data"]
+        batched = resource.create_list_from_dicts(data)
+        assert batched == [resource.create_from_dict(d) for d in data]
+        assert all(type(r) is resource for r in batched)
+        assert resource.create_list_from_dicts([]) == []
+
+    def test_create_list_from_dicts_invalid(self):
+        with pytest.raises(ValueError):
+            resources.ActiveBookmaker.create_list_from_dicts(
+                [{"name": "10Bet", "bookmaker_id": 6122, "order": 99, "active": 1}, {}]
+            )
@@ -0,0 +1,78 @@
+import pytest
+from betconnect import resources
+
+
+def assert_same_attributes(lite, resource):
+    for name in lite.__slots__:
+        lite_value = getattr(lite, name)
+        value = getattr(resource, name)
+        if isinstance(lite_value, list):
+            assert len(lite_value) == len(value)
+            for lite_item, item in zip(lite_value, value):
+                assert_same_attributes(lite_item, item)
+        elif isinstance(lite_value, resources.LiteResource):
+            assert_same_attributes(lite_value, value)
+        else:
+            assert lite_value == value
+            assert type(lite_value) is type(value)
+
+
+class TestLiteResources:
+    @pytest.mark.parametrize(
+        "lite,resource,fixture",
+        [
+            (
+                resources.LiteSelectionsForMarket,
+                resources.SelectionsForMarket,
+                "mock_selections_for_market_json",
+            ),
+            (
+                resources.LiteLineMarketsSelectionsForMarket,
+                resources.LineMarketsSelectionsForMarket,
+                "mock_selections_for_market_line_market_json",
+            ),
+            (
+                resources.LiteBetRequest,
+                resources.BetRequest,
+                "mock_bet_request_get_json",
+            ),
+            (resources.LitePrice, resources.Price, "mock_prices_json"),
+        ],
+    )
+    def test_create_from_dict(self, request, lite, resource, fixture):
+        data = request.getfixturevalue(fixture)["data"]
+        for d in data if isinstance(data, list) else [data]:
+            lite_resource = lite.create_from_dict(d)
+            validated = resource.create_from_dict(d)
+            if isinstance(validated, list):
+                for lite_item, item in zip(lite_resource, validated):
+                    assert_same_attributes(lite_item, item)
+            else:
+                assert isinstance(lite_resource, lite)
+                assert_same_attributes(lite_resource, validated)
+        if isinstance(data, list):
+            assert lite.create_list_from_dicts(data) == [
+                lite.create_from_dict(d) for d in data
+            ]
+
+    def test_slots(self):
+        price = resources.LitePrice(price="2.00", numerator=1, denominator=1)
+        assert not hasattr(price, "__dict__")
+        assert price.bookmakers == []
+        with pytest.raises(AttributeError):
+            price.decimal = "2.00"
+
+    def test_info(self):
+        price = resources.LitePrice(
+            price="2.00",
+            numerator=1,
+            denominator=1,
+            bookmakers=[resources.LitePricesBookmaker(id="17", name="Ladbrokes")],
+        )
+        assert price.info == {
+            "price": "2.00",
+            "numerator": 1,
+            "denominator": 1,
+            "bookmakers": [{"id": "17", "name": "Ladbrokes"}],
+        }
+        assert repr(price) == "Price: 2.00, Bookmakers #:1"
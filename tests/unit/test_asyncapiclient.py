@@ -0,0 +1,71 @@
+import asyncio
+from betconnect.asyncapiclient import AsyncAPIClient
+from betconnect.compat import aiohttp
+from betconnect import endpoints
+from betconnect.compression import async_accept_encoding
+
+
+class TestAsyncAPIClient:
+    def test___init__(self):
+        client = AsyncAPIClient(
+            username="test",
+            password="123",
+            api_key="456",
+            personalised_production_url="https://jimbob.betconnect.com/",
+            connection_limit=50,
+        )
+        assert client._username == "test"
+        assert client._password == "123"
+        assert client._api_key == "456"
+        assert client._personalised_production_url == "https://jimbob.betconnect.com/"
+        assert client.connection_limit == 50
+        assert client._session is None
+        assert client.headers == {
+            "Authorization": "Basic dGVzdDoxMjM=",
+            "X-API-KEY": "456",
+            "Accept-Encoding": async_accept_encoding(),
+        }
+        assert client.logged_in is False
+        assert isinstance(client.account, endpoints.AsyncAccount)
+        assert isinstance(client.betting, endpoints.AsyncBetting)
+
+    def test_process_login(self, mock_async_api_client: AsyncAPIClient):
+        mock_async_api_client.process_login(token="test_token")
+        assert mock_async_api_client._token == "test_token"
+        assert mock_async_api_client.headers["X-AUTH-TOKEN"] == "test_token"
+        assert mock_async_api_client.logged_in is True
+
+        mock_async_api_client.process_logout()
+        assert mock_async_api_client._token is None
+        assert "X-AUTH-TOKEN" not in mock_async_api_client.headers
+
+    def test_session(self, mock_async_api_client: AsyncAPIClient):
+        async def run():
+            async with mock_async_api_client as client:
+                session = client.session
+                assert isinstance(session, aiohttp.ClientSession)
+                assert session.connector.limit == client.connection_limit
+                assert (
+                    session.connector.limit_per_host == client.connection_limit_per_host
+                )
+                assert client.session is session
+            assert session.closed
+
+        asyncio.run(run())
+
+    def test_warm_up(self, mock_async_api_client: AsyncAPIClient, mock_server):
+        mock_async_api_client.uri = mock_server.uri
+
+        async def run():
+            async with mock_async_api_client as client:
+                assert await client.warm_up(3) == 3
+                assert mock_server.connections == 3
+                assert mock_server.requests[("HEAD", "/")] == 3
+
+                # concurrent requests reuse the open connections
+                await asyncio.gather(
+                    *(client.betting.active_sports() for _ in range(3))
+                )
+                assert mock_server.connections == 3
+
+        asyncio.run(run())
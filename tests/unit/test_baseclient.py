@@ -1,8 +1,13 @@
+import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from requests import Session
 from betconnect.baseclient import BaseClient
-from betconnect.enums import Environment
+from betconnect.enums import Environment, JSONDecoder, ResourceMode
 from betconnect import config
+from betconnect.tokenstore import FileTokenStore
+from betconnect.compression import accept_encoding
 
 
 class TestBaseClient:
@@ -26,11 +31,25 @@ class TestBaseClient:
         assert client.login_expiry_check is None
         assert client._token is None
         assert client.session_timeout == 28800
+        assert client.json_loads is json.loads
+        assert client.resource_mode is ResourceMode.PYDANTIC
+
+    def test___init___json_decoder(self):
+        client = BaseClient(
+            username="test",
+            password="123",
+            api_key="456",
+            environment=Environment.STAGING,
+            personalised_production_url="https://jimbob.betconnect.com/",
+            json_decoder=JSONDecoder.ORJSON,
+        )
+        assert client.json_loads is orjson.loads
 
     def test__update_client_session(self, mock_base_client):
         mock_base_client._update_client_session()
         assert isinstance(mock_base_client.session, Session)
         assert mock_base_client.session.headers["X-API-KEY"] == "456"
+        assert mock_base_client.session.headers["Accept-Encoding"] == accept_encoding()
         assert isinstance(mock_base_client.login_expiry_check, datetime)
         assert mock_base_client.session.auth == (
             mock_base_client._username,
@@ -54,3 +73,132 @@ class TestBaseClient:
         assert isinstance(mock_base_client.login_expiry_check, datetime)
         assert mock_base_client._token == "test_token"
         assert mock_base_client.session.headers["X-AUTH-TOKEN"] == "test_token"
+
+    def test_token_store(self, tmp_path, mock_account_preferences_resource):
+        store = FileTokenStore(str(tmp_path))
+        kwargs = dict(
+            username="test",
+            password="123",
+            api_key="456",
+            environment=Environment.STAGING,
+            personalised_production_url="https://jimbob.betconnect.com/",
+            token_store=store,
+        )
+        client = BaseClient(**kwargs)
+        assert client.logged_in is False
+        client.process_login(token="test_token")
+        client.set_account_preferences(mock_account_preferences_resource)
+
+        restored = BaseClient(**kwargs)
+        assert restored.logged_in is True
+        assert restored._token == "test_token"
+        assert restored.session.headers["X-AUTH-TOKEN"] == "test_token"
+        assert restored.login_date == client.login_date
+        assert restored.login_expiry_check == client.login_expiry_check
+        assert restored.next_refresh_time == client.next_refresh_time
+        assert restored.account_preferences == client.account_preferences
+        assert restored.user_id == client.user_id
+
+        restored.process_logout()
+        assert store.load(client.session_key) is None
+        assert BaseClient(**kwargs).logged_in is False
+
+    def test_token_store_expired(self, tmp_path):
+        store = FileTokenStore(str(tmp_path))
+        client = BaseClient(
+            username="test",
+            password="123",
+            api_key="456",
+            environment=Environment.STAGING,
+            personalised_production_url="https://jimbob.betconnect.com/",
+            token_store=store,
+        )
+        client.process_login(token="test_token")
+        session = store.load(client.session_key)
+        session["login_expiry_check"] = datetime.utcnow().isoformat()
+        store.save(client.session_key, session)
+
+        assert client.load_session() is False
+        session["login_expiry_check"] = None
+        store.save(client.session_key, session)
+        assert client.load_session() is False
+
+    def test_token_store_errors(self, tmp_path, mock_account_preferences_resource):
+        store = FileTokenStore(str(tmp_path))
+        kwargs = dict(
+            username="test",
+            password="123",
+            api_key="456",
+            environment=Environment.STAGING,
+            personalised_production_url="https://jimbob.betconnect.com/",
+            token_store=store,
+        )
+        client = BaseClient(**kwargs)
+        client.process_login(token="test_token")
+        client.set_account_preferences(mock_account_preferences_resource)
+        session = store.load(client.session_key)
+        session["account_preferences"]["gamstop_result"] = "Y"
+        store.save(client.session_key, session)
+
+        # discarded, logged out
+        restored = BaseClient(**kwargs)
+        assert restored.logged_in is False
+        assert restored._token is None
+        assert "X-AUTH-TOKEN" not in restored.session.headers
+        assert restored.account_preferences is None
+        assert store.load(client.session_key) is None
+
+        class FailingTokenStore(FileTokenStore):
+            def load(self, key: str):
+                raise PermissionError("denied")
+
+            def clear(self, key: str):
+                raise PermissionError("denied")
+
+        kwargs["token_store"] = FailingTokenStore(str(tmp_path))
+        client = BaseClient(**kwargs)
+        assert client.logged_in is False
+        # logged out even if the store can not be cleared
+        client.process_login(token="test_token")
+        client.process_logout()
+        assert client._token is None
+        assert "X-AUTH-TOKEN" not in client.session.headers
+
+    def test_pool_size(self):
+        client = BaseClient(
+            username="test",
+            password="123",
+            api_key="456",
+            environment=Environment.STAGING,
+            personalised_production_url="https://jimbob.betconnect.com/",
+            pool_connections=2,
+            pool_maxsize=25,
+        )
+        adapter = client.session.get_adapter(client.uri)
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 25
+
+    def test_warm_up(self, mock_base_client, mock_server):
+        mock_base_client.uri = mock_server.uri
+        assert mock_base_client.warm_up(4) == 4
+        assert mock_server.connections == 4
+        assert mock_server.requests[("HEAD", "/")] == 4
+
+        # concurrent requests reuse the open connections
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(
+                    lambda _: mock_base_client.session.get(
+                        f"{mock_server.uri}api/v2/get_balance"
+                    ),
+                    range(4),
+                )
+            )
+        assert mock_server.connections == 4
+
+        # limited to the pool size
+        assert mock_base_client.warm_up(50) == mock_base_client.pool_maxsize
+
+    def test_warm_up_error(self, mock_base_client):
+        mock_base_client.uri = "http://127.0.0.1:1/"
+        assert mock_base_client.warm_up(2, timeout=1) == 0
@@ -0,0 +1,124 @@
+import asyncio
+from typing import Tuple, Dict, Any
+from pytest_mock import MockerFixture
+from requests import Response
+from betconnect import resources
+from betconnect import config
+from betconnect.cache import ResponseCache
+from betconnect.endpoints import Betting, AsyncBetting
+
+
+class TestResponseCache:
+    def test___init__(self):
+        cache = ResponseCache()
+        assert cache.ttls == config.CACHE_DEFAULT_TTLS
+        assert cache.maxsize == config.CACHE_MAX_SIZE
+        assert len(cache) == 0
+        assert cache.ttl("selections_for_market") is None
+
+    def test_get_set(self, mocker: MockerFixture):
+        cache = ResponseCache(ttls={"active_sports": 10})
+        assert cache.get(("active_sports", (False,))) == (False, None)
+        cache.set(("active_sports", (False,)), [1])
+        assert cache.get(("active_sports", (False,))) == (True, [1])
+        cache.set(("prices", ()), [1])
+        assert len(cache) == 1
+        assert cache.stats == {"active_sports": {"hits": 1, "misses": 1}}
+
+        mocker.patch("betconnect.cache.time.monotonic", return_value=10**10)
+        assert cache.get(("active_sports", (False,))) == (False, None)
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(ttls={"active_regions": 10}, maxsize=2)
+        cache.set(("active_regions", (1,)), 1)
+        cache.set(("active_regions", (2,)), 2)
+        cache.get(("active_regions", (1,)))
+        cache.set(("active_regions", (3,)), 3)
+        assert len(cache) == 2
+        assert cache.get(("active_regions", (2,)))[0] is False
+        assert cache.get(("active_regions", (1,)))[0] is True
+
+    def test_invalidate(self):
+        cache = ResponseCache(ttls={"active_regions": 10, "active_sports": 10})
+        cache.set(("active_regions", (1,)), 1)
+        cache.set(("active_sports", (False,)), 2)
+        cache.invalidate("active_regions")
+        assert len(cache) == 1
+        cache.invalidate()
+        assert len(cache) == 0
+
+
+class TestCached:
+    def test_betting(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_active_regions_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        request = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._request",
+            return_value=mock_active_regions_response,
+        )
+        uncached = mock_betting_endpoint.active_regions(sport_id=14)
+        cache = mock_betting_endpoint.enable_cache()
+
+        first = mock_betting_endpoint.active_regions(sport_id=14)
+        second = mock_betting_endpoint.active_regions(14)
+        assert request.call_count == 2
+        assert first == second == uncached
+        assert first is not second
+        for a, b in zip(first, second):
+            assert a is b
+            assert isinstance(a, resources.ActiveRegion)
+        assert cache.stats == {"active_regions": {"hits": 1, "misses": 1}}
+
+        mock_betting_endpoint.active_regions(sport_id=15)
+        assert request.call_count == 3
+
+        cache.invalidate("active_regions")
+        mock_betting_endpoint.active_regions(sport_id=14)
+        assert request.call_count == 4
+
+        mock_betting_endpoint.disable_cache()
+        mock_betting_endpoint.active_regions(sport_id=14)
+        assert request.call_count == 5
+
+    def test_betting_exception_not_cached(
+        self, mocker: MockerFixture, mock_betting_endpoint: Betting
+    ):
+        mock_betting_endpoint.enable_cache()
+        process_response = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint.process_response",
+            return_value=resources.BaseRequestException(
+                message="error", request_url="url", status_code=500
+            ),
+        )
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._request",
+            return_value=(None, None, 1.0),
+        )
+        mock_betting_endpoint.active_sports()
+        mock_betting_endpoint.active_sports()
+        assert process_response.call_count == 2
+
+    def test_async_betting(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_active_sports_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        request = mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._request",
+            return_value=mock_active_sports_response,
+        )
+        mock_async_betting_endpoint.enable_cache(ttls={"active_sports": 60})
+
+        async def run():
+            first = await mock_async_betting_endpoint.active_sports()
+            second = await mock_async_betting_endpoint.active_sports(with_bets=False)
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert request.await_count == 1
+        assert first == second
@@ -0,0 +1,187 @@
+import asyncio
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from betconnect import exceptions
+from betconnect.circuitbreaker import CircuitBreaker
+from betconnect.compat import aiohttp
+from betconnect.endpoints import Betting, AsyncBetting
+from betconnect.enums import CircuitState
+from betconnect.retry import RetryPolicy
+from tests.unit.test_retry import error_response
+
+
+class TestCircuitBreaker:
+    def test_open(self):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_time=30)
+        breaker.record("prices", 0.1, True)
+        breaker.record("prices", 0.1, True)
+        breaker.record("prices", 0.1, False)
+        breaker.record("prices", 0.1, True)
+        breaker.record("prices", 0.1, True)
+        assert breaker.state("prices") is CircuitState.CLOSED
+        breaker.check("prices")
+
+        breaker.record("prices", 0.1, True)
+        assert breaker.state("prices") is CircuitState.OPEN
+        with pytest.raises(exceptions.CircuitBreakerOpen) as e:
+            breaker.check("prices")
+        assert e.value.endpoint == "prices"
+        assert 29 < e.value.retry_in <= 30
+        # other endpoints unaffected
+        breaker.check("fixtures")
+
+    def test_half_open(self, mocker: MockerFixture):
+        monotonic = mocker.patch(
+            "betconnect.circuitbreaker.time.monotonic", return_value=100
+        )
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=30)
+        breaker.record("prices", 0.1, True)
+        assert breaker.state("prices") is CircuitState.OPEN
+
+        monotonic.return_value = 130
+        breaker.check("prices")
+        assert breaker.state("prices") is CircuitState.HALF_OPEN
+        # single probe
+        with pytest.raises(exceptions.CircuitBreakerOpen):
+            breaker.check("prices")
+
+        # probe failed
+        breaker.record("prices", 0.1, True)
+        assert breaker.state("prices") is CircuitState.OPEN
+        with pytest.raises(exceptions.CircuitBreakerOpen):
+            breaker.check("prices")
+
+        monotonic.return_value = 160
+        breaker.check("prices")
+        breaker.record("prices", 0.1, False)
+        assert breaker.state("prices") is CircuitState.CLOSED
+        breaker.check("prices")
+
+    def test_half_open_probe_lost(self, mocker: MockerFixture):
+        monotonic = mocker.patch(
+            "betconnect.circuitbreaker.time.monotonic", return_value=100
+        )
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=30)
+        breaker.record("prices", 0.1, True)
+        monotonic.return_value = 130
+        breaker.check("prices")
+        monotonic.return_value = 160
+        breaker.check("prices")
+        assert breaker.state("prices") is CircuitState.HALF_OPEN
+
+    def test_slow_call(self):
+        breaker = CircuitBreaker(failure_threshold=2, slow_call_time=1)
+        breaker.record("prices", 1.5, False)
+        breaker.record("prices", 2, False)
+        assert breaker.state("prices") is CircuitState.OPEN
+
+        breaker = CircuitBreaker(failure_threshold=2, slow_call_time=None)
+        breaker.record("prices", 1.5, False)
+        breaker.record("prices", 2, False)
+        assert breaker.state("prices") is CircuitState.CLOSED
+
+    def test_stats(self):
+        breaker = CircuitBreaker(failure_threshold=2, slow_call_time=1)
+        breaker.record("prices", 1, False)
+        breaker.record("prices", 2, True)
+        breaker.record("prices", 2, True)
+        with pytest.raises(exceptions.CircuitBreakerOpen):
+            breaker.check("prices")
+        stats = breaker.stats["prices"]
+        assert stats["state"] == "open"
+        assert stats["failures"] == 2
+        assert stats["opened"] == 1
+        assert stats["calls"] == 3
+        assert stats["failed_calls"] == 2
+        assert stats["slow_calls"] == 2
+        assert stats["rejected_calls"] == 1
+        assert stats["latency"] == pytest.approx(1.36)
+
+    def test_reset(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record("prices", 0.1, True)
+        breaker.record("fixtures", 0.1, True)
+        breaker.reset("prices")
+        assert breaker.state("prices") is CircuitState.CLOSED
+        assert breaker.state("fixtures") is CircuitState.OPEN
+        breaker.reset()
+        assert breaker.stats == {}
+
+
+class TestCircuitBreakerEndpoint:
+    def test_fail_fast(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+    ):
+        breaker = CircuitBreaker(failure_threshold=2)
+        mock_betting_endpoint.client.circuit_breaker = breaker
+        send = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=[error_response(503), requests.ConnectionError()],
+        )
+        mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        with pytest.raises(exceptions.APIError):
+            mock_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        assert breaker.state("prices") is CircuitState.OPEN
+
+        with pytest.raises(exceptions.CircuitBreakerOpen):
+            mock_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        assert send.call_count == 2
+        # keyed by endpoint
+        send.side_effect = None
+        send.return_value = error_response(400)
+        mock_betting_endpoint.selections_for_market(
+            fixture_id=8172709, market_type_id=6
+        )
+        assert breaker.state("selections_for_market") is CircuitState.CLOSED
+
+    def test_retry(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+    ):
+        mock_betting_endpoint.client.circuit_breaker = CircuitBreaker(
+            failure_threshold=2
+        )
+        mock_betting_endpoint.client.retry_policy = RetryPolicy(backoff=0)
+        send = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            return_value=error_response(503),
+        )
+        # retries stop once the circuit opens
+        with pytest.raises(exceptions.CircuitBreakerOpen):
+            mock_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        assert send.call_count == 2
+
+    def test_async(
+        self, mocker: MockerFixture, mock_async_betting_endpoint: AsyncBetting
+    ):
+        breaker = CircuitBreaker(failure_threshold=1)
+        mock_async_betting_endpoint.client.circuit_breaker = breaker
+        send = mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            side_effect=aiohttp.ClientConnectionError(),
+        )
+        with pytest.raises(exceptions.APIError):
+            asyncio.run(
+                mock_async_betting_endpoint.prices(
+                    fixture_id=8172709, market_type_id=6, competitor="1"
+                )
+            )
+        with pytest.raises(exceptions.CircuitBreakerOpen):
+            asyncio.run(
+                mock_async_betting_endpoint.prices(
+                    fixture_id=8172709, market_type_id=6, competitor="1"
+                )
+            )
+        assert send.call_count == 1
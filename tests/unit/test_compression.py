@@ -0,0 +1,89 @@
+import asyncio
+from typing import Tuple, Dict, Any
+import pytest
+from requests import Response
+from betconnect import resources
+from betconnect.apiclient import APIClient
+from betconnect.asyncapiclient import AsyncAPIClient
+from betconnect.compression import PayloadStats, accept_encoding
+from betconnect.endpoints import Betting
+
+
+class TestCompression:
+    def test_accept_encoding(self):
+        encodings = accept_encoding().split(", ")
+        assert encodings[:2] == ["gzip", "deflate"]
+
+    def test_payload_stats(self):
+        stats = PayloadStats()
+        stats.record("my_bets", "gzip", 100, 1000)
+        stats.record("my_bets", "identity", 500, 500)
+        assert stats.stats == {
+            "my_bets": {
+                "responses": 2,
+                "compressed_bytes": 600,
+                "uncompressed_bytes": 1500,
+                "ratio": 0.4,
+                "encodings": {"gzip": 1, "identity": 1},
+            }
+        }
+
+    @pytest.mark.parametrize(
+        "content_type",
+        [
+            "application/json",
+            "application/json; charset=utf-8",
+            "application/json;charset=UTF-8",
+            "Application/JSON",
+            "application/problem+json",
+        ],
+    )
+    def test_load_json_content(
+        self,
+        content_type: str,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        response = mock_prices_response[0]
+        response.headers["content-type"] = content_type
+        assert mock_betting_endpoint.load_json_content(response) == (
+            mock_prices_response[1]
+        )
+        assert (
+            Betting.load_json_content(response, json_loads=lambda content: content)
+            == response.content
+        )
+
+    def test_load_json_content_unrecognised(
+        self,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        response = mock_prices_response[0]
+        response.headers["content-type"] = "text/html"
+        assert mock_betting_endpoint.load_json_content(response) is None
+        del response.headers["content-type"]
+        assert mock_betting_endpoint.load_json_content(response) is None
+
+    def test_negotiation(self, mock_server, mock_api_client: APIClient):
+        mock_api_client.uri = mock_server.uri
+        mock_api_client.process_login("token")
+        assert isinstance(mock_api_client.account.get_balance(), resources.Balance)
+        stats = mock_api_client.payload_stats.stats["get_balance"]
+        assert stats["encodings"] == {"gzip": 1}
+        assert 0 < stats["compressed_bytes"] != stats["uncompressed_bytes"]
+
+    def test_negotiation_async(
+        self, mock_server, mock_async_api_client: AsyncAPIClient
+    ):
+        mock_async_api_client.uri = mock_server.uri
+        mock_async_api_client.process_login("token")
+
+        async def run():
+            async with mock_async_api_client:
+                return await mock_async_api_client.account.get_balance()
+
+        assert isinstance(asyncio.run(run()), resources.Balance)
+        stats = mock_async_api_client.payload_stats.stats["get_balance"]
+        assert stats["encodings"] == {"gzip": 1}
+        assert 0 < stats["compressed_bytes"] != stats["uncompressed_bytes"]
@@ -0,0 +1,140 @@
+import asyncio
+from pytest_mock import MockerFixture
+from betconnect import resources
+from betconnect.apiclient import APIClient
+from betconnect.asyncapiclient import AsyncAPIClient
+from betconnect.crawler import CatalogueCrawler, AsyncCatalogueCrawler
+
+SPORTS = [
+    resources.ActiveSport(
+        id=21,
+        sport_id=14,
+        name="Horse Racing",
+        display_name="Horse Racing",
+        slug="horse-racing",
+        order=1,
+        active=1,
+        rate=2.0,
+    ),
+    resources.ActiveSport(
+        id=1,
+        sport_id=1,
+        name="Football",
+        display_name="Football",
+        slug="football",
+        order=2,
+        active=1,
+        rate=2.0,
+    ),
+]
+REGIONS = [
+    resources.ActiveRegion(name="England", region_id=1, order=1),
+    resources.ActiveRegion(name="Ireland", region_id=2, order=2),
+]
+MARKET_TYPES = [resources.ActiveMarketType(market_type_id=6, name="WIN", active=1)]
+COMPETITIONS = [
+    resources.ActiveCompetition(
+        name="Kempton", display_name="Kempton", competition_id=822, active=1, order=1
+    )
+]
+FIXTURES = [
+    resources.ActiveFixture(
+        fixture_id=8573302, display_name="Kempton", startdate="2021-10-13", time="13:00"
+    ),
+    resources.ActiveFixture(
+        fixture_id=8573303, display_name="Kempton", startdate="2021-10-13", time="13:30"
+    ),
+]
+MARKETS = [
+    resources.ActiveMarket(
+        name="Race Winner",
+        display_name="Race Winner",
+        trading_status="Open",
+        is_handicap="False",
+        source_market_id="102361548",
+        market_type_id=6,
+        order=1,
+    )
+]
+
+
+def mock_betting(mocker: MockerFixture, target: str, selections: list):
+    for name, value in [
+        ("active_sports", SPORTS),
+        ("active_regions", REGIONS),
+        ("active_market_types", MARKET_TYPES),
+        ("active_competitions", COMPETITIONS),
+        ("active_fixtures", FIXTURES),
+        ("active_markets", MARKETS),
+        ("selections_for_market", selections),
+    ]:
+        mocker.patch(f"{target}.{name}", return_value=value)
+
+
+class TestCatalogueCrawler:
+    def assert_snapshot(self, snapshot: resources.CatalogueSnapshot, selections):
+        assert isinstance(snapshot, resources.CatalogueSnapshot)
+        assert [s.sport for s in snapshot.sports] == [SPORTS[0]]
+        sport = snapshot.get_sport(14)
+        assert sport.market_types == tuple(MARKET_TYPES)
+        assert [r.region for r in sport.regions] == REGIONS
+        fixtures = list(snapshot.iter_fixtures())
+        assert len(fixtures) == 4
+        assert [f.fixture for f in fixtures] == FIXTURES * 2
+        for fixture in fixtures:
+            assert fixture.markets[0].market == MARKETS[0]
+            assert fixture.markets[0].selections == tuple(selections)
+        # 1 sports, 2 region/market type, 2 competitions, 2 fixtures, 4 markets, 4 selections
+        assert snapshot.request_count == 15
+        assert snapshot.get_sport(1) is None
+
+    def test_crawl(
+        self,
+        mocker: MockerFixture,
+        mock_api_client: APIClient,
+        mock_selections_for_market_json,
+    ):
+        selections = [
+            resources.SelectionsForMarket(**s)
+            for s in mock_selections_for_market_json["data"]
+        ]
+        mock_betting(mocker, "betconnect.endpoints.Betting", selections)
+        snapshot = CatalogueCrawler(
+            mock_api_client, max_workers=4, sport_ids=[14]
+        ).crawl()
+        self.assert_snapshot(snapshot, selections)
+        assert snapshot.sports[0].model_config["frozen"] is True
+
+    def test_crawl_exception(
+        self,
+        mocker: MockerFixture,
+        mock_api_client: APIClient,
+    ):
+        mock_betting(mocker, "betconnect.endpoints.Betting", [])
+        mocker.patch(
+            "betconnect.endpoints.Betting.active_markets",
+            return_value=resources.BaseRequestException(
+                message="error", request_url="url", status_code=500
+            ),
+        )
+        snapshot = CatalogueCrawler(mock_api_client, include_selections=False).crawl()
+        for fixture in snapshot.iter_fixtures():
+            assert fixture.markets == ()
+
+    def test_async_crawl(
+        self,
+        mocker: MockerFixture,
+        mock_async_api_client: AsyncAPIClient,
+        mock_selections_for_market_json,
+    ):
+        selections = [
+            resources.SelectionsForMarket(**s)
+            for s in mock_selections_for_market_json["data"]
+        ]
+        mock_betting(mocker, "betconnect.endpoints.AsyncBetting", selections)
+        snapshot = asyncio.run(
+            AsyncCatalogueCrawler(
+                mock_async_api_client, max_workers=4, sport_ids=[14]
+            ).crawl()
+        )
+        self.assert_snapshot(snapshot, selections)
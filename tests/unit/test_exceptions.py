@@ -106,7 +106,37 @@ class TestExceptions:
                 customer_strategy_ref=""
             )
 
+    def test_page_request_exception(self):
+        exception = exceptions.PageRequestException(
+            page=2, message="error", status_code=500, url="betconnect.com"
+        )
+        assert exception.page == 2
+        assert exception.status_code == 500
+
+        with pytest.raises(exceptions.PageRequestException):
+            raise exception
+
     def test_api_error(self):
         exceptions.APIError(response=None, uri="betconnect.com")
         with pytest.raises(exceptions.APIError):
             raise exceptions.APIError(response=None, uri="betconnect.com")
+
+    def test_request_timeout(self):
+        exception = exceptions.RequestTimeout(
+            phase="read", timeout=5, uri="betconnect.com"
+        )
+        assert exception.phase == "read"
+        assert exception.timeout == 5
+        assert str(exception) == "Read timeout (5s) for request: betconnect.com"
+
+        with pytest.raises(exceptions.APIError):
+            raise exception
+
+    def test_circuit_breaker_open(self):
+        exception = exceptions.CircuitBreakerOpen(endpoint="prices", retry_in=12.34)
+        assert exception.endpoint == "prices"
+        assert exception.retry_in == 12.34
+        assert str(exception) == "Circuit breaker open for prices, retry in 12.3s"
+
+        with pytest.raises(exceptions.APIError):
+            raise exception
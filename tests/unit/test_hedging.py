@@ -0,0 +1,254 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Dict, Any
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests import Response
+from betconnect import exceptions
+from betconnect import resources
+from betconnect.endpoints import Betting, AsyncBetting
+from betconnect.endpoints.asyncbaseendpoint import AsyncResponse
+from betconnect.hedging import HedgePolicy
+from tests.unit.test_retry import CREATE_FILTER, error_response
+
+
+def hedge_policy(**kwargs) -> HedgePolicy:
+    # always hedge after 50ms
+    kwargs.setdefault("initial_delay", 0.05)
+    kwargs.setdefault("budget", 1)
+    policy = HedgePolicy(**kwargs)
+    policy.requests["warm"] = 100
+    return policy
+
+
+class TestHedgePolicy:
+    def test_can_hedge(self):
+        policy = HedgePolicy()
+        assert policy.can_hedge("GET", "selections_for_market") is True
+        assert policy.can_hedge("POST", "bet_request_get") is True
+        assert policy.can_hedge("GET", "prices") is False
+        policy = HedgePolicy(endpoints=["bet_request_create", "bet_request_match"])
+        assert policy.can_hedge("POST", "bet_request_create") is False
+        assert policy.can_hedge("PATCH", "bet_request_match") is False
+
+    def test_delay(self):
+        policy = HedgePolicy(
+            percentile=90, initial_delay=1, min_delay=0.05, min_samples=10
+        )
+        assert policy.delay("prices") == 1
+        for i in range(1, 11):
+            policy.record("prices", i / 10, False)
+        assert policy.delay("prices") == 1
+        for _ in range(100):
+            policy.record("prices", 0.01, False)
+        assert policy.delay("prices") == 0.05
+
+    def test_delay_window(self):
+        policy = HedgePolicy(percentile=50, window=10, min_samples=1)
+        for _ in range(10):
+            policy.record("prices", 2, False)
+        for _ in range(10):
+            policy.record("prices", 0.5, False)
+        assert policy.delay("prices") == 0.5
+
+    def test_budget(self):
+        policy = HedgePolicy(budget=0.1)
+        assert policy.acquire("prices") is False
+        for _ in range(20):
+            policy.record("prices", 0.1, False)
+        assert policy.acquire("prices") is True
+        assert policy.acquire("prices") is True
+        assert policy.acquire("prices") is False
+        policy.record("prices", 0.1, True)
+        assert policy.stats == {"prices": {"requests": 21, "hedges": 2, "wins": 1}}
+
+    def test_executor(self):
+        policy = HedgePolicy()
+        executor = policy.executor
+        assert policy.executor is executor
+        with ThreadPoolExecutor(max_workers=1) as caller:
+            assert caller.submit(lambda: policy.executor).result() is not executor
+        policy.close()
+        with pytest.raises(RuntimeError):
+            executor.submit(time.sleep, 0)
+        assert policy.executor is not executor
+        policy.close()
+
+
+class TestHedgedEndpoint:
+    def test_hedge_wins(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_selections_for_market_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        policy = hedge_policy()
+        mock_betting_endpoint.client.hedge_policy = policy
+        response = mock_selections_for_market_response[0]
+        calls = []
+
+        def send(*args, **kwargs):
+            calls.append(time.time())
+            if len(calls) == 1:
+                time.sleep(0.5)
+            return response
+
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send", side_effect=send
+        )
+        start = time.time()
+        selections = mock_betting_endpoint.selections_for_market(
+            fixture_id=8172709, market_type_id=6
+        )
+        assert time.time() - start < 0.4
+        assert isinstance(selections, list)
+        assert len(calls) == 2
+        assert calls[1] - calls[0] >= 0.05
+        assert policy.stats["selections_for_market"] == {
+            "requests": 1,
+            "hedges": 1,
+            "wins": 1,
+        }
+
+    def test_not_hedged(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_selections_for_market_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        policy = hedge_policy(budget=0)
+        mock_betting_endpoint.client.hedge_policy = policy
+        send = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=lambda *args, **kwargs: time.sleep(0.1)
+            or mock_selections_for_market_response[0],
+        )
+        # over budget
+        mock_betting_endpoint.selections_for_market(
+            fixture_id=8172709, market_type_id=6
+        )
+        assert send.call_count == 1
+        assert policy.stats["selections_for_market"]["hedges"] == 0
+
+        # order actions
+        policy.budget = 1
+        policy.endpoints = frozenset(["bet_request_create"])
+        mock_betting_endpoint.client.process_login("token")
+        send.reset_mock(side_effect=True)
+        send.side_effect = lambda *args, **kwargs: time.sleep(0.1) or error_response(
+            400
+        )
+        mock_betting_endpoint.bet_request_create(
+            resources.CreateBetRequestFilter(**CREATE_FILTER)
+        )
+        assert send.call_count == 1
+
+    def test_concurrent_callers(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_selections_for_market_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        # no hedge budget, only the primary requests are sent
+        policy = hedge_policy(budget=0)
+        mock_betting_endpoint.client.hedge_policy = policy
+        # every request is in flight at once, none queues behind other callers
+        in_flight = threading.Barrier(30)
+
+        def send(*args, **kwargs):
+            in_flight.wait(5)
+            return mock_selections_for_market_response[0]
+
+        send = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send", side_effect=send
+        )
+        with ThreadPoolExecutor(max_workers=30) as executor:
+            list(
+                executor.map(
+                    lambda _: mock_betting_endpoint.selections_for_market(
+                        fixture_id=8172709, market_type_id=6
+                    ),
+                    range(30),
+                )
+            )
+        assert send.call_count == 30
+        assert policy.stats["selections_for_market"]["hedges"] == 0
+        # released with the calling threads
+        assert len(policy._executors) == 0
+
+    def test_hedge_error(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_selections_for_market_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        mock_betting_endpoint.client.hedge_policy = hedge_policy()
+        calls = []
+
+        def send(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                return mock_selections_for_market_response[0]
+            raise requests.ConnectionError()
+
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send", side_effect=send
+        )
+        selections = mock_betting_endpoint.selections_for_market(
+            fixture_id=8172709, market_type_id=6
+        )
+        assert isinstance(selections, list)
+
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=requests.ConnectionError(),
+        )
+        with pytest.raises(exceptions.APIError):
+            mock_betting_endpoint.selections_for_market(
+                fixture_id=8172709, market_type_id=6
+            )
+
+    def test_async(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_selections_for_market_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        policy = hedge_policy()
+        mock_async_betting_endpoint.client.hedge_policy = policy
+        pkl = mock_selections_for_market_response[0]
+        cancelled = []
+
+        async def send(*args, **kwargs):
+            first = not cancelled
+            cancelled.append(False)
+            try:
+                if first:
+                    await asyncio.sleep(0.5)
+                return AsyncResponse(
+                    status_code=pkl.status_code,
+                    url=pkl.url,
+                    headers=pkl.headers,
+                    content=pkl.content,
+                )
+            except asyncio.CancelledError:
+                cancelled[0] = True
+                raise
+
+        mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            side_effect=send,
+        )
+        selections = asyncio.run(
+            mock_async_betting_endpoint.selections_for_market(
+                fixture_id=8172709, market_type_id=6
+            )
+        )
+        assert isinstance(selections, list)
+        # the slow request was cancelled
+        assert cancelled == [True, False]
+        assert policy.stats["selections_for_market"]["wins"] == 1
@@ -0,0 +1,168 @@
+import asyncio
+import random
+from typing import Tuple, Dict, Any
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests import Response
+from betconnect import exceptions
+from betconnect.endpoints import Betting, AsyncBetting
+from betconnect.endpoints.asyncbaseendpoint import AsyncResponse
+from betconnect.metrics import (
+    Histogram,
+    MetricsRegistry,
+    _BUCKETS,
+    _bucket_index,
+    _bucket_upper,
+)
+from betconnect.retry import RetryPolicy
+from tests.unit.test_retry import error_response
+
+
+class TestHistogram:
+    def test_buckets(self):
+        previous = 0
+        for value in list(range(0, 5000)) + [2**20, 2**31 - 1]:
+            index = _bucket_index(value)
+            assert previous <= index < _BUCKETS
+            assert value <= _bucket_upper(index)
+            assert value >= _bucket_upper(index - 1) if index else True
+            previous = index
+
+    def test_percentile(self):
+        histogram = Histogram()
+        assert histogram.percentile(50) == 0
+        values = [random.uniform(0.001, 2) for _ in range(10000)]
+        for value in values:
+            histogram.record(value)
+        values.sort()
+        for p in (50, 90, 99, 99.9):
+            expected = values[int(len(values) * p / 100) - 1]
+            assert histogram.percentile(p) == pytest.approx(expected, rel=0.07)
+        assert histogram.percentile(100) == max(values)
+        assert histogram.count == 10000
+        assert len(histogram.counts) == _BUCKETS
+
+    def test_record_out_of_range(self):
+        histogram = Histogram()
+        histogram.record(-1)
+        histogram.record(1e6)
+        assert histogram.count == 2
+        assert histogram.max == 1e6
+
+
+class TestMetricsRegistry:
+    def test_snapshot(self):
+        metrics = MetricsRegistry(percentiles=(50, 99))
+        metrics.record_request("prices", 200, 0.1, 1000)
+        metrics.record_request("prices", 503, 0.3, 10)
+        metrics.record_decode("prices", 0.001)
+        metrics.record_parse("prices", 0.002)
+        metrics.record_retry("prices")
+        metrics.record_error("prices", "read")
+        metrics.record_error("prices")
+        snapshot = metrics.snapshot()["prices"]
+        assert snapshot["latency"]["count"] == 2
+        assert snapshot["latency"]["mean"] == pytest.approx(0.2)
+        assert snapshot["latency"]["p50"] == pytest.approx(0.1, rel=0.07)
+        assert snapshot["latency"]["p99"] == pytest.approx(0.3, rel=0.07)
+        assert snapshot["decode"]["count"] == 1
+        assert snapshot["parse"]["max"] == 0.002
+        assert snapshot["status_codes"] == {200: 1, 503: 1}
+        assert snapshot["bytes"] == 1010
+        assert snapshot["retries"] == 1
+        assert snapshot["timeouts"] == {"read": 1}
+        assert snapshot["errors"] == 1
+
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_prometheus(self):
+        metrics = MetricsRegistry(percentiles=(50, 99.9))
+        metrics.record_request("prices", 200, 0.25, 1000)
+        metrics.record_error("prices", "connect")
+        text = metrics.prometheus()
+        lines = text.splitlines()
+        assert "# TYPE betconnect_latency_seconds summary" in lines
+        assert (
+            'betconnect_latency_seconds{endpoint="prices",quantile="0.5"} 0.25' in lines
+        )
+        assert (
+            'betconnect_latency_seconds{endpoint="prices",quantile="0.999"} 0.25'
+            in lines
+        )
+        assert 'betconnect_latency_seconds_count{endpoint="prices"} 1' in lines
+        assert (
+            'betconnect_responses_total{endpoint="prices",status_code="200"} 1' in lines
+        )
+        assert 'betconnect_response_bytes_total{endpoint="prices"} 1000' in lines
+        assert 'betconnect_timeouts_total{endpoint="prices",phase="connect"} 1' in lines
+        assert text.endswith("\n")
+
+
+class TestMetricsEndpoint:
+    def test_request(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        metrics = MetricsRegistry()
+        mock_betting_endpoint.client.metrics = metrics
+        mock_betting_endpoint.client.retry_policy = RetryPolicy(backoff=0)
+        response = mock_prices_response[0]
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=[requests.ConnectTimeout(), error_response(503), response],
+        )
+        mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        snapshot = metrics.snapshot()["prices"]
+        assert snapshot["latency"]["count"] == 2
+        assert snapshot["status_codes"] == {503: 1, 200: 1}
+        assert snapshot["bytes"] == len(response.content) + 20
+        assert snapshot["retries"] == 2
+        assert snapshot["timeouts"] == {"connect": 1}
+        assert snapshot["decode"]["count"] == 1
+        assert snapshot["parse"]["count"] == 1
+
+    def test_error(self, mocker: MockerFixture, mock_betting_endpoint: Betting):
+        metrics = MetricsRegistry()
+        mock_betting_endpoint.client.metrics = metrics
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=requests.ReadTimeout(),
+        )
+        with pytest.raises(exceptions.RequestTimeout):
+            mock_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        assert metrics.snapshot()["prices"]["timeouts"] == {"read": 1}
+
+    def test_async(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        metrics = MetricsRegistry()
+        mock_async_betting_endpoint.client.metrics = metrics
+        pkl = mock_prices_response[0]
+        mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            return_value=AsyncResponse(
+                status_code=pkl.status_code,
+                url=pkl.url,
+                headers=pkl.headers,
+                content=pkl.content,
+            ),
+        )
+        asyncio.run(
+            mock_async_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        )
+        snapshot = metrics.snapshot()["prices"]
+        assert snapshot["status_codes"] == {200: 1}
+        assert snapshot["parse"]["count"] == 1
@@ -0,0 +1,195 @@
+import asyncio
+from typing import Tuple, Dict, Any
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests import Response
+from betconnect import exceptions
+from betconnect.endpoints import Betting, AsyncBetting
+from betconnect.endpoints.asyncbaseendpoint import AsyncResponse
+from betconnect.middleware import Middleware, RequestContext
+from betconnect.retry import RetryPolicy
+from tests.unit.test_retry import error_response
+
+
+class Recorder(Middleware):
+    def __init__(self, name: str, calls: list):
+        self.name = name
+        self.calls = calls
+
+    def before_send(self, context: RequestContext):
+        self.calls.append((self.name, "before_send", context.attempt))
+
+    def after_receive(self, context: RequestContext, response):
+        self.calls.append((self.name, "after_receive", response.status_code))
+        return response
+
+    def on_error(self, context: RequestContext, exception: Exception):
+        self.calls.append((self.name, "on_error", type(exception).__name__))
+
+
+class Replay(Middleware):
+    def __init__(self, response):
+        self.response = response
+
+    def before_send(self, context: RequestContext):
+        return self.response
+
+
+class Recover(Middleware):
+    def __init__(self, response):
+        self.response = response
+
+    def on_error(self, context: RequestContext, exception: Exception):
+        return self.response
+
+
+class TestMiddleware:
+    def test_order(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        calls = []
+        mock_betting_endpoint.client.middleware = [
+            Recorder("a", calls),
+            Recorder("b", calls),
+        ]
+        mock_betting_endpoint.client.retry_policy = RetryPolicy(backoff=0)
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=[requests.ConnectionError(), mock_prices_response[0]],
+        )
+        mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        assert calls == [
+            ("a", "before_send", 0),
+            ("b", "before_send", 0),
+            ("b", "on_error", "ConnectionError"),
+            ("a", "on_error", "ConnectionError"),
+            ("a", "before_send", 1),
+            ("b", "before_send", 1),
+            ("b", "after_receive", 200),
+            ("a", "after_receive", 200),
+        ]
+
+    def test_before_send_response(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        calls = []
+        mock_betting_endpoint.client.middleware = [
+            Replay(mock_prices_response[0]),
+            Recorder("a", calls),
+        ]
+        send = mocker.patch("betconnect.endpoints.baseendpoint.BaseEndpoint._send")
+        prices = mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        assert isinstance(prices, list)
+        send.assert_not_called()
+        assert calls == [("a", "after_receive", 200)]
+
+    def test_on_error(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=requests.ConnectionError(),
+        )
+        mock_betting_endpoint.client.middleware = [Middleware()]
+        with pytest.raises(exceptions.APIError):
+            mock_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+
+        mock_betting_endpoint.client.middleware.append(Recover(mock_prices_response[0]))
+        prices = mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        assert isinstance(prices, list)
+
+    def test_context(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        class Rewrite(Middleware):
+            def before_send(self, context: RequestContext):
+                assert context.endpoint == "prices"
+                assert context.method == "GET"
+                context.params = {"extra": 1}
+                context.state["sent"] = True
+
+            def after_receive(self, context: RequestContext, response):
+                assert context.state == {"sent": True}
+                return error_response(503)
+
+        mock_betting_endpoint.client.middleware = [Rewrite()]
+        send = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            return_value=mock_prices_response[0],
+        )
+        prices = mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        assert send.call_args.kwargs["params"] == {"extra": 1}
+        assert prices.status_code == 503
+
+    def test_async(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        pkl = mock_prices_response[0]
+        calls = []
+
+        class AsyncRecorder(Middleware):
+            async def before_send(self, context: RequestContext):
+                await asyncio.sleep(0)
+                calls.append("before_send")
+
+            async def after_receive(self, context: RequestContext, response):
+                calls.append("after_receive")
+                return response
+
+            async def on_error(self, context: RequestContext, exception: Exception):
+                calls.append("on_error")
+                return AsyncResponse(
+                    status_code=pkl.status_code,
+                    url=pkl.url,
+                    headers=pkl.headers,
+                    content=pkl.content,
+                )
+
+        mock_async_betting_endpoint.client.middleware = [
+            AsyncRecorder(),
+            Recorder("sync", calls),
+        ]
+        mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            side_effect=asyncio.TimeoutError(),
+        )
+        prices = asyncio.run(
+            mock_async_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        )
+        assert isinstance(prices, list)
+        assert calls == [
+            "before_send",
+            ("sync", "before_send", 0),
+            ("sync", "on_error", "TimeoutError"),
+            "on_error",
+            ("sync", "after_receive", 200),
+            "after_receive",
+        ]
@@ -0,0 +1,149 @@
+import asyncio
+import random
+import time
+from uuid import UUID
+import pytest
+from betconnect import enums, exceptions, resources
+from betconnect.apiclient import APIClient
+from betconnect.asyncapiclient import AsyncAPIClient
+from betconnect.retry import RetryPolicy
+from betconnect.mockserver import MockServer, ROUTES, lognormal, uniform
+
+BET_REQUEST_ID = UUID("712d7387-c059-4d58-be66-12eccdeed384")
+
+
+@pytest.fixture
+def expiring_server() -> MockServer:
+    server = MockServer(token_ttl=60)
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_latency_distributions():
+    rng = random.Random(1)
+    assert all(0.01 <= uniform(0.01, 0.02)(rng) <= 0.02 for _ in range(100))
+    samples = sorted(lognormal(0.02, 0.5)(rng) for _ in range(1000))
+    assert 0.015 < samples[500] < 0.025
+    assert samples[990] > 0.04
+
+
+class TestMockServer:
+    def test_routes(self, expiring_server: MockServer, mock_api_client: APIClient):
+        mock_api_client.uri = expiring_server.uri
+        betting = mock_api_client.betting
+        results = [
+            betting.active_bookmakers(),
+            betting.active_sports(with_bets=True),
+            betting.active_regions(sport_id=14),
+            betting.active_competitions(sport_id=14, region_id=1),
+            betting.active_fixtures(sport_id=14, region_id=1),
+            betting.active_market_types(sport_id=14),
+            betting.active_markets(fixture_id=1, grouped=True),
+            betting.active_selections(fixture_id=1, market_type_id=6),
+            betting.selections_for_market(fixture_id=1, market_type_id=6),
+            betting.prices(fixture_id=1, market_type_id=6, competitor="1"),
+            betting.get_active_bet_requests(limit=10, page=1),
+            betting.bet_history(
+                status=enums.BetStatus.RECEIVED, side=enums.BetSide.BACK
+            ),
+            betting.my_bets(
+                side=enums.BetSide.BACK, status=enums.BetRequestStatus.ACTIVE
+            ),
+            betting.get_viewed_next_page(bet_request_id=BET_REQUEST_ID),
+            betting.bet_request_create(
+                request_filter=resources.CreateBetRequestFilter(
+                    fixture_id=8573295,
+                    market_type_id=6,
+                    competitor="1247097",
+                    price=2.63,
+                    stake=100,
+                    bet_type="Win",
+                )
+            ),
+            betting.bet_request_get(
+                request_filter=resources.GetBetRequestFilter(
+                    sport_id=14, bet_request_id=str(BET_REQUEST_ID)
+                )
+            ),
+            betting.bet_request_stop(bet_request_id=BET_REQUEST_ID),
+            betting.bet_request_match(bet_request_id=BET_REQUEST_ID, accepted_stake=2),
+            betting.bet_request_match_more(
+                bet_request_id=BET_REQUEST_ID, requested_stake=2
+            ),
+            mock_api_client.account.refresh_session_token(),
+        ]
+        for result in results:
+            assert not isinstance(result, resources.BaseRequestException), result
+        mock_api_client.account.logout()
+
+        served = {
+            (method, path.split("/")[3]) for method, path in expiring_server.requests
+        }
+        assert served == set(ROUTES)
+        assert set(expiring_server.statuses) == {200}
+
+    def test_token_expiry(
+        self, expiring_server: MockServer, mock_api_client: APIClient
+    ):
+        mock_api_client.uri = expiring_server.uri
+        mock_api_client.process_login("unknown")
+        balance = mock_api_client.account.get_balance()
+        assert balance.status_code == 401
+        # not authenticated, served
+        assert isinstance(mock_api_client.betting.active_sports(), list)
+
+        mock_api_client.account.login()
+        assert isinstance(mock_api_client.account.get_balance(), resources.Balance)
+        expiring_server.expire_tokens()
+        with pytest.raises(exceptions.UnexpectedResponseStatusCode):
+            mock_api_client.account.refresh_session_token()
+
+    def test_faults(self, mock_server: MockServer, mock_api_client: APIClient):
+        mock_api_client.uri = mock_server.uri
+        mock_api_client.process_login("token")
+        mock_api_client.retry_policy = RetryPolicy(backoff=0)
+        mock_server.inject("active_sports", status=429, retry_after=0, times=2)
+        assert isinstance(mock_api_client.betting.active_sports(), list)
+        assert mock_server.statuses == {429: 2, 200: 1}
+
+        mock_server.inject("active_regions", drop=True, times=1)
+        assert isinstance(mock_api_client.betting.active_regions(sport_id=14), list)
+
+        mock_server.inject("active_markets", stall=1, times=1)
+        start = time.monotonic()
+        with pytest.raises(exceptions.RequestTimeout):
+            with mock_api_client.timeouts.override(read=0.05):
+                mock_api_client.betting.active_markets(fixture_id=1)
+        assert time.monotonic() - start < 0.5
+
+        # stalled, then answered
+        mock_server.inject("active_sports", stall=0.05, times=1)
+        start = time.monotonic()
+        assert isinstance(mock_api_client.betting.active_sports(), list)
+        assert time.monotonic() - start >= 0.05
+
+    def test_concurrency(self, mock_async_api_client: AsyncAPIClient):
+        server = MockServer(latency={"*": 0.05})
+
+        async def run():
+            await server.open()
+            mock_async_api_client.uri = server.uri
+            try:
+                async with mock_async_api_client:
+                    start = time.monotonic()
+                    results = await asyncio.gather(
+                        *(
+                            mock_async_api_client.betting.active_sports()
+                            for _ in range(20)
+                        )
+                    )
+                    return results, time.monotonic() - start
+            finally:
+                await server.close()
+
+        results, elapsed = asyncio.run(run())
+        assert all(isinstance(result, list) for result in results)
+        assert server.max_in_flight == 20
+        # served concurrently
+        assert elapsed < 0.5
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import time
+from typing import Tuple, Dict, Any
+from pytest_mock import MockerFixture
+from requests import Response
+from betconnect import config
+from betconnect.ratelimiter import RateLimiter, TokenBucket
+from betconnect.endpoints import Betting, AsyncBetting
+from betconnect.endpoints.asyncbaseendpoint import AsyncResponse
+
+
+class TestTokenBucket:
+    def test_acquire(self):
+        bucket = TokenBucket(rate=50, capacity=2)
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        waited = bucket.acquire()
+        assert 0.01 < waited < 0.1
+        assert bucket.tokens < 1
+
+    def test_acquire_async(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+
+        async def acquire():
+            return [await bucket.acquire_async() for _ in range(3)]
+
+        waits = asyncio.run(acquire())
+        assert waits[0] == 0
+        assert all(0.01 < w < 0.1 for w in waits[1:])
+
+    def test_priority(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+        order = []
+
+        def acquire(name: str, priority: bool):
+            bucket.acquire(priority)
+            order.append(name)
+
+        normal = threading.Thread(target=acquire, args=("normal", False))
+        priority = threading.Thread(target=acquire, args=("priority", True))
+        normal.start()
+        time.sleep(0.01)
+        priority.start()
+        normal.join()
+        priority.join()
+        assert order == ["priority", "normal"]
+        assert bucket._priority_waiting == 0
+
+
+class TestRateLimiter:
+    def test___init__(self):
+        rate_limiter = RateLimiter()
+        assert set(rate_limiter.buckets) == set(config.RATE_LIMITS)
+        assert rate_limiter.global_bucket.rate == config.RATE_LIMIT_GLOBAL[0]
+        assert "bet_request_match" in rate_limiter.priority_endpoints
+
+    def test_acquire(self):
+        rate_limiter = RateLimiter(
+            limits={"pricing": (50, 1)},
+            families={"prices": "pricing"},
+            global_limit=None,
+        )
+        assert rate_limiter.acquire("login") == 0
+        assert rate_limiter.acquire("prices") == 0
+        assert rate_limiter.acquire("prices") > 0
+        stats = rate_limiter.stats
+        assert list(stats) == ["pricing"]
+        assert stats["pricing"]["requests"] == 2
+        assert stats["pricing"]["wait_time"] == stats["pricing"]["max_wait_time"] > 0
+
+    def test_global_limit(self):
+        rate_limiter = RateLimiter(
+            limits={"pricing": (1000, 10), "reference": (1000, 10)},
+            families={"prices": "pricing", "active_sports": "reference"},
+            global_limit=(50, 1),
+        )
+        assert rate_limiter.acquire("prices") == 0
+        assert asyncio.run(rate_limiter.acquire_async("active_sports")) > 0
+
+    def test_endpoint(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        mock_betting_endpoint.client.rate_limiter = RateLimiter()
+        acquire = mocker.patch.object(
+            mock_betting_endpoint.client.rate_limiter, "acquire", return_value=0
+        )
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            return_value=mock_prices_response[0],
+        )
+        mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        acquire.assert_called_once_with("prices")
+
+    def test_async_endpoint(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        pkl = mock_prices_response[0]
+        mock_async_betting_endpoint.client.rate_limiter = RateLimiter()
+        acquire = mocker.patch.object(
+            mock_async_betting_endpoint.client.rate_limiter,
+            "acquire_async",
+            return_value=0,
+        )
+        mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            return_value=AsyncResponse(
+                status_code=pkl.status_code,
+                url=pkl.url,
+                headers=pkl.headers,
+                content=pkl.content,
+            ),
+        )
+        asyncio.run(
+            mock_async_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        )
+        acquire.assert_called_once_with("prices")
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from pytest_mock import MockerFixture
+from betconnect import resources
+from betconnect.apiclient import APIClient
+from betconnect.asyncapiclient import AsyncAPIClient
+from betconnect.refresher import TokenRefresher, AsyncTokenRefresher
+
+LOGIN = resources.Login(data={"token": "refreshed"}, message="")
+
+
+class TestTokenRefresher:
+    def test_seconds_until_refresh(self, mock_api_client: APIClient):
+        refresher = TokenRefresher(mock_api_client, lead_time=60)
+        assert refresher.login_required is True
+        assert refresher.seconds_until_refresh() == 0
+
+        mock_api_client.process_login("token")
+        assert refresher.login_required is False
+        assert 14 * 60 - 5 < refresher.seconds_until_refresh() <= 14 * 60
+
+        mock_api_client.next_refresh_time = datetime.utcnow() - timedelta(seconds=1)
+        assert refresher.seconds_until_refresh() == 0
+
+    def test_refresh(self, mock_api_client: APIClient, mocker: MockerFixture):
+        mock_refresh = mocker.patch.object(
+            mock_api_client.account, "refresh_session_token", return_value=LOGIN
+        )
+        mock_login = mocker.patch.object(mock_api_client.account, "login")
+        refresher = TokenRefresher(mock_api_client)
+
+        refresher.refresh()
+        mock_refresh.assert_not_called()
+        mock_login.assert_called_once_with()
+
+        mock_api_client.process_login("token")
+        mock_login.reset_mock()
+        refresher.refresh()
+        mock_refresh.assert_called_once_with()
+        mock_login.assert_not_called()
+
+        # no refresh token supplied, falls back to login
+        mock_refresh.return_value = None
+        refresher.refresh()
+        mock_login.assert_called_once_with()
+
+    def test_start_stop(self, mock_api_client: APIClient, mocker: MockerFixture):
+        mock_login = mocker.patch.object(
+            mock_api_client.account,
+            "login",
+            side_effect=lambda: mock_api_client.process_login("token"),
+        )
+        refresher = mock_api_client.start_token_refresher()
+        assert isinstance(refresher, TokenRefresher)
+        assert mock_api_client.start_token_refresher() is refresher
+        for _ in range(100):
+            if mock_api_client.logged_in:
+                break
+            time.sleep(0.01)
+        assert mock_api_client.logged_in is True
+        assert mock_api_client.session.headers["X-AUTH-TOKEN"] == "token"
+        assert refresher.running is True
+        mock_login.assert_called_once_with()
+
+        mock_api_client.stop_token_refresher(timeout=1)
+        assert refresher.running is False
+        assert mock_api_client.token_refresher is None
+
+    def test_run_retries(self, mock_api_client: APIClient, mocker: MockerFixture):
+        refresher = TokenRefresher(mock_api_client, retry_interval=0.01)
+        calls = []
+
+        def login():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionError("down")
+            mock_api_client.process_login("token")
+            refresher._stop_event.set()
+
+        mocker.patch.object(mock_api_client.account, "login", side_effect=login)
+        refresher.run()
+        assert len(calls) == 3
+        assert mock_api_client.logged_in is True
+
+
+class TestAsyncTokenRefresher:
+    def test_refresh(
+        self, mock_async_api_client: AsyncAPIClient, mocker: MockerFixture
+    ):
+        client = mock_async_api_client
+        mock_refresh = mocker.patch.object(
+            client.account, "refresh_session_token", return_value=LOGIN
+        )
+        mock_login = mocker.patch.object(client.account, "login")
+        refresher = AsyncTokenRefresher(client)
+
+        asyncio.run(refresher.refresh())
+        mock_refresh.assert_not_called()
+        mock_login.assert_awaited_once_with()
+
+        client.process_login("token")
+        mock_login.reset_mock()
+        asyncio.run(refresher.refresh())
+        mock_refresh.assert_awaited_once_with()
+        mock_login.assert_not_called()
+
+    def test_start_stop(
+        self, mock_async_api_client: AsyncAPIClient, mocker: MockerFixture
+    ):
+        client = mock_async_api_client
+
+        async def login():
+            client.process_login("token")
+
+        mocker.patch.object(client.account, "login", side_effect=login)
+
+        async def run():
+            refresher = client.start_token_refresher()
+            assert isinstance(refresher, AsyncTokenRefresher)
+            await asyncio.sleep(0.01)
+            assert client.logged_in is True
+            assert client.headers["X-AUTH-TOKEN"] == "token"
+            assert refresher.running is True
+            await client.close()
+            assert refresher.running is False
+            assert client.token_refresher is None
+
+        asyncio.run(run())
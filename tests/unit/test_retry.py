@@ -0,0 +1,218 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Tuple, Dict, Any
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests import Response
+from betconnect import exceptions
+from betconnect import resources
+from betconnect.compat import aiohttp
+from betconnect.endpoints import Betting, AsyncBetting
+from betconnect.endpoints.asyncbaseendpoint import AsyncResponse
+from betconnect.retry import RetryPolicy
+
+
+def error_response(status_code: int, headers: dict = None) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.url = "https://stgapi.betconnect.com/"
+    response.headers.update({"content-type": "application/json", **(headers or {})})
+    response._content = b'{"message": "error"}'
+    return response
+
+
+CREATE_FILTER = dict(
+    fixture_id=8573295,
+    market_type_id=6,
+    competitor="1247097",
+    price=2.63,
+    stake=100,
+    bet_type="Win",
+)
+
+
+class TestRetryPolicy:
+    def test_can_retry(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.can_retry(0, "GET", "prices", None) is True
+        assert policy.can_retry(1, "GET", "prices", None) is True
+        assert policy.can_retry(2, "GET", "prices", None) is False
+        assert policy.can_retry(0, "POST", "bet_request_get", {}) is True
+        assert policy.can_retry(0, "PATCH", "bet_request_match", {}) is False
+        assert policy.can_retry(0, "POST", "bet_request_stop", {}) is False
+        assert policy.can_retry(0, "POST", "bet_request_create", {}) is False
+        assert (
+            policy.can_retry(
+                0, "POST", "bet_request_create", {"customer_order_ref": "abc"}
+            )
+            is True
+        )
+
+    def test_delay(self):
+        policy = RetryPolicy(backoff=0.1, max_backoff=0.3)
+        for attempt, maximum in [(0, 0.1), (1, 0.2), (2, 0.3), (5, 0.3)]:
+            delays = [policy.delay(attempt) for _ in range(50)]
+            assert all(0 <= d <= maximum for d in delays)
+            assert len(set(delays)) > 1
+
+    def test_delay_retry_after(self):
+        policy = RetryPolicy(max_retry_after=10)
+        assert policy.delay(0, "2") == 2
+        assert policy.delay(0, "20") is None
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=5)
+        assert 3 < policy.delay(0, format_datetime(retry_at, usegmt=True)) <= 5
+        # unparsable, backoff used
+        assert 0 <= policy.delay(0, "soon") <= policy.backoff
+
+    def test_record(self):
+        policy = RetryPolicy()
+        policy.record("prices", 0.1, "status code 503")
+        policy.record("prices", 0.1, "status code 503")
+        assert policy.stats == {"prices": 2}
+
+
+class TestRetryEndpoint:
+    def test_status_code(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        mock_betting_endpoint.client.retry_policy = RetryPolicy(backoff=0)
+        send = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=[
+                error_response(503),
+                error_response(429, {"Retry-After": "0"}),
+                mock_prices_response[0],
+            ],
+        )
+        prices = mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        assert isinstance(prices, list)
+        assert send.call_count == 3
+        assert mock_betting_endpoint.client.retry_policy.stats == {"prices": 2}
+
+    def test_status_code_exhausted(
+        self, mocker: MockerFixture, mock_betting_endpoint: Betting
+    ):
+        mock_betting_endpoint.client.retry_policy = RetryPolicy(
+            max_retries=2, backoff=0
+        )
+        send = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            return_value=error_response(500),
+        )
+        prices = mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        assert isinstance(prices, resources.BaseRequestException)
+        assert prices.status_code == 500
+        assert send.call_count == 3
+
+    def test_not_retried(self, mocker: MockerFixture, mock_betting_endpoint: Betting):
+        send = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            return_value=error_response(503),
+        )
+        # no policy
+        mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        assert send.call_count == 1
+
+        mock_betting_endpoint.client.retry_policy = RetryPolicy(backoff=0)
+        mock_betting_endpoint.client.process_login("token")
+        send.reset_mock()
+        mock_betting_endpoint.bet_request_create(
+            resources.CreateBetRequestFilter(**CREATE_FILTER)
+        )
+        assert send.call_count == 1
+
+        send.reset_mock()
+        mock_betting_endpoint.bet_request_create(
+            resources.CreateBetRequestFilter(
+                customer_order_ref="order-1", **CREATE_FILTER
+            )
+        )
+        assert send.call_count == 4
+
+    def test_connection_error(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        mock_betting_endpoint.client.retry_policy = RetryPolicy(backoff=0)
+        send = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=[
+                requests.ConnectionError(),
+                requests.ConnectTimeout(),
+                mock_prices_response[0],
+            ],
+        )
+        assert isinstance(
+            mock_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            ),
+            list,
+        )
+        assert send.call_count == 3
+
+        send.reset_mock(side_effect=True)
+        send.side_effect = requests.ConnectionError()
+        with pytest.raises(exceptions.APIError):
+            mock_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        assert send.call_count == 4
+
+    def test_read_timeout(self, mocker: MockerFixture, mock_betting_endpoint: Betting):
+        mock_betting_endpoint.client.retry_policy = RetryPolicy(backoff=0)
+        send = mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=requests.ReadTimeout(),
+        )
+        with pytest.raises(exceptions.RequestTimeout):
+            mock_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        assert send.call_count == 1
+
+    def test_async(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        pkl = mock_prices_response[0]
+        mock_async_betting_endpoint.client.retry_policy = RetryPolicy(backoff=0)
+        send = mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            side_effect=[
+                aiohttp.ClientConnectionError(),
+                AsyncResponse(
+                    status_code=503,
+                    url=pkl.url,
+                    headers={"content-type": "application/json"},
+                    content=b'{"message": "error"}',
+                ),
+                AsyncResponse(
+                    status_code=pkl.status_code,
+                    url=pkl.url,
+                    headers=pkl.headers,
+                    content=pkl.content,
+                ),
+            ],
+        )
+        prices = asyncio.run(
+            mock_async_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        )
+        assert isinstance(prices, list)
+        assert send.call_count == 3
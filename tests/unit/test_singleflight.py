@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from betconnect import resources
+from betconnect.apiclient import APIClient
+from betconnect.asyncapiclient import AsyncAPIClient
+from betconnect.singleflight import SingleFlight, AsyncSingleFlight
+
+
+class TestSingleFlight:
+    def test_do(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def func():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(flight.do, "login", func)
+            started.wait()
+            assert flight.in_flight("login") is True
+            followers = [executor.submit(flight.do, "login", func) for _ in range(4)]
+            time.sleep(0.01)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert flight.in_flight("login") is False
+        # not in flight, called again
+        assert flight.do("login", lambda: "again") == "again"
+
+    def test_do_error(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def func():
+            release.wait()
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(flight.do, "login", func) for _ in range(3)]
+            time.sleep(0.01)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result()
+        assert flight.in_flight("login") is False
+
+    def test_concurrent_login(self, mock_server, mock_api_client: APIClient):
+        mock_api_client.uri = mock_server.uri
+        barrier = threading.Barrier(10)
+
+        def request():
+            barrier.wait()
+            return mock_api_client.account.get_balance()
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(lambda _: request(), range(10)))
+
+        assert all(isinstance(r, resources.Balance) for r in results)
+        assert mock_server.requests[("POST", "/api/v2/login")] == 1
+        assert mock_server.requests[("GET", "/api/v2/get_user_preferences")] == 1
+        # one by the login, one per thread
+        assert mock_server.requests[("GET", "/api/v2/get_balance")] == 11
+
+    def test_late_login(self, mock_server, mock_api_client: APIClient):
+        mock_api_client.uri = mock_server.uri
+        # logged in by another thread after this one found the token expired
+        mock_api_client.process_login("token")
+        assert mock_api_client.account.login(if_required=True) is None
+        assert mock_server.requests[("POST", "/api/v2/login")] == 0
+        assert mock_api_client._token == "token"
+
+        assert isinstance(mock_api_client.account.login(), resources.Login)
+        assert mock_server.requests[("POST", "/api/v2/login")] == 1
+
+    def test_concurrent_refresh(self, mock_server, mock_api_client: APIClient):
+        mock_api_client.uri = mock_server.uri
+        mock_api_client.process_login("token")
+        barrier = threading.Barrier(10)
+
+        def refresh():
+            barrier.wait()
+            return mock_api_client.account.refresh_session_token()
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(lambda _: refresh(), range(10)))
+
+        assert all(r is results[0] for r in results)
+        assert mock_server.requests[("POST", "/api/v2/status")] == 1
+        assert mock_api_client._token == results[0].data.token
+
+
+class TestAsyncSingleFlight:
+    def test_do(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def run():
+            results = await asyncio.gather(
+                *(flight.do("login", func) for _ in range(5))
+            )
+            assert flight.in_flight("login") is False
+            return results
+
+        assert asyncio.run(run()) == ["result"] * 5
+        assert len(calls) == 1
+
+    def test_do_cancelled_caller(self):
+        flight = AsyncSingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def run():
+            leader = asyncio.ensure_future(flight.do("login", func))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flight.do("login", func))
+            leader.cancel()
+            # the call carries on for the remaining caller
+            assert await follower == "result"
+
+        asyncio.run(run())
+
+    def test_do_error(self):
+        flight = AsyncSingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        async def run():
+            return await asyncio.gather(
+                *(flight.do("login", func) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_late_login(self, mock_server, mock_async_api_client: AsyncAPIClient):
+        mock_async_api_client.uri = mock_server.uri
+        mock_async_api_client.process_login("token")
+
+        async def run():
+            async with mock_async_api_client as client:
+                assert await client.account.login(if_required=True) is None
+
+        asyncio.run(run())
+        assert mock_server.requests[("POST", "/api/v2/login")] == 0
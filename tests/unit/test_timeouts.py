@@ -0,0 +1,46 @@
+import asyncio
+from betconnect import config
+from betconnect.timeouts import Timeout, TimeoutProfiles
+
+
+class TestTimeoutProfiles:
+    def test_get(self):
+        timeouts = TimeoutProfiles()
+        assert timeouts.get("prices") == Timeout(*config.TIMEOUTS["pricing"])
+        assert timeouts.get("bet_request_match") == Timeout(*config.TIMEOUTS["orders"])
+        assert timeouts.get("bet_history") == Timeout(*config.TIMEOUTS["history"])
+        assert timeouts.get("login") == Timeout(*config.TIMEOUT_DEFAULT)
+
+        timeouts = TimeoutProfiles(
+            profiles={"fast": (1, 2)}, endpoints={"prices": "fast"}, default=(3, 4)
+        )
+        assert timeouts.get("prices") == Timeout(1, 2)
+        assert timeouts.get("bet_request_match") == Timeout(3, 4)
+
+    def test_override(self):
+        timeouts = TimeoutProfiles()
+        pricing = Timeout(*config.TIMEOUTS["pricing"])
+        with timeouts.override(read=1):
+            assert timeouts.get("prices") == Timeout(pricing.connect, 1)
+            with timeouts.override(connect=0.5):
+                assert timeouts.get("prices") == Timeout(0.5, 1)
+            assert timeouts.get("prices") == Timeout(pricing.connect, 1)
+        assert timeouts.get("prices") == pricing
+
+    def test_override_task(self):
+        timeouts = TimeoutProfiles()
+
+        async def get(read=None):
+            if read is None:
+                await asyncio.sleep(0.01)
+                return timeouts.get("prices")
+            with timeouts.override(read=read):
+                await asyncio.sleep(0.01)
+                return timeouts.get("prices")
+
+        async def run():
+            return await asyncio.gather(get(1), get())
+
+        overridden, profile = asyncio.run(run())
+        assert overridden.read == 1
+        assert profile.read == config.TIMEOUTS["pricing"][1]
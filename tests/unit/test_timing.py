@@ -0,0 +1,113 @@
+import asyncio
+from typing import Tuple, Dict, Any
+from pytest_mock import MockerFixture
+from requests import Response
+from betconnect import resources
+from betconnect.apiclient import APIClient
+from betconnect.asyncapiclient import AsyncAPIClient
+from betconnect.endpoints import Betting
+from betconnect.timing import CallTiming, TimedHTTPAdapter, emit, record_timings
+
+
+class TestCallTiming:
+    def test_total(self):
+        timing = CallTiming()
+        assert timing.total == 0
+        timing.endpoint = "prices"
+        timing.method = "GET"
+        timing.connect = 0.01
+        timing.ttfb = 0.1
+        timing.parse = 0.002
+        assert timing.total == 0.112
+        assert timing.as_dict() == {
+            "endpoint": "prices",
+            "method": "GET",
+            "dns": None,
+            "connect": 0.01,
+            "ttfb": 0.1,
+            "download": None,
+            "decode": None,
+            "parse": 0.002,
+            "total": 0.112,
+        }
+        assert repr(timing).startswith("<CallTiming GET prices connect=0.010000")
+
+    def test_record_timings(self):
+        hooked = []
+        with record_timings() as outer:
+            emit(CallTiming(), None)
+            with record_timings() as inner:
+                emit(CallTiming(), hooked.append)
+        emit(CallTiming(), None)
+        assert len(outer) == 2
+        assert len(inner) == 1
+        assert hooked == inner
+
+
+class TestTimingEndpoint:
+    def test_timing(self, mock_server, mock_api_client: APIClient):
+        assert isinstance(
+            mock_api_client.session.get_adapter("http://"), TimedHTTPAdapter
+        )
+        hooked = []
+        mock_api_client.timing_hook = hooked.append
+        mock_api_client.uri = mock_server.uri
+        mock_api_client.process_login("token")
+        with record_timings() as timings:
+            for _ in range(2):
+                assert isinstance(
+                    mock_api_client.account.get_balance(), resources.Balance
+                )
+        assert hooked == timings
+        first, second = timings
+        assert first.endpoint == "get_balance"
+        assert first.method == "GET"
+        assert first.connect > 0
+        # reused connection
+        assert second.connect is None
+        for timing in timings:
+            assert timing.dns is None
+            assert timing.ttfb > 0
+            assert timing.download >= 0
+            assert timing.decode > 0
+            assert timing.parse > 0
+
+    def test_timing_send_overridden(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            return_value=mock_prices_response[0],
+        )
+        with record_timings() as timings:
+            mock_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        (timing,) = timings
+        assert timing.endpoint == "prices"
+        assert timing.ttfb is None
+        assert timing.parse > 0
+
+    def test_timing_async(self, mock_server, mock_async_api_client: AsyncAPIClient):
+        mock_async_api_client.uri = mock_server.uri
+        mock_async_api_client.process_login("token")
+
+        async def run():
+            async with mock_async_api_client:
+                with record_timings() as timings:
+                    for _ in range(2):
+                        await mock_async_api_client.account.get_balance()
+                return timings
+
+        first, second = asyncio.run(run())
+        assert first.endpoint == "get_balance"
+        assert first.connect > 0
+        assert second.connect is None
+        for timing in (first, second):
+            assert timing.ttfb > 0
+            assert timing.download >= 0
+            assert timing.decode > 0
+            assert timing.parse > 0
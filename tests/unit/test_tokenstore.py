@@ -0,0 +1,29 @@
+import os
+import stat
+from betconnect.tokenstore import FileTokenStore
+
+
+class TestFileTokenStore:
+    def test_save_load_clear(self, tmp_path):
+        store = FileTokenStore(str(tmp_path / "sessions"))
+        assert store.load("test@uri") is None
+
+        store.save("test@uri", {"token": "abc"})
+        assert store.load("test@uri") == {"token": "abc"}
+        assert store.load("other@uri") is None
+        assert "test" not in os.path.basename(store.path("test@uri"))
+        assert stat.S_IMODE(os.stat(store.path("test@uri")).st_mode) == 0o600
+
+        store.save("test@uri", {"token": "def"})
+        assert store.load("test@uri") == {"token": "def"}
+        assert os.listdir(store.directory) == [os.path.basename(store.path("test@uri"))]
+
+        store.clear("test@uri")
+        assert store.load("test@uri") is None
+        store.clear("test@uri")
+
+    def test_load_corrupt(self, tmp_path):
+        store = FileTokenStore(str(tmp_path))
+        with open(store.path("test@uri"), "w") as f:
+            f.write("{")
+        assert store.load("test@uri") is None
@@ -0,0 +1,220 @@
+import asyncio
+from typing import Tuple, Dict, Any
+import pytest
+import requests
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind, StatusCode
+from pytest_mock import MockerFixture
+from requests import Response
+from betconnect import exceptions, tracing
+from betconnect.endpoints import Betting, AsyncBetting
+from betconnect.endpoints.asyncbaseendpoint import AsyncResponse
+from betconnect.retry import RetryPolicy
+from tests.unit.test_retry import error_response
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter: InMemorySpanExporter):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("betconnect")
+
+
+def test_uri_template():
+    assert (
+        tracing.uri_template("api/v2", "api/v2/active_sports") == "api/v2/active_sports"
+    )
+    assert (
+        tracing.uri_template("api/v2", "api/v2/selections_for_market/1/2/False")
+        == "api/v2/selections_for_market/{}/{}/{}"
+    )
+    assert (
+        tracing.uri_template("api/v2", "api/v2/active_fixtures/14/")
+        == "api/v2/active_fixtures/{}/{}"
+    )
+
+
+class TestTracing:
+    def test_span(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+        tracer,
+        exporter: InMemorySpanExporter,
+    ):
+        mock_betting_endpoint.client.tracer = tracer
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            return_value=mock_prices_response[0],
+        )
+        mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        span, parse = exporter.get_finished_spans()
+        assert span.name == "GET api/v2/prices/{}/{}/{}"
+        assert span.kind == SpanKind.CLIENT
+        assert span.attributes[tracing.URL_TEMPLATE] == "api/v2/prices/{}/{}/{}"
+        assert span.attributes[tracing.ENDPOINT] == "prices"
+        assert span.attributes[tracing.METHOD] == "GET"
+        assert span.attributes[tracing.STATUS_CODE] == 200
+        assert span.attributes[tracing.BODY_SIZE] == len(
+            mock_prices_response[0].content
+        )
+        assert span.attributes[tracing.RETRIES] == 0
+        assert span.status.status_code == StatusCode.UNSET
+        assert parse.name == "parse prices"
+        assert parse.kind == SpanKind.INTERNAL
+        assert parse.attributes[tracing.ENDPOINT] == "prices"
+        assert parse.start_time >= span.end_time
+        assert not hasattr(mock_prices_response[0], "span")
+
+    def test_parse_error(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+        tracer,
+        exporter: InMemorySpanExporter,
+    ):
+        mock_betting_endpoint.client.tracer = tracer
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            return_value=mock_prices_response[0],
+        )
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._process_response",
+            side_effect=ValueError("invalid"),
+        )
+        with pytest.raises(ValueError):
+            mock_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        span, parse = exporter.get_finished_spans()
+        assert span.status.status_code == StatusCode.UNSET
+        assert parse.status.status_code == StatusCode.ERROR
+        assert [event.name for event in parse.events] == ["exception"]
+
+    def test_retries_and_errors(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        tracer,
+        exporter: InMemorySpanExporter,
+    ):
+        mock_betting_endpoint.client.tracer = tracer
+        mock_betting_endpoint.client.retry_policy = RetryPolicy(backoff=0)
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=[requests.ConnectionError(), error_response(400)],
+        )
+        mock_betting_endpoint.selections_for_market(fixture_id=1, market_type_id=2)
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            side_effect=requests.ConnectTimeout(),
+        )
+        mock_betting_endpoint.client.retry_policy = None
+        with pytest.raises(exceptions.RequestTimeout):
+            mock_betting_endpoint.selections_for_market(fixture_id=1, market_type_id=2)
+
+        rejected, timed_out = (
+            span
+            for span in exporter.get_finished_spans()
+            if span.kind == SpanKind.CLIENT
+        )
+        assert rejected.attributes[tracing.RETRIES] == 1
+        assert [event.name for event in rejected.events] == ["retry"]
+        assert rejected.attributes[tracing.STATUS_CODE] == 400
+        assert rejected.status.status_code == StatusCode.ERROR
+        assert timed_out.attributes[tracing.ERROR_TYPE] == "RequestTimeout"
+        assert timed_out.status.status_code == StatusCode.ERROR
+        assert tracing.STATUS_CODE not in timed_out.attributes
+
+    def test_login_child_span(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_login_response: Tuple[Response, Dict[str, Any], float],
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+        mock_account_preferences_resource,
+        mock_balance_resource,
+        tracer,
+        exporter: InMemorySpanExporter,
+    ):
+        client = mock_betting_endpoint.client
+        client.tracer = tracer
+        client.set_account_preferences(mock_account_preferences_resource)
+        client.set_account_balance(mock_balance_resource)
+        mocker.patch(
+            "requests.sessions.Session.post", return_value=mock_login_response[0]
+        )
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            return_value=mock_prices_response[0],
+        )
+        assert client.logged_in is False
+        response, _, _ = mock_betting_endpoint._send_request(
+            "GET", "api/v2/get_balance"
+        )
+
+        # ended without the response being processed
+        login, span = exporter.get_finished_spans()
+        assert login.name == "POST api/v2/login"
+        assert login.parent.span_id == span.context.span_id
+        assert login.attributes[tracing.STATUS_CODE] == 200
+        assert span.name == "GET api/v2/get_balance"
+        assert span.attributes[tracing.STATUS_CODE] == response.status_code
+
+    def test_async(
+        self,
+        mocker: MockerFixture,
+        mock_async_betting_endpoint: AsyncBetting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+        tracer,
+        exporter: InMemorySpanExporter,
+    ):
+        pkl = mock_prices_response[0]
+        mock_async_betting_endpoint.client.tracer = tracer
+        mocker.patch(
+            "betconnect.endpoints.asyncbaseendpoint.AsyncBaseEndpoint._send",
+            return_value=AsyncResponse(
+                status_code=pkl.status_code,
+                url=pkl.url,
+                headers=pkl.headers,
+                content=pkl.content,
+            ),
+        )
+        asyncio.run(
+            mock_async_betting_endpoint.prices(
+                fixture_id=8172709, market_type_id=6, competitor="1"
+            )
+        )
+        span, parse = exporter.get_finished_spans()
+        assert span.name == "GET api/v2/prices/{}/{}/{}"
+        assert span.attributes[tracing.STATUS_CODE] == 200
+        assert parse.name == "parse prices"
+
+    def test_no_tracer(
+        self,
+        mocker: MockerFixture,
+        mock_betting_endpoint: Betting,
+        mock_prices_response: Tuple[Response, Dict[str, Any], float],
+    ):
+        start_span = mocker.patch("betconnect.tracing.start_span")
+        parse_span = mocker.patch("betconnect.tracing.parse_span")
+        mocker.patch(
+            "betconnect.endpoints.baseendpoint.BaseEndpoint._send",
+            return_value=mock_prices_response[0],
+        )
+        mock_betting_endpoint.prices(
+            fixture_id=8172709, market_type_id=6, competitor="1"
+        )
+        start_span.assert_not_called()
+        parse_span.assert_not_called()
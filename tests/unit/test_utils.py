@@ -1,4 +1,7 @@
+import json
+import orjson
 from betconnect import utils
+from betconnect.enums import JSONDecoder
 import pytest
 from uuid import UUID
 from betconnect import resources
@@ -24,3 +27,20 @@ class TestUtils:
         )
         with pytest.raises(Exception):
             utils.parse_bet_request_id("c9bf9e57-1685-4c89-bafb-ff5a")
+
+    def test_get_json_loads(self, mocker):
+        content = b'{"data": [{"name": "\\u00a3", "price": 1.5}]}'
+        assert utils.get_json_loads(JSONDecoder.STDLIB) is json.loads
+        assert utils.get_json_loads("orjson") is orjson.loads
+        for json_decoder in JSONDecoder:
+            assert utils.get_json_loads(json_decoder)(content) == json.loads(content)
+
+        mocker.patch("betconnect.utils.msgspec", None)
+        assert utils.get_json_loads(JSONDecoder.MSGSPEC) is json.loads
+
+        def loads(b):
+            return {}
+
+        assert utils.get_json_loads(loads) is loads
+        with pytest.raises(ValueError):
+            utils.get_json_loads("simplejson")
@@ -1,6 +1,7 @@
 import json
 import pickle
 import os
+from betconnect.mockserver.server import RESPONSES_DIR
 
 # noinspection SpellCheckingInspection
 basepath = os.path.dirname(__file__)
@@ -10,6 +11,11 @@ def build_path(path):
     return basepath + "/" + path
 
 
+def build_response_path(path):
+    # responses served by the mock server, package data
+    return os.path.join(RESPONSES_DIR, path)
+
+
 def save_json_to_file(file_location, data):
     with open(file_location, "w") as f:
         json.dump(data, f)